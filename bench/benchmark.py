@@ -0,0 +1,196 @@
+"""
+재생 서버를 상대로 크롤러를 실행해 처리량/지연/메모리를 측정
+
+    python bench/benchmark.py --latency-ms 80 --jitter-ms 40 --error-rate 0.02 --workers 4 --rps 20
+
+모드
+- mu: missyusa_crawler.crawl_posts (검색 결과 + 본문 HTTP)
+- gu-http: gu_crawler.crawl_keyword를 HTTP 목록(ListingPager) + HTTP 본문(fetch_posts_http)으로 실행 (브라우저 없음)
+각 모드는 별도 프로세스에서 빈 저장소로 실행하므로 최대 RSS가 서로 섞이지 않는다.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.join(ROOT, 'bench')
+for path in (ROOT, os.path.join(ROOT, 'missyusa_crawler'), os.path.join(ROOT, 'naver_cafe_crawler'), BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+MODES = ('mu', 'gu-http')
+
+
+def replay_url(url: str, base_url: str) -> str:
+    """https://host/... -> http://127.0.0.1:PORT/host/... (fixture_key 형식)"""
+    return url.replace('https://', base_url + '/', 1)
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def rate_config(args) -> dict:
+    """--rps에서 시작해 --max-rps까지 올라가는 속도 제어 설정 (--max-rps가 없으면 고정 속도)"""
+    return {
+        'requests_per_second': args.rps,
+        'max_requests_per_second': args.max_rps or args.rps,
+        'burst': args.workers,
+    }
+
+
+def run_mu(args, keywords, work_dir):
+    from common.fetch_engine import FetchEngine
+    from common.rate_control import rate_controller_from_config
+    from mu_crawler import HEADERS, SERVER_ERROR_MARKER, crawl_posts
+    from seed_fixtures import MU_SEARCH_URL
+
+    config = {
+        'missyusa': {
+            'search_url': replay_url(MU_SEARCH_URL, args.base_url),
+            'base_url': replay_url('https://www.missyusa.com', args.base_url),
+            'keywords': keywords['missyusa'],
+            'data_path': os.path.join(work_dir, 'mu_posts.csv'),
+            'export_csv': False,
+        },
+        'watermark_path': os.path.join(work_dir, 'watermarks.json'),
+    }
+    engine = FetchEngine(max_workers=args.workers, headers=HEADERS, throttle_markers=(SERVER_ERROR_MARKER,),
+                         rate_controller_factory=lambda: rate_controller_from_config(rate_config(args)))
+    crawl_posts(config, engine)
+    return [engine]
+
+
+def run_gu_http(args, keywords, work_dir):
+    import requests
+    from common.rate_control import rate_controller_from_config
+    from gu_crawler import CrawlCycle, crawl_keyword, fetch_posts_http, open_post_store
+    from http_fetcher import DEFAULT_ARTICLE_URL, create_http_engine, create_listing_engine
+    from listing import DEFAULT_SEARCH_URL, ListingPager
+    from seed_fixtures import GU_DISPLAY
+
+    config = {
+        'naver': {
+            'search_url': replay_url(DEFAULT_SEARCH_URL, args.base_url),
+            'article_url': replay_url(DEFAULT_ARTICLE_URL, args.base_url),
+            'user_display': GU_DISPLAY,
+            'data_path': os.path.join(work_dir, 'gu_posts.csv'),
+            'max_workers': args.workers,
+            **rate_config(args),
+        },
+        'keywords': keywords['gotousa'],
+        'watermark_path': os.path.join(work_dir, 'watermarks.json'),
+    }
+    session = requests.Session()
+    store = open_post_store(config)
+    # SiteRunner처럼 목록/게시글 요청이 속도 제어기 하나를 공유
+    rate = rate_controller_from_config(config['naver'])
+    http_engine = create_http_engine(config, session, rate=rate)
+    listing_engine = create_listing_engine(config, session, rate=rate)
+    pager = ListingPager(config, None, listing_engine)
+    cycle = CrawlCycle(config, store, pager, lambda post_links: fetch_posts_http(http_engine, config, post_links))
+    try:
+        for keyword in config['keywords']:
+            crawl_keyword(cycle, keyword)
+    finally:
+        http_engine.close()
+        listing_engine.close()
+        cycle.finish()
+        store.close()
+    return [listing_engine, http_engine]
+
+
+def run_mode(args):
+    """자식 프로세스: 모드 하나를 실행하고 결과를 JSON 한 줄로 출력"""
+    with open(os.path.join(args.fixtures, 'keywords.json'), 'r', encoding='utf-8') as f:
+        keywords = json.load(f)
+    runner = {'mu': run_mu, 'gu-http': run_gu_http}[args.run_mode]
+    log = io.StringIO()
+    with tempfile.TemporaryDirectory() as work_dir:
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(log):
+            engines = runner(args, keywords, work_dir)
+        elapsed = time.perf_counter() - started
+    latencies = [latency for engine in engines for latency in engine.latencies]
+    result = {
+        'mode': args.run_mode,
+        'elapsed': elapsed,
+        'requests': sum(engine.request_count for engine in engines),
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'mean_ms': statistics.mean(latencies) * 1000 if latencies else 0.0,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'errors': log.getvalue().count('[ERROR]') + log.getvalue().count('[WARNING]'),
+    }
+    print(json.dumps(result))
+
+
+def run_benchmark(args):
+    from common.fixtures import FixtureStore
+    from replay_server import ReplayServer
+    from seed_fixtures import seed
+
+    if not os.path.exists(os.path.join(args.fixtures, 'index.json')):
+        seed(args.fixtures)
+    server = ReplayServer(FixtureStore(args.fixtures), port=args.port, latency_ms=args.latency_ms,
+                          jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=args.seed).start()
+    print(f"[INFO] 재생 서버: {server.base_url} (지연 {args.latency_ms}±{args.jitter_ms}ms, 오류율 {args.error_rate})")
+    print(f"{'mode':<8} {'pages':>6} {'posts':>6} {'pages/s':>8} {'posts/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'errors':>6} {'RSS MB':>7}")
+    try:
+        for mode in args.modes:
+            before = server.snapshot()
+            cmd = [sys.executable, os.path.abspath(__file__), '--run-mode', mode, '--base-url', server.base_url,
+                   '--fixtures', args.fixtures, '--workers', str(args.workers), '--rps', str(args.rps)]
+            if args.max_rps:
+                cmd += ['--max-rps', str(args.max_rps)]
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+            if proc.returncode != 0:
+                print(f"[ERROR] {mode} 실행 실패:\n{proc.stderr}")
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            after = server.snapshot()
+            pages = after['listing'] - before['listing']
+            posts = after['article'] - before['article']
+            errors = after['error'] - before['error']
+            elapsed = result['elapsed']
+            print(f"{mode:<8} {pages:>6} {posts:>6} {pages / elapsed:>8.2f} {posts / elapsed:>8.2f} "
+                  f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {errors:>6} {result['peak_rss_mb']:>7.1f}")
+    finally:
+        server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='재생 서버 기반 크롤러 벤치마크')
+    parser.add_argument('--fixtures', default=os.path.join(BENCH_DIR, 'fixtures'))
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rps', type=float, default=20.0)
+    parser.add_argument('--max-rps', type=float, default=None)
+    parser.add_argument('--run-mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run_mode:
+        run_mode(args)
+    else:
+        run_benchmark(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+키워드 분류 마이크로 벤치마크
+
+    python bench/keyword_benchmark.py --repeat 5
+
+data/의 게시글 CSV에서 process_csv_file과 같은 방식(제목 + 본문)으로 텍스트를 만들고
+기본 type/topic/method 패턴으로 분류하여 게시글당 시간을 비교한다.
+- current: 이전 방식 (카테고리/패턴마다 pattern.lower() in text, 기준마다 한 번씩 총 세 번 훑음)
+- aho-corasick: KeywordMatcher (pyahocorasick 자동자 + "re:" 정규식 패턴마다 검색)
+- fallback: KeywordMatcher (pyahocorasick가 없을 때, 키워드마다 부분 문자열 검사)
+결과가 current와 다른 게시글 수도 함께 출력한다 (current는 r"re:\\?$" 같은 정규식 패턴을 찾지 못함).
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, 'data')
+if DATA_DIR not in sys.path:
+    sys.path.insert(0, DATA_DIR)
+
+import keyword_matcher
+from classify_posts import DEFAULT_METHOD_PATTERNS, DEFAULT_TOPIC_PATTERNS, DEFAULT_TYPE_PATTERNS
+from keyword_matcher import KeywordMatcher
+
+DIMENSIONS = {
+    'type': (DEFAULT_TYPE_PATTERNS, 'discussion', False),
+    'scam_topic': (DEFAULT_TOPIC_PATTERNS, 'other', False),
+    'scam_method': (DEFAULT_METHOD_PATTERNS, '', True),
+}
+
+
+def current_classify_with_keywords(text, patterns_dict, default='other', multi=False):
+    if not text or pd.isna(text):
+        return default, 0, ''
+    text = str(text).lower()
+    matched = []
+    matched_keywords = []
+    for category, patterns in patterns_dict.items():
+        for pattern in patterns:
+            if pattern.lower() in text:
+                matched.append(category)
+                matched_keywords.append(pattern)
+                if not multi:
+                    return category, 1, pattern
+    if multi and matched:
+        return '+'.join(sorted(set(matched))), 1, '+'.join(sorted(set(matched_keywords)))
+    return default, 0, ''
+
+
+def current_classify(text):
+    return {name: current_classify_with_keywords(text, patterns_dict, default, multi)
+            for name, (patterns_dict, default, multi) in DIMENSIONS.items()}
+
+
+def read_csv(path):
+    for encoding in ('utf-8-sig', 'euc-kr', 'cp949'):
+        try:
+            return pd.read_csv(path, encoding=encoding, dtype=str).fillna('')
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"{path} 인코딩을 알 수 없습니다.")
+
+
+def load_texts(pattern):
+    texts = []
+    for path in sorted(glob.glob(pattern)):
+        df = read_csv(path)
+        if 'title' not in df.columns or 'content' not in df.columns:
+            continue
+        texts.extend((df['title'] + ' ' + df['content']).str.strip().tolist())
+        print(f"{os.path.relpath(path, ROOT)}: {len(df)}개")
+    return texts
+
+
+def measure(classify, texts, repeat):
+    timings = []
+    results = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [classify(text) for text in texts]
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 분류 벤치마크')
+    parser.add_argument('--corpus', default=os.path.join(DATA_DIR, '*_posts.csv'), help='게시글 CSV glob')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    texts = load_texts(args.corpus)
+    if not texts:
+        print(f"[ERROR] {args.corpus}에 해당하는 게시글 CSV가 없습니다.")
+        return
+
+    variants = [('current', current_classify)]
+    if keyword_matcher.ahocorasick is not None:
+        variants.append(('aho-corasick', KeywordMatcher(DIMENSIONS).classify))
+    else:
+        print('[INFO] pyahocorasick가 없어 aho-corasick 항목은 건너뜁니다.')
+    saved, keyword_matcher.ahocorasick = keyword_matcher.ahocorasick, None
+    try:
+        variants.append(('fallback', KeywordMatcher(DIMENSIONS).classify))
+    finally:
+        keyword_matcher.ahocorasick = saved
+
+    baseline = None
+    print(f"\n게시글 {len(texts)}개, 평균 {sum(map(len, texts)) / len(texts):.0f}자, 중앙값 {args.repeat}회")
+    print(f"{'방식':<14}{'ms/post':>10}{'posts/sec':>12}{'current와 다름':>16}")
+    for name, classify in variants:
+        elapsed, results = measure(classify, texts, args.repeat)
+        baseline = baseline or results
+        diff = sum(1 for a, b in zip(baseline, results) if a != b)
+        print(f"{name:<14}{elapsed / len(texts) * 1000:>10.3f}{len(texts) / elapsed:>12.0f}{diff:>16}")
+
+
+if __name__ == '__main__':
+    main()
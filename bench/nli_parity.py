@@ -0,0 +1,121 @@
+"""
+zero-shot 추론 백엔드 비교 (라벨 일치율 / 속도 / 메모리)
+
+    python data/zero_shot.py --quantize           # ONNX 모델을 미리 만들어 두면 측정에 내보내기 시간이 섞이지 않음
+    python bench/nli_parity.py --limit 64 --backends onnx-int8 torch-int8 --intra-op-threads 4
+
+data/*_classified.csv의 게시글(process_csv_file과 같은 텍스트)을 백엔드마다 별도 프로세스에서
+type/scam_topic/scam_method 세 기준 모두 분류하고, fp32 기준(torch 백엔드, 기존 pipeline과 같은 모델)과
+기준별 라벨 일치율, 게시글당 지연, 모델 로딩 후 최대 RSS를 비교한다.
+"""
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, 'data')
+if DATA_DIR not in sys.path:
+    sys.path.insert(0, DATA_DIR)
+
+from classify_posts import DIMENSIONS, TextClassifier, texts_to_classify
+from zero_shot import BACKENDS
+
+REFERENCE = 'torch'
+
+
+def load_texts(pattern, limit):
+    texts = []
+    for path in sorted(glob.glob(pattern)):
+        df = pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        if 'id' in df.columns:
+            # 이전 방식(행마다 이어 쓰기)으로 저장된 파일에는 중간에 헤더 행이 섞여 있음
+            df = df[df['id'] != 'id']
+        texts.extend(text for text in texts_to_classify(df).tolist() if text)
+    return texts[:limit]
+
+
+def run_backend(args):
+    """자식 프로세스: 백엔드 하나로 분류하고 결과를 JSON 한 줄로 출력"""
+    texts = load_texts(args.corpus, args.limit)
+    classifier = TextClassifier()
+    classifier.backend = args.run_backend
+    classifier.device = args.device
+    classifier.batch_size = args.batch_size
+    classifier.intra_op_threads = args.intra_op_threads
+    classifier.inter_op_threads = args.inter_op_threads
+
+    started = time.perf_counter()
+    classifier.load_local_classifier()
+    load_s = time.perf_counter() - started
+    started = time.perf_counter()
+    results = classifier.classify_many_with_api(texts)
+    elapsed = time.perf_counter() - started
+    print(json.dumps({
+        'backend': args.run_backend,
+        'device': classifier.local_classifier.device,
+        'posts': len(texts),
+        'load_s': load_s,
+        'elapsed': elapsed,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'labels': [[result[column] for column in DIMENSIONS] if result else None for result in results],
+    }, ensure_ascii=False))
+
+
+def run_parity(args):
+    backends = [REFERENCE] + [backend for backend in args.backends if backend != REFERENCE]
+    results = {}
+    for backend in backends:
+        cmd = [sys.executable, os.path.abspath(__file__), '--run-backend', backend, '--corpus', args.corpus,
+               '--limit', str(args.limit), '--batch-size', str(args.batch_size), '--device', args.device,
+               '--intra-op-threads', str(args.intra_op_threads), '--inter-op-threads', str(args.inter_op_threads)]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"[ERROR] {backend} 실행 실패:\n{proc.stderr}")
+            continue
+        results[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+    if REFERENCE not in results:
+        print(f"[ERROR] 기준({REFERENCE}) 결과가 없어 일치율을 계산할 수 없습니다.")
+        return
+
+    reference = results[REFERENCE]['labels']
+    print(f"\n게시글 {results[REFERENCE]['posts']}개, batch {args.batch_size}, "
+          f"intra-op {args.intra_op_threads or '기본'}, inter-op {args.inter_op_threads or '기본'}")
+    header = ''.join(f"{column:>13}" for column in DIMENSIONS)
+    print(f"{'backend':<11}{'device':>8}{'load s':>8}{'ms/post':>10}{'RSS MB':>9}{header}")
+    for backend, result in results.items():
+        agreement = []
+        for d in range(len(DIMENSIONS)):
+            pairs = [(a[d], b[d]) for a, b in zip(reference, result['labels']) if a and b]
+            agreement.append(sum(1 for a, b in pairs if a == b) / len(pairs) * 100 if pairs else 0.0)
+        print(f"{backend:<11}{result['device']:>8}{result['load_s']:>8.1f}"
+              f"{result['elapsed'] / max(result['posts'], 1) * 1000:>10.1f}{result['peak_rss_mb']:>9.0f}"
+              + ''.join(f"{value:>12.1f}%" for value in agreement))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='zero-shot 추론 백엔드 비교')
+    parser.add_argument('--corpus', default=os.path.join(DATA_DIR, '*_classified.csv'), help='분류된 게시글 CSV glob')
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=['torch-int8', 'onnx', 'onnx-int8'])
+    parser.add_argument('--limit', type=int, default=64, help='비교할 게시글 수')
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--device', default='auto')
+    parser.add_argument('--intra-op-threads', type=int, default=0)
+    parser.add_argument('--inter-op-threads', type=int, default=0)
+    parser.add_argument('--run-backend', choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_backend:
+        run_backend(args)
+    else:
+        run_parity(args)
+
+
+if __name__ == '__main__':
+    main()
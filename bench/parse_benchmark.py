@@ -0,0 +1,153 @@
+"""
+HTML 파서 백엔드 마이크로 벤치마크
+
+    python bench/parse_benchmark.py --repeat 5
+
+bench/fixtures의 저장된 페이지(없으면 seed_fixtures로 생성)를 종류별로 파싱하여
+페이지당 파싱 시간과 tracemalloc 최대 할당량을 비교한다.
+- current: 이전 방식 (html.parser로 전체 트리를 만들고 BeautifulSoup API로 추출)
+- html.parser / lxml / selectolax: common.html_parser 백엔드 (BeautifulSoup 백엔드는 gotousa 목록 페이지만 필요한 부분만 파싱)
+각 백엔드의 추출 결과가 current와 다른 페이지 수도 함께 출력한다.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.join(ROOT, 'bench')
+for path in (ROOT, os.path.join(ROOT, 'missyusa_crawler'), os.path.join(ROOT, 'naver_cafe_crawler'), BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from article_parser import CONTENT_SELECTORS, IMAGE_SELECTORS, NOTICE_SELECTORS, normalize_content, parse_article_html
+from common.fixtures import FixtureStore
+from common.html_parser import HtmlParser, available_backends
+from listing import parse_listing_html
+from mu_crawler import parse_listing_links, parse_post_content
+
+
+def current_mu_listing(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    links = []
+    seen = set()
+    for td in soup.find_all('td', attrs={'align': 'left'}):
+        a = td.find('a', href=True)
+        if a and 'board_read.asp' in a['href'] and a['href'] not in seen:
+            seen.add(a['href'])
+            links.append((a['href'], a.get_text(strip=True)))
+    return links
+
+
+def current_mu_article(html):
+    content_div = BeautifulSoup(html, 'html.parser').select_one('div.detail_content')
+    return content_div.get_text("\n", strip=True) if content_div else ''
+
+
+def current_gu_listing(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    return [{'href': a.get('href', ''), 'title': a.get_text(strip=True)} for a in soup.select('div.board-list a.article')]
+
+
+def current_gu_article(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    for box in soup.select(NOTICE_SELECTORS):
+        box.get_text()
+    soup.get_text()
+    content = ''
+    for selector in CONTENT_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            content = element.get_text("\n", strip=True)
+            break
+    # parse_article_html은 브라우저 경로의 innerText와 맞추기 위해 본문 공백을 정리함
+    content = normalize_content(content)
+    image_urls = []
+    for selector in IMAGE_SELECTORS:
+        for img in soup.select(selector):
+            src = img.get('src')
+            if src and src not in image_urls:
+                image_urls.append(src)
+    return content, image_urls
+
+
+# 페이지 종류: (현재 방식, 백엔드 방식, 결과 비교용 정규화)
+KINDS = {
+    'mu-listing': (current_mu_listing, parse_listing_links, lambda r: r),
+    'mu-article': (current_mu_article, parse_post_content, lambda r: r),
+    'gu-listing': (current_gu_listing, parse_listing_html, lambda r: [link['title'] for link in r]),
+    'gu-article': (current_gu_article, parse_article_html, lambda r: r),
+}
+
+
+def load_pages(fixtures_dir: str) -> dict:
+    """fixture를 페이지 종류별 HTML 문자열로 분류"""
+    if not os.path.exists(os.path.join(fixtures_dir, 'index.json')):
+        from seed_fixtures import seed
+        seed(fixtures_dir)
+    store = FixtureStore(fixtures_dir)
+    pages = {kind: [] for kind in KINDS}
+    for key in store.index:
+        status, content_type, body = store.lookup(key)
+        if status != 200:
+            continue
+        if 'json' in content_type:
+            article = json.loads(body.decode('utf-8')).get('result', {}).get('article') or {}
+            pages['gu-article'].append(article.get('contentHtml', ''))
+        elif 'missyusa' in key:
+            kind = 'mu-article' if 'board_read.asp' in key else 'mu-listing'
+            pages[kind].append(body.decode('euc-kr', errors='replace'))
+        else:
+            pages['gu-listing'].append(body.decode('cp949', errors='replace'))
+    return pages
+
+
+def measure(fn, pages: list, repeat: int) -> tuple:
+    """Returns: (페이지당 시간 중앙값 ms, 페이지당 최대 할당 평균 KB, 결과 리스트)"""
+    timings = []
+    results = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [fn(html) for html in pages]
+        timings.append((time.perf_counter() - started) / len(pages))
+
+    peaks = []
+    tracemalloc.start()
+    for html in pages:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        fn(html)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return statistics.median(timings) * 1000, statistics.mean(peaks) / 1024, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--fixtures', default=os.path.join(BENCH_DIR, 'fixtures'))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--backends', nargs='+', default=available_backends())
+    args = parser.parse_args()
+
+    pages = load_pages(args.fixtures)
+    print(f"{'page':<11} {'backend':<12} {'pages':>5} {'ms/page':>8} {'speedup':>7} {'peak KB':>8} {'diff':>4}")
+    for kind, (current_fn, backend_fn, normalize) in KINDS.items():
+        if not pages[kind]:
+            continue
+        base_ms, base_kb, base_results = measure(current_fn, pages[kind], args.repeat)
+        print(f"{kind:<11} {'current':<12} {len(pages[kind]):>5} {base_ms:>8.2f} {1:>7.2f} {base_kb:>8.0f} {'-':>4}")
+        expected = [normalize(r) for r in base_results]
+        for backend in args.backends:
+            html_parser = HtmlParser(backend)
+            ms, kb, results = measure(lambda html: backend_fn(html, html_parser), pages[kind], args.repeat)
+            diff = sum(normalize(r) != e for r, e in zip(results, expected))
+            print(f"{kind:<11} {backend:<12} {len(pages[kind]):>5} {ms:>8.2f} {base_ms / ms:>7.2f} {kb:>8.0f} {diff:>4}")
+
+
+if __name__ == '__main__':
+    main()
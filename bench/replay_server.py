@@ -0,0 +1,127 @@
+"""
+기록된 응답(FixtureStore)을 재생하는 로컬 HTTP 서버
+
+    python bench/replay_server.py --fixtures bench/fixtures --port 8765 --latency-ms 80 --error-rate 0.05
+
+크롤러 설정의 URL을 http://127.0.0.1:8765/<원래 호스트>/... 로 바꾸면 실제 사이트 대신 이 서버에 요청한다.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.fixtures import FixtureStore
+
+# missyusa(ASP)의 서버 오류 페이지. mu_crawler는 이 문구로 오류 페이지를 감지함
+SERVER_ERROR_PAGE = (
+    "<html><head><title>Server Error</title></head><body>"
+    "<h2>An error occurred on the server when processing the URL. "
+    "Please contact the system administrator.</h2></body></html>"
+)
+
+
+class ReplayServer:
+    """
+    latency_ms / jitter_ms: 응답마다 추가하는 지연 (ms)
+    error_rate: 이 확률로 기록된 응답 대신 서버 오류 페이지(500)를 반환
+    """
+    def __init__(self, store: FixtureStore, host: str = '127.0.0.1', port: int = 0,
+                 latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0, seed: int = None):
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {'listing': 0, 'article': 0, 'error': 0, 'missing': 0}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name: str):
+        with self.lock:
+            self.counts[name] += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return dict(self.counts)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with server.lock:
+                    delay = server.latency_ms + server.random.uniform(0, server.jitter_ms)
+                    inject_error = server.random.random() < server.error_rate
+                time.sleep(delay / 1000)
+
+                if inject_error:
+                    server._count('error')
+                    self._send(500, 'text/html', SERVER_ERROR_PAGE.encode('ascii'))
+                    return
+                fixture = server.store.lookup(self.path)
+                if fixture is None:
+                    server._count('missing')
+                    self._send(404, 'text/plain', b'fixture not found')
+                    return
+                server._count('article' if is_article_path(self.path) else 'listing')
+                self._send(*fixture)
+
+            def _send(self, status, content_type, body):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def is_article_path(path: str) -> bool:
+    return 'board_read.asp' in path or '/articles/' in path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기록된 크롤링 응답 재생 서버')
+    parser.add_argument('--fixtures', default='bench/fixtures')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    server = ReplayServer(store, args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate)
+    print(f"[INFO] {len(store)}개 응답 재생 중: {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
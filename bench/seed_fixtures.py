@@ -0,0 +1,117 @@
+"""
+저장된 데이터로 재생용 fixture 생성
+
+    python bench/seed_fixtures.py --out bench/fixtures
+
+- missyusa: data/mu_posts.csv의 게시글을 키워드별 검색 결과 페이지(페이지당 20개 + 빈 마지막 페이지)와
+  게시글 페이지로 재구성 (euc-kr)
+- gotousa: cafe_main_iframe_debug.html을 '스캠' 검색 결과 1페이지로, data/gu_posts.csv의 본문을
+  게시글 API(JSON) 응답으로 사용
+실제 응답을 기록하려면 config.yaml에 record_fixtures: <디렉토리> 를 지정하고 크롤러를 실행하면 된다.
+"""
+import argparse
+import html
+import json
+import os
+import re
+import sys
+import urllib.parse
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'naver_cafe_crawler'))
+from common.fetch_queue import split_keywords
+from common.fixtures import FixtureStore, fixture_key
+from http_fetcher import DEFAULT_ARTICLE_URL
+from listing import DEFAULT_SEARCH_URL, parse_listing_html
+
+MU_SEARCH_URL = ("https://www.missyusa.com/mainpage/boards/board_list.asp"
+                 "?id=talk1&search_type=subject&search_word={keyword}&page={page}")
+MU_PAGE_SIZE = 20
+GU_KEYWORD = '스캠'
+GU_DISPLAY = 50
+GU_CLUBID = '10854519'
+
+
+def mu_listing_page(posts: list) -> bytes:
+    rows = ''.join(
+        f"<tr><td align='left'><a href='{html.escape(urllib.parse.urlsplit(p['url'])._replace(scheme='', netloc='').geturl())}'>"
+        f"{html.escape(p['title'])}</a></td></tr>"
+        for p in posts
+    )
+    page = f"<html><body><table>{rows}</table></body></html>"
+    return page.encode('euc-kr', errors='ignore')
+
+
+def mu_article_page(post: dict) -> bytes:
+    content = html.escape(post['content']).replace('\n', '<br>')
+    page = f"<html><body><div class='detail_content'>{content}</div></body></html>"
+    return page.encode('euc-kr', errors='ignore')
+
+
+def seed_missyusa(store: FixtureStore, csv_path: str) -> list:
+    df = pd.read_csv(csv_path, encoding='euc-kr', dtype=str).fillna('')
+    by_keyword = {}
+    for post in df.to_dict('records'):
+        keyword = (split_keywords(post['keyword']) or [''])[0]
+        by_keyword.setdefault(keyword, []).append(post)
+        store.add(fixture_key(post['url']), mu_article_page(post))
+
+    for keyword, posts in by_keyword.items():
+        encoded = urllib.parse.quote(keyword, encoding='euc-kr')
+        pages = [posts[i:i + MU_PAGE_SIZE] for i in range(0, len(posts), MU_PAGE_SIZE)] + [[]]
+        for page, page_posts in enumerate(pages, start=1):
+            url = MU_SEARCH_URL.format(keyword=encoded, page=page)
+            store.add(fixture_key(url), mu_listing_page(page_posts))
+    print(f"[INFO] missyusa: 키워드 {len(by_keyword)}개, 게시글 {len(df)}개")
+    return list(by_keyword)
+
+
+def seed_gotousa(store: FixtureStore, listing_html_path: str, csv_path: str) -> list:
+    with open(listing_html_path, 'r', encoding='utf-8', errors='replace') as f:
+        listing_html = f.read()
+    encoded = urllib.parse.quote(GU_KEYWORD, encoding='euc-kr')
+    for page, body in ((1, listing_html), (2, "<html><body><div class='board-list'></div></body></html>")):
+        url = DEFAULT_SEARCH_URL.format(keyword=encoded, page=page, display=GU_DISPLAY)
+        store.add(fixture_key(url), body.encode('cp949', errors='ignore'))
+
+    df = pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str).fillna('')
+    contents = dict(zip(df['id'], df['content']))
+    links = parse_listing_html(listing_html)
+    for link in links:
+        articleid = re.search(r'articleid=(\d+)', link['href']).group(1)
+        content = contents.get(articleid, link['title'])
+        paragraphs = ''.join(f"<p>{html.escape(line)}</p>" for line in content.split('\n'))
+        body = {'result': {'article': {'contentHtml': f"<div class='se-main-container'>{paragraphs}</div>"}}}
+        url = DEFAULT_ARTICLE_URL.format(clubid=GU_CLUBID, articleid=articleid)
+        store.add(fixture_key(url), json.dumps(body, ensure_ascii=False).encode('utf-8'),
+                  content_type='application/json;charset=UTF-8')
+    print(f"[INFO] gotousa: 게시글 {len(links)}개")
+    return [GU_KEYWORD]
+
+
+def seed(out_dir: str):
+    store = FixtureStore(out_dir)
+    keywords = {
+        'missyusa': seed_missyusa(store, os.path.join(ROOT, 'data', 'mu_posts.csv')),
+        'gotousa': seed_gotousa(store, os.path.join(ROOT, 'cafe_main_iframe_debug.html'),
+                                os.path.join(ROOT, 'data', 'gu_posts.csv')),
+    }
+    store.save()
+    with open(os.path.join(out_dir, 'keywords.json'), 'w', encoding='utf-8') as f:
+        json.dump(keywords, f, ensure_ascii=False, indent=1)
+    print(f"[INFO] {len(store)}개 응답을 {out_dir}에 저장")
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='재생용 fixture 생성')
+    parser.add_argument('--out', default=os.path.join(ROOT, 'bench', 'fixtures'))
+    args = parser.parse_args()
+    seed(args.out)
+
+
+if __name__ == '__main__':
+    main()
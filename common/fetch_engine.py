@@ -0,0 +1,114 @@
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from common.rate_control import AdaptiveRateController
+
+
+class FetchEngine:
+    """
+    keep-alive 커넥션 풀을 공유하는 스레드 풀 기반 fetch 엔진
+    - 동시 요청 수는 max_workers로 제한
+    - 호스트별 AdaptiveRateController가 요청 속도를 조절
+      (rate_controller_factory가 없으면 requests_per_second로 고정된 속도, 오류가 나면 backoff)
+    - 5xx/429 응답, 타임아웃, throttle_markers가 들어 있는 응답은 오류로 보고하여 속도를 낮춤
+    """
+    def __init__(self, max_workers: int = 4, requests_per_second: float = 2.0, burst: int = 2,
+                 headers: dict = None, timeout: float = 15, session: requests.Session = None,
+                 recorder=None, rate_controller_factory=None, throttle_markers: tuple = ()):
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.timeout = timeout
+
+        # 쿠키 등이 설정된 세션을 넘겨받을 수 있음
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers + 1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.rate_controller_factory = rate_controller_factory or (
+            lambda: AdaptiveRateController(requests_per_second, burst=burst)
+        )
+        self.throttle_markers = tuple(marker.encode('utf-8') for marker in throttle_markers)
+        self.controllers = {}
+        self.controllers_lock = threading.Lock()
+        self.request_count = 0
+        self.latencies = []
+        self.started_at = time.monotonic()
+        # 응답을 fixture로 기록 (common.fixtures.FixtureStore)
+        self.recorder = recorder
+
+    def _controller(self, url: str) -> AdaptiveRateController:
+        host = urllib.parse.urlsplit(url).netloc
+        with self.controllers_lock:
+            if host not in self.controllers:
+                self.controllers[host] = self.rate_controller_factory()
+            return self.controllers[host]
+
+    def _throttled(self, resp: requests.Response) -> str:
+        """서버가 과부하/차단 상태로 응답했으면 그 이유, 아니면 빈 문자열"""
+        if resp.status_code == 429 or resp.status_code >= 500:
+            return f"HTTP {resp.status_code}"
+        for marker in self.throttle_markers:
+            if marker in resp.content:
+                return 'error page'
+        return ''
+
+    def get(self, url: str, encoding: str = None, **kwargs) -> requests.Response:
+        """속도 제한을 지키며 동기적으로 GET 요청"""
+        controller = self._controller(url)
+        controller.acquire()
+        kwargs.setdefault('timeout', self.timeout)
+        started = time.monotonic()
+        try:
+            resp = self.session.get(url, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            controller.on_error(type(e).__name__)
+            raise
+        latency = time.monotonic() - started
+        with self.controllers_lock:
+            self.request_count += 1
+            self.latencies.append(latency)
+        reason = self._throttled(resp)
+        if reason:
+            controller.on_error(reason)
+        else:
+            controller.on_success(latency)
+        if self.recorder is not None:
+            self.recorder.record(url, resp)
+        if encoding:
+            resp.encoding = encoding
+        return resp
+
+    def submit(self, fn, *args, **kwargs):
+        """fn을 워커 스레드에서 실행하고 Future 반환 (fn 안에서 self.get 사용)"""
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def mark(self) -> tuple:
+        """작업 시작 시점 (throughput(since=...)에 넘겨 그 작업의 처리량만 계산)"""
+        with self.controllers_lock:
+            return time.monotonic(), self.request_count
+
+    def throughput(self, items: int, since: tuple = None) -> str:
+        """since가 없으면 엔진을 만든 뒤 전체, 있으면 mark() 이후의 처리량"""
+        started_at, start_count = since or (self.started_at, 0)
+        elapsed = max(time.monotonic() - started_at, 1e-6)
+        with self.controllers_lock:
+            requests = self.request_count - start_count
+            rates = ', '.join(f"{host} {controller.stats()}" for host, controller in self.controllers.items())
+        return (f"{items} posts in {elapsed:.1f}s = {items / elapsed * 60:.1f} posts/min "
+                f"({requests} requests, {self.max_workers} workers; {rates})")
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.session.close()
+        if self.recorder is not None:
+            self.recorder.save()
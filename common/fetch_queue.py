@@ -0,0 +1,63 @@
+import threading
+
+
+def split_keywords(value) -> list:
+    """'스캠,사기' 형태로 저장된 keyword 값을 리스트로 변환"""
+    if value is None or value != value:  # None / NaN
+        return []
+    return [kw for kw in str(value).split(',') if kw]
+
+
+def merge_keywords(old, new) -> str:
+    """두 keyword 값을 순서를 유지한 합집합으로 병합"""
+    merged = split_keywords(old)
+    for kw in split_keywords(new):
+        if kw not in merged:
+            merged.append(kw)
+    return ','.join(merged)
+
+
+class FetchQueue:
+    """
+    사이클 전체에서 게시글 id를 키로 하는 작업 큐
+    같은 게시글이 여러 키워드로 검색되어도 본문은 한 번만 가져오고,
+    키워드는 post['keyword']에 ','로 이어 붙인다.
+    스케줄러에서는 동시에 실행되는 키워드 작업들이 큐 하나를 공유함
+    """
+    def __init__(self):
+        self.posts = {}
+        self.avoided = 0
+        self.lock = threading.Lock()
+
+    def __contains__(self, post_id):
+        return post_id in self.posts
+
+    def __len__(self):
+        return len(self.posts)
+
+    def add(self, post_id: str, keyword: str, post: dict = None) -> bool:
+        """처음 보는 게시글이면 등록하고 True, 이미 있으면 키워드만 추가하고 False"""
+        with self.lock:
+            if post_id in self.posts:
+                queued = self.posts[post_id]
+                queued['keyword'] = merge_keywords(queued['keyword'], keyword)
+                self.avoided += 1
+                return False
+            post['keyword'] = keyword
+            self.posts[post_id] = post
+            return True
+
+    def get(self, post_id: str) -> dict:
+        return self.posts[post_id]
+
+    def discard(self, post_ids):
+        """저장을 마친 게시글을 큐에서 뺌 (공유 큐가 계속 커지지 않도록)"""
+        with self.lock:
+            for post_id in post_ids:
+                self.posts.pop(post_id, None)
+
+    def clear(self, keep=None):
+        """큐를 비움. keep(post)가 True인 게시글(다른 작업이 아직 수집 중인 게시글 등)은 남김"""
+        with self.lock:
+            self.posts = {post_id: post for post_id, post in self.posts.items() if keep is not None and keep(post)}
+            self.avoided = 0
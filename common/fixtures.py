@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import threading
+import urllib.parse
+
+
+def fixture_key(url: str) -> str:
+    """
+    URL을 fixture 키로 변환: https://host/path?b=2&a=1 -> /host/path?a=1&b=2
+    재생 서버(bench/replay_server.py)는 이 키를 요청 경로로 그대로 사용하므로,
+    재생할 때는 크롤러의 URL 설정을 http://127.0.0.1:PORT/host/... 로 바꾸면 된다.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path
+    if parts.netloc:
+        path = '/' + parts.netloc + path
+    query = '&'.join(sorted(parts.query.split('&'))) if parts.query else ''
+    return path + ('?' + query if query else '')
+
+
+class FixtureStore:
+    """
+    응답 기록 저장소 (디렉토리)
+    - index.json: {키: {file, status, content_type}}
+    - index.jsonl: index.json 이후 기록한 항목 (요청마다 한 줄씩 추가, save()에서 index.json으로 합침)
+    - 본문은 키의 해시를 파일명으로 원본 바이트 그대로 저장
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = os.path.join(path, 'index.json')
+        self.log_path = os.path.join(path, 'index.jsonl')
+        self.lock = threading.Lock()
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        key, entry = json.loads(line)
+                    except ValueError:  # 기록 도중 중단되어 잘린 마지막 줄
+                        continue
+                    self.index[key] = entry
+
+    def __len__(self):
+        return len(self.index)
+
+    def add(self, key: str, body: bytes, status: int = 200, content_type: str = 'text/html'):
+        filename = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.bin'
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, filename), 'wb') as f:
+            f.write(body)
+        with self.lock:
+            self.index[key] = {'file': filename, 'status': status, 'content_type': content_type}
+
+    def record(self, url: str, resp):
+        """requests 응답을 기록 (FetchEngine의 recorder로 사용, 색인은 index.jsonl에 한 줄만 추가)"""
+        key = fixture_key(url)
+        self.add(key, resp.content, resp.status_code, resp.headers.get('Content-Type', 'text/html'))
+        with self.lock:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps([key, self.index[key]], ensure_ascii=False) + '\n')
+
+    def lookup(self, key: str):
+        """Returns: (status, content_type, body) 또는 None"""
+        entry = self.index.get(fixture_key(key))
+        if entry is None:
+            return None
+        with open(os.path.join(self.path, entry['file']), 'rb') as f:
+            return entry['status'], entry['content_type'], f.read()
+
+    def save(self):
+        """전체 색인을 index.json에 쓰고 index.jsonl은 비움"""
+        os.makedirs(self.path, exist_ok=True)
+        with self.lock:
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.index_path)
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+
+
+def open_recorder(config):
+    """config의 record_fixtures 디렉토리가 있으면 실제 응답을 기록할 FixtureStore 반환"""
+    path = config.get('record_fixtures')
+    return FixtureStore(path) if path else None
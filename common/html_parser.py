@@ -0,0 +1,84 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup의 'lxml' 트리 빌더)
+except ImportError:  # lxml이 없으면 html.parser로 대체
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:  # selectolax가 없으면 html.parser로 대체
+        SelectolaxParser = None
+
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+
+def available_backends() -> list:
+    return [name for name in BACKENDS
+            if name == 'html.parser' or (name == 'lxml' and lxml) or (name == 'selectolax' and SelectolaxParser)]
+
+
+class HtmlParser:
+    """
+    추출 함수들이 공통으로 쓰는 HTML 파서 백엔드
+    - html.parser / lxml: BeautifulSoup 트리. parse(only=...)를 주면 SoupStrainer로 해당 태그의 하위 트리만 만듦
+      (페이지가 큰 gotousa 검색 결과에서만 빨라져서 거기서만 사용, missyusa 페이지는 작아 이득이 없음)
+    - selectolax: C로 구현된 파서(lexbor/modest). 트리 생성 비용이 작아 부분 파싱 없이 전체를 파싱
+    설치되지 않은 백엔드를 고르면 경고 후 html.parser를 사용
+    """
+    def __init__(self, backend: str = 'html.parser'):
+        if backend not in BACKENDS:
+            raise ValueError(f"알 수 없는 파서 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+        if backend not in available_backends():
+            print(f"[WARNING] {backend} 패키지가 없어 html.parser를 사용합니다.")
+            backend = 'html.parser'
+        self.backend = backend
+
+    def parse(self, html: str, only: tuple = None):
+        """
+        only: (tag, attrs) — 이 조건에 맞는 태그와 그 하위만 트리로 만듦 (BeautifulSoup 백엔드)
+        Returns: 문서 객체 (select / select_one / text / attr에 넘김)
+        """
+        if self.backend == 'selectolax':
+            return SelectolaxParser(html)
+        parse_only = SoupStrainer(only[0], attrs=only[1]) if only else None
+        return BeautifulSoup(html, self.backend, parse_only=parse_only)
+
+    def select(self, node, selector: str) -> list:
+        if self.backend == 'selectolax':
+            return node.css(selector)
+        return node.select(selector)
+
+    def select_one(self, node, selector: str):
+        if self.backend == 'selectolax':
+            return node.css_first(selector)
+        return node.select_one(selector)
+
+    def text(self, node, separator: str = '', strip: bool = False) -> str:
+        if self.backend == 'selectolax':
+            # 문서 객체면 루트 노드의 텍스트
+            if isinstance(node, SelectolaxParser):
+                node = node.root
+            if node is None:
+                return ''
+            text = node.text(separator=separator, strip=strip)
+            if strip and separator and (separator * 2 in text or text.startswith(separator) or text.endswith(separator)):
+                # 공백뿐인 텍스트 노드도 빈 문자열로 이어 붙으므로, BeautifulSoup get_text(strip=True)처럼 빼고 다시 이어 붙임
+                parts = (child.text(deep=False, strip=True) for child in node.traverse(include_text=True)
+                         if child.tag == '-text')
+                text = separator.join(part for part in parts if part)
+            return text
+        return node.get_text(separator, strip=strip)
+
+    def attr(self, node, name: str):
+        if self.backend == 'selectolax':
+            return node.attributes.get(name)
+        return node.get(name)
+
+
+def parser_from_config(site_config: dict) -> HtmlParser:
+    """사이트 설정의 parser_backend (html.parser / lxml / selectolax, 기본값 html.parser)"""
+    return HtmlParser(site_config.get('parser_backend', 'html.parser'))
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Content-Type -> 저장 파일 확장자
+EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/bmp': '.bmp',
+}
+
+
+class ImageStore:
+    """
+    게시글 이미지 저장소
+    - 이미지 본문은 sha256으로 이름 붙인 파일(blobs/ab/<sha256>.jpg)에 저장하므로 같은 이미지는 한 번만 저장됨
+    - images.db (SQLite)
+      urls: 요청한 URL과 결과 (다음 실행에서는 처음 보는 URL만 요청)
+      images: sha256별 파일 경로/크기/perceptual hash
+      post_images: 사이트/게시글별 이미지 URL
+    """
+    def __init__(self, root: str):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(root, 'images.db'), check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(
+            'CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, sha256 TEXT, status INTEGER, error TEXT, fetched_at TEXT);'
+            'CREATE TABLE IF NOT EXISTS images (sha256 TEXT PRIMARY KEY, path TEXT, size INTEGER, content_type TEXT, phash TEXT);'
+            'CREATE TABLE IF NOT EXISTS post_images (site TEXT, post_id TEXT, url TEXT, PRIMARY KEY (site, post_id, url));'
+        )
+
+    def add_post_images(self, rows):
+        """rows: [(site, post_id, url), ...]"""
+        with self.lock, self.conn:
+            self.conn.executemany('INSERT OR IGNORE INTO post_images (site, post_id, url) VALUES (?, ?, ?)', rows)
+
+    def fetched_urls(self) -> set:
+        """이미 받았거나 다시 요청해도 소용없는(4xx) URL"""
+        with self.lock:
+            return {row[0] for row in self.conn.execute(
+                'SELECT url FROM urls WHERE sha256 IS NOT NULL OR (status >= 400 AND status < 500)')}
+
+    def write_blob(self, body: bytes, content_type: str) -> tuple:
+        """Returns: (sha256, path). 이미 있는 이미지는 다시 쓰지 않음"""
+        sha256 = hashlib.sha256(body).hexdigest()
+        ext = EXTENSIONS.get(content_type.split(';')[0].strip().lower(), '.bin')
+        path = os.path.join(self.blob_dir, sha256[:2], sha256 + ext)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        return sha256, path
+
+    def record(self, results):
+        """
+        results: [(url, status, error, sha256, path, size, content_type, phash), ...]
+        phash는 int 또는 None (16자리 hex로 저장)
+        """
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO urls (url, sha256, status, error, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                [(url, sha256, status, error, now) for url, status, error, sha256, *_ in results],
+            )
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO images (sha256, path, size, content_type, phash) VALUES (?, ?, ?, ?, ?)',
+                [(sha256, path, size, content_type, f"{phash:016x}" if phash is not None else None)
+                 for _, _, _, sha256, path, size, content_type, phash in results if sha256],
+            )
+
+    def missing_phash(self) -> list:
+        """perceptual hash가 없는 이미지 [(sha256, path), ...] (Pillow 없이 받은 이미지 등)"""
+        with self.lock:
+            return self.conn.execute('SELECT sha256, path FROM images WHERE phash IS NULL').fetchall()
+
+    def set_phashes(self, rows):
+        """rows: [(sha256, phash int), ...]"""
+        with self.lock, self.conn:
+            self.conn.executemany('UPDATE images SET phash = ? WHERE sha256 = ?',
+                                  [(f"{value:016x}", sha256) for sha256, value in rows])
+
+    def phashes(self) -> dict:
+        with self.lock:
+            return {sha256: int(value, 16)
+                    for sha256, value in self.conn.execute('SELECT sha256, phash FROM images WHERE phash IS NOT NULL')}
+
+    def posts_by_image(self) -> dict:
+        """{sha256: [(site, post_id, url), ...]}"""
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT u.sha256, p.site, p.post_id, p.url FROM post_images p '
+                'JOIN urls u ON u.url = p.url WHERE u.sha256 IS NOT NULL ORDER BY p.site, p.post_id'
+            ).fetchall()
+        posts = {}
+        for sha256, site, post_id, url in rows:
+            posts.setdefault(sha256, []).append((site, post_id, url))
+        return posts
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,226 @@
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+class SiteSchedule:
+    """
+    사이트 하나의 스케줄 설정
+    - concurrency: 동시에 실행할 수 있는 키워드 작업 수
+    - interval/min_interval/max_interval: 키워드 작업 간격 (초)
+    - hot_factor / cold_factor: 새 게시글이 나오면 간격에 hot_factor를, 안 나오면 cold_factor를 곱함
+    - jitter: 다음 실행 시각을 간격의 ±jitter 비율만큼 흔들어 요청이 한꺼번에 몰리지 않게 함
+    """
+    def __init__(self, interval: float, concurrency: int = 1, min_interval: float = None, max_interval: float = None,
+                 hot_factor: float = 0.5, cold_factor: float = 1.5, jitter: float = 0.1):
+        self.interval = interval
+        self.concurrency = max(1, int(concurrency))
+        self.min_interval = min_interval if min_interval is not None else interval / 4
+        self.max_interval = max_interval if max_interval is not None else interval * 4
+        self.hot_factor = hot_factor
+        self.cold_factor = cold_factor
+        self.jitter = jitter
+
+    @classmethod
+    def from_config(cls, schedule_config: dict, interval_minutes: float, max_concurrency: int = None):
+        """
+        사이트 설정의 scheduler 항목에서 생성 (간격은 분 단위)
+        max_concurrency: 실행기가 허용하는 최대 동시 작업 수 (브라우저를 공유하는 경우 1)
+        """
+        interval = schedule_config.get('interval_minutes', interval_minutes) * 60
+        concurrency = schedule_config.get('concurrency', 2)
+        if max_concurrency is not None:
+            concurrency = min(concurrency, max_concurrency)
+        min_interval = schedule_config.get('min_interval_minutes')
+        max_interval = schedule_config.get('max_interval_minutes')
+        return cls(
+            interval=interval,
+            concurrency=concurrency,
+            min_interval=min_interval * 60 if min_interval is not None else None,
+            max_interval=max_interval * 60 if max_interval is not None else None,
+            hot_factor=schedule_config.get('hot_factor', 0.5),
+            cold_factor=schedule_config.get('cold_factor', 1.5),
+            jitter=schedule_config.get('jitter', 0.1),
+        )
+
+
+class ExportTimer:
+    """
+    스케줄러 실행기가 저장한 게시글을 CSV로 내보낼 시각을 잼
+    키워드마다 간격이 달라 (cold 키워드는 기본 간격의 4배까지) 모든 키워드가 한 번씩 돌기를 기다리지 않고,
+    저장한 게시글이 있으면 export_interval_minutes(기본값 10분)마다 한 번 내보냄
+    """
+    def __init__(self, schedule_config: dict):
+        self.interval = schedule_config.get('export_interval_minutes', 10) * 60
+        self.last_export = time.monotonic()
+
+    def due(self) -> bool:
+        """마지막으로 내보낸 뒤 간격이 지났으면 True (실행기의 lock을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        if now - self.last_export < self.interval:
+            return False
+        self.last_export = now
+        return True
+
+
+class KeywordJob:
+    """사이트/키워드 하나의 주기 작업 상태와 최근 실행 기록"""
+    def __init__(self, site: str, keyword: str, interval: float, due: float):
+        self.site = site
+        self.keyword = keyword
+        self.interval = interval
+        self.due = due
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.last_new = 0
+        self.yield_ewma = 0.0
+        self.durations = deque(maxlen=50)
+        self.lags = deque(maxlen=50)
+
+    def stats(self) -> dict:
+        durations = sorted(self.durations)
+        return {
+            'runs': self.runs,
+            'failures': self.failures,
+            'interval_minutes': round(self.interval / 60, 2),
+            'last_new_posts': self.last_new,
+            'yield_ewma': round(self.yield_ewma, 2),
+            'last_duration_s': round(self.durations[-1], 2) if self.durations else None,
+            'mean_duration_s': round(statistics.mean(durations), 2) if durations else None,
+            'max_duration_s': round(durations[-1], 2) if durations else None,
+            'last_queue_lag_s': round(self.lags[-1], 2) if self.lags else None,
+            'max_queue_lag_s': round(max(self.lags), 2) if self.lags else None,
+            'next_run_in_s': round(max(0.0, self.due - time.monotonic()), 1) if not self.running else 0,
+        }
+
+
+class KeywordScheduler:
+    """
+    여러 사이트의 키워드 작업을 한 프로세스에서 실행
+    - 사이트별 동시 작업 수(concurrency)를 넘지 않는 선에서 실행 시각이 지난 작업부터 실행
+    - 작업이 끝나면 새 게시글 수에 따라 그 키워드의 간격을 조정 (hot 키워드는 자주, cold 키워드는 드물게)
+    - queue lag: 실행 시각이 된 뒤 빈 자리가 날 때까지 기다린 시간
+    - 작업 시간/queue lag/간격은 stats_path(JSON)에 주기적으로 기록
+    runner는 name, keywords, run(keyword) -> 새 게시글 수 를 제공 (mu_crawler.SiteRunner, gu_crawler.SiteRunner)
+    """
+    def __init__(self, stats_path: str = None, stats_interval: float = 30):
+        self.stats_path = stats_path
+        self.stats_interval = stats_interval
+        self.runners = {}
+        self.schedules = {}
+        self.jobs = []
+        self.running = {}
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.executor = None
+        self.random = random.Random()
+
+    def add_site(self, runner, schedule: SiteSchedule):
+        now = time.monotonic()
+        self.runners[runner.name] = runner
+        self.schedules[runner.name] = schedule
+        self.running[runner.name] = 0
+        for keyword in runner.keywords:
+            # 첫 실행도 조금씩 흩어서 시작
+            due = now + self.random.uniform(0, schedule.jitter * schedule.min_interval)
+            self.jobs.append(KeywordJob(runner.name, keyword, schedule.interval, due))
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    def run_forever(self):
+        workers = sum(schedule.concurrency for schedule in self.schedules.values())
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        last_stats = 0.0
+        try:
+            while True:
+                with self.condition:
+                    if self.stopped:
+                        break
+                    wait = self._dispatch_due_jobs()
+                    self.condition.wait(timeout=wait)
+                if time.monotonic() - last_stats >= self.stats_interval:
+                    self.write_stats()
+                    last_stats = time.monotonic()
+        finally:
+            self.executor.shutdown(wait=True)
+            self.write_stats()
+
+    def _dispatch_due_jobs(self) -> float:
+        """실행할 수 있는 작업을 실행하고, 다음 작업까지 기다릴 시간(초)을 반환 (condition을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        next_due = now + 60
+        for job in sorted(self.jobs, key=lambda j: j.due):
+            if job.running:
+                continue
+            if job.due > now:
+                next_due = min(next_due, job.due)
+                continue
+            if self.running[job.site] >= self.schedules[job.site].concurrency:
+                continue
+            job.running = True
+            job.lags.append(now - job.due)
+            self.running[job.site] += 1
+            self.executor.submit(self._run_job, job)
+        return max(0.05, next_due - now)
+
+    def _run_job(self, job: KeywordJob):
+        schedule = self.schedules[job.site]
+        started = time.monotonic()
+        new_count = None
+        try:
+            new_count = self.runners[job.site].run(job.keyword)
+        except Exception as e:
+            print(f"[ERROR] [{job.site}/{job.keyword}] 작업 실패: {e}")
+        duration = time.monotonic() - started
+
+        with self.condition:
+            job.runs += 1
+            job.durations.append(duration)
+            if new_count is None:
+                job.failures += 1
+                interval = schedule.min_interval
+            else:
+                job.last_new = new_count
+                job.yield_ewma = 0.3 * new_count + 0.7 * job.yield_ewma
+                factor = schedule.hot_factor if new_count > 0 else schedule.cold_factor
+                job.interval = min(schedule.max_interval, max(schedule.min_interval, job.interval * factor))
+                interval = job.interval
+            interval *= 1 + self.random.uniform(-schedule.jitter, schedule.jitter)
+            job.due = time.monotonic() + interval
+            job.running = False
+            self.running[job.site] -= 1
+            self.condition.notify_all()
+        print(f"[INFO] [{job.site}/{job.keyword}] 새 게시글 {new_count or 0}개, {duration:.1f}s "
+              f"(대기 {job.lags[-1]:.1f}s), 다음 실행 {interval / 60:.1f}분 후")
+
+    def stats(self) -> dict:
+        with self.condition:
+            sites = {}
+            for job in self.jobs:
+                sites.setdefault(job.site, {})[job.keyword] = job.stats()
+            return {
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'running': dict(self.running),
+                'sites': sites,
+            }
+
+    def write_stats(self):
+        if not self.stats_path:
+            return
+        dirname = os.path.dirname(self.stats_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = self.stats_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.stats_path)
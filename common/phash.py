@@ -0,0 +1,87 @@
+import io
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 이미지는 저장만 하고 perceptual hash는 계산하지 않음
+    Image = None
+
+HASH_SIZE = 8
+IMAGE_SIZE = 32
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+
+
+DCT = _dct_matrix(IMAGE_SIZE)
+
+
+def phash(body: bytes):
+    """
+    이미지 바이트의 64비트 perceptual hash (DCT 저주파 8x8 성분이 중앙값보다 큰지)
+    재압축/리사이즈/약간의 밝기 변화에는 hash가 거의 바뀌지 않음
+    Returns: int, Pillow가 없거나 이미지를 읽을 수 없으면 None
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(body)) as img:
+            gray = img.convert('L').resize((IMAGE_SIZE, IMAGE_SIZE), Image.LANCZOS)
+            pixels = np.asarray(gray, dtype=np.float64)
+    except Exception:
+        return None
+    low = (DCT @ pixels @ DCT.T)[:HASH_SIZE, :HASH_SIZE]
+    bits = (low > np.median(low)).flatten()
+    return int(''.join('1' if bit else '0' for bit in bits), 2)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+class PhashIndex:
+    """
+    perceptual hash 근접 검색 인덱스 (multi-index hashing)
+    64비트 hash를 bands개 구간으로 나누어 구간별 dict에 넣어 둠.
+    hamming 거리가 bands-1 이하인 두 hash는 비둘기집 원리로 적어도 한 구간이 완전히 같으므로,
+    그 구간이 같은 후보만 비교하면 전체를 훑지 않고도 빠짐없이 찾을 수 있다.
+    """
+    def __init__(self, bands: int = 4, bits: int = 64):
+        self.bands = bands
+        self.band_bits = bits // bands
+        self.mask = (1 << self.band_bits) - 1
+        self.tables = [{} for _ in range(bands)]
+        self.hashes = {}
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def _band_values(self, value: int):
+        for band in range(self.bands):
+            yield band, (value >> (band * self.band_bits)) & self.mask
+
+    def add(self, key, value: int):
+        if key in self.hashes:
+            return
+        self.hashes[key] = value
+        for band, part in self._band_values(value):
+            self.tables[band].setdefault(part, []).append(key)
+
+    def query(self, value: int, max_distance: int = 3) -> list:
+        """
+        max_distance 이하인 항목 [(key, distance), ...] (가까운 순)
+        max_distance가 bands-1보다 크면 일부를 놓칠 수 있음
+        """
+        candidates = set()
+        for band, part in self._band_values(value):
+            candidates.update(self.tables[band].get(part, ()))
+        matches = []
+        for key in candidates:
+            distance = hamming(value, self.hashes[key])
+            if distance <= max_distance:
+                matches.append((key, distance))
+        return sorted(matches, key=lambda match: match[1])
@@ -0,0 +1,140 @@
+import csv
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from common.fetch_queue import merge_keywords
+
+COLUMNS = ['id', 'url', 'title', 'content', 'image_urls', 'keyword', 'crawled_at']
+
+
+def _squash(text: str) -> str:
+    return ''.join(text.split())
+
+
+def merge_post(old: dict, new: dict) -> dict:
+    """
+    기존 게시글과 새로 수집한 게시글을 병합 (기존 gu_crawler.save_posts 규칙)
+    - 기존 본문이 빈칸이고 새 본문이 있으면 새 값으로 갱신
+    - 새 본문이 더 길면 새 값으로 갱신
+    - 새 본문이 다르고 더 짧으면 기존 본문 뒤에 이어 붙임
+    길이와 포함 여부는 공백을 뺀 본문으로 비교 (공백/줄바꿈만 다른 본문은 같은 본문)
+    키워드는 항상 합집합으로 유지
+    """
+    merged = dict(old)
+    old_content = str(old.get('content') or '').strip()
+    new_content = str(new.get('content') or '').strip()
+    if (not old_content and new_content) or (old_content and new_content and len(_squash(new_content)) > len(_squash(old_content))):
+        merged.update({col: value for col, value in new.items() if col in COLUMNS})
+    elif old_content and new_content and _squash(old_content) != _squash(new_content):
+        if _squash(new_content) not in _squash(old_content):
+            merged['content'] = old_content + "\n" + new_content
+    merged['keyword'] = merge_keywords(old.get('keyword'), new.get('keyword'))
+    return merged
+
+
+class PostStore:
+    """
+    게시글 저장소 (SQLite, id 기본키)
+    매 사이클마다 CSV 전체를 읽고 다시 쓰는 대신, 새로 수집한 게시글만 한 트랜잭션으로 upsert한다.
+    CSV 파일은 번역/분류 단계와의 호환을 위해 export_csv로 내보낸다.
+    """
+    BATCH_SIZE = 500  # SQLite 바인딩 변수 개수 제한
+
+    def __init__(self, db_path: str):
+        dirname = os.path.dirname(db_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS posts (id TEXT PRIMARY KEY, {', '.join(c + ' TEXT' for c in COLUMNS[1:])})"
+        )
+        self.conn.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute('SELECT COUNT(*) FROM posts').fetchone()[0]
+
+    def import_csv(self, csv_path: str, encoding: str):
+        """기존 CSV 데이터를 처음 한 번 가져옴 (저장소가 비어 있을 때만)"""
+        if len(self) > 0 or not os.path.exists(csv_path):
+            return 0
+        df = pd.read_csv(csv_path, encoding=encoding, dtype=str).fillna('')
+        posts = df[[c for c in COLUMNS if c in df.columns]].to_dict('records')
+        changed = self.upsert(posts)
+        print(f"[INFO] Imported {changed} posts from {csv_path} into {self.db_path}")
+        return changed
+
+    def ids(self) -> set:
+        with self.lock:
+            return {row[0] for row in self.conn.execute('SELECT id FROM posts')}
+
+    def id_content_map(self) -> dict:
+        with self.lock:
+            return {row[0]: row[1] or '' for row in self.conn.execute('SELECT id, content FROM posts')}
+
+    def upsert(self, posts) -> int:
+        """
+        게시글 목록을 병합 규칙에 따라 한 트랜잭션으로 저장
+        Returns: 추가되거나 변경된 게시글 수
+        """
+        new_by_id = {}
+        for post in posts:
+            post = {col: ('' if value is None else str(value)) for col, value in post.items() if col in COLUMNS}
+            post_id = post['id']
+            new_by_id[post_id] = merge_post(new_by_id[post_id], post) if post_id in new_by_id else post
+        if not new_by_id:
+            return 0
+
+        with self.lock:
+            existing = {}
+            ids = list(new_by_id)
+            for i in range(0, len(ids), self.BATCH_SIZE):
+                chunk = ids[i:i + self.BATCH_SIZE]
+                rows = self.conn.execute(
+                    f"SELECT {', '.join(COLUMNS)} FROM posts WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+                )
+                for row in rows:
+                    existing[row[0]] = dict(zip(COLUMNS, row))
+
+            to_write = []
+            for post_id, new in new_by_id.items():
+                if post_id in existing:
+                    merged = merge_post(existing[post_id], new)
+                    if merged == existing[post_id]:
+                        continue
+                else:
+                    merged = new
+                to_write.append(tuple(merged.get(col, '') for col in COLUMNS))
+
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO posts ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    to_write,
+                )
+        return len(to_write)
+
+    def export_csv(self, csv_path: str, columns: list, encoding: str, errors: str = 'strict'):
+        """저장소 전체를 CSV로 내보냄 (임시 파일에 쓴 뒤 교체)"""
+        dirname = os.path.dirname(csv_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = csv_path + '.tmp'
+        with self.lock:
+            with open(tmp_path, 'w', encoding=encoding, errors=errors, newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(self.conn.execute(f"SELECT {', '.join(columns)} FROM posts ORDER BY CAST(id AS INTEGER) DESC"))
+            os.replace(tmp_path, csv_path)
+
+    def close(self):
+        self.conn.close()
+
+
+def default_store_path(data_path: str) -> str:
+    return os.path.splitext(data_path)[0] + '.db'
@@ -0,0 +1,101 @@
+import threading
+import time
+
+# max_requests_per_second를 정하지 않았을 때의 상한: 시작 속도의 이 배수까지 (사이트가 빠르게 응답하는 동안만 올림)
+DEFAULT_MAX_RATE_FACTOR = 2.0
+
+
+class AdaptiveRateController:
+    """
+    사이트 단위 AIMD 요청 속도 제어
+    - 응답이 정상이고 latency_target 안에 오면 rate를 조금씩 올림 (초당 약 increase만큼, max_rate가 상한)
+    - 응답이 latency_target보다 느리면 rate를 slow_factor배로 줄임
+      (브라우저 탭처럼 HTTP 요청과 시간 규모가 다른 작업은 on_success에 따로 기준 시간을 넘김)
+    - 서버 오류/타임아웃/차단 페이지면 rate를 decrease배로 줄이고, 연속 실패 횟수에 따라
+      backoff_base * 2^(n-1)초 (최대 backoff_max) 동안 요청을 멈춤
+    max_rate는 설정으로 정하는 사이트별 절대 상한이며 어떤 경우에도 넘지 않음
+    """
+    def __init__(self, rate: float = 1.0, max_rate: float = None, min_rate: float = 0.2, burst: int = 1,
+                 increase: float = 0.5, decrease: float = 0.7, slow_factor: float = 0.9,
+                 latency_target: float = 2.0, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.max_rate = float(max_rate if max_rate is not None else rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.rate = min(max(float(rate), self.min_rate), self.max_rate)
+        self.capacity = max(1, int(burst))
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_factor = slow_factor
+        self.latency_target = latency_target
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.backoff_until = 0.0
+        self.consecutive_errors = 0
+        self.successes = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """요청 허가를 받으면 0, 아니면 다시 시도할 때까지 기다릴 시간(초)"""
+        with self.lock:
+            now = time.monotonic()
+            if now < self.backoff_until:
+                return self.backoff_until - now
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def on_success(self, latency: float, latency_target: float = None):
+        if latency_target is None:
+            latency_target = self.latency_target
+        with self.lock:
+            self.successes += 1
+            self.consecutive_errors = 0
+            if latency > latency_target:
+                self.rate = max(self.min_rate, self.rate * self.slow_factor)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_error(self, reason: str = ''):
+        with self.lock:
+            self.errors += 1
+            self.consecutive_errors += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # 남아 있는 토큰으로 바로 다시 몰려가지 않도록 비움
+            self.tokens = 0.0
+            self.updated = time.monotonic()
+            backoff = min(self.backoff_max, self.backoff_base * 2 ** (self.consecutive_errors - 1))
+            self.backoff_until = max(self.backoff_until, self.updated + backoff)
+        print(f"[WARNING] 요청 속도 낮춤 ({reason}): {self.rate:.2f} req/s, {backoff:.0f}s 대기")
+
+    def stats(self) -> str:
+        return (f"{self.rate:.2f} req/s (ceiling {self.max_rate:g}), "
+                f"{self.successes} ok / {self.errors} errors")
+
+
+def rate_controller_from_config(site_config: dict) -> AdaptiveRateController:
+    """
+    사이트 설정에서 속도 제어기 생성
+    - requests_per_second: 시작 속도
+    - max_requests_per_second: 절대 상한 (기본값: 시작 속도 x DEFAULT_MAX_RATE_FACTOR)
+    - rate_control: min_rate / increase / decrease / latency_target / backoff_base / backoff_max 등 세부 조정
+    """
+    rate = site_config.get('requests_per_second', 2.0)
+    return AdaptiveRateController(
+        rate=rate,
+        max_rate=site_config.get('max_requests_per_second', rate * DEFAULT_MAX_RATE_FACTOR),
+        burst=site_config.get('burst', 2),
+        **site_config.get('rate_control', {}),
+    )
@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class WatermarkStore:
+    """
+    사이트/키워드별 high-watermark 저장소 (JSON 파일)
+    - newest_id: 지금까지 본 가장 큰 게시글 id
+      (새 게시글이 나온 마지막 페이지 last_new_page도 두자는 안이 있었으나, 목록이 밀리면 페이지 번호는
+       바로 틀려지고 멈출지는 newest_id만으로 정해지므로 일부러 저장하지 않음)
+    watermark가 있는 키워드는 이미 한 번 끝까지 수집된 것이므로,
+    새 게시글이 하나도 없는 페이지에 도달하면 페이지 순회를 멈춰도 된다.
+    스케줄러에서는 여러 키워드 작업이 한 저장소를 동시에 갱신함
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.RLock()
+        self.marks = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.marks = json.load(f)
+
+    def get(self, site: str, keyword: str):
+        return self.marks.get(site, {}).get(keyword)
+
+    def is_caught_up(self, site: str, keyword: str, page_ids) -> bool:
+        """
+        페이지의 게시글 id가 모두 watermark 이하이면 True
+        페이지에 새로 수집할 게시글이 없을 때만 호출함 (새 게시글이 있으면 멈추지 않음)
+        """
+        mark = self.get(site, keyword)
+        if mark is None:
+            return False
+        return all(int(post_id) <= mark['newest_id'] for post_id in page_ids)
+
+    def update(self, site: str, keyword: str, newest_id: int):
+        with self.lock:
+            mark = self.get(site, keyword) or {'newest_id': 0}
+            self.marks.setdefault(site, {})[keyword] = {
+                'newest_id': max(mark['newest_id'], newest_id),
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            self.save()
+
+    def save(self):
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with self.lock:
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.marks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def load_watermarks(config):
+    return WatermarkStore(config.get('watermark_path', 'data/watermarks.json'))
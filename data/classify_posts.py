@@ -7,7 +7,98 @@ import re
 import yaml
 import os
 import sys
-from transformers import pipeline
+
+from keyword_matcher import KeywordMatcher, match_keywords
+from zero_shot import ZeroShotEngine
+
+# 분류 기준 (출력 컬럼 이름)
+DIMENSIONS = ["type", "scam_topic", "scam_method"]
+
+# config.yaml에 text_classification 설정이 없을 때의 분류 기준
+DEFAULT_TYPE_CATEGORIES = {
+    "question": "질문, 확인 요청",
+    "warning": "경고, 주의 환기", 
+    "experience": "경험 공유 (피해담/사례 등)",
+    "advice": "해결 방법, 조언",
+    "discussion": "일반적 논의, 잡담"
+}
+
+# 각 카테고리에 대한 키워드 패턴
+DEFAULT_TYPE_PATTERNS = {
+    "question": [
+        r"re:\?$", r"질문", r"궁금", r"어떻게", r"무엇", r"어디", r"언제", r"왜", r"어떤",
+        r"help", r"question", r"how", r"what", r"where", r"when", r"why", r"which",
+        r"도와주세요", r"알려주세요", r"확인", r"요청"
+    ],
+    "warning": [
+        r"주의", r"경고", r"조심", r"위험", r"피해", r"사기", r"scam", r"fraud",
+        r"warning", r"caution", r"danger", r"risk", r"주의사항", r"알림"
+    ],
+    "experience": [
+        r"경험", r"사례", r"피해", r"당했다", r"받았다", r"겪었다", r"발생", r"발견",
+        r"experience", r"case", r"story", r"happened", r"received", r"found",
+        r"당했어", r"받았어", r"겪었어", r"생겼어", r"발견했어"
+    ],
+    "advice": [
+        r"조언", r"해결", r"방법", r"팁", r"도움", r"가이드", r"해결책",
+        r"advice", r"solution", r"method", r"tip", r"help", r"guide",
+        r"이렇게 하세요", r"다음과 같이", r"권장", r"추천"
+    ],
+    "discussion": [
+        r"토론", r"논의", r"잡담", r"이야기", r"얘기", r"대화", r"소통",
+        r"discussion", r"talk", r"chat", r"conversation", r"story",
+        r"생각", r"의견", r"느낌", r"느껴", r"생각해"
+    ]
+}
+DEFAULT_TOPIC_CATEGORIES = {
+    "phishing": "피싱",
+    "identity_theft": "신원 도용",
+    "fraud": "사기",
+    "other": "기타"
+}
+DEFAULT_TOPIC_PATTERNS = {
+    "phishing": [
+        r"phishing", r"피싱", r"사기", r"scam", r"fraud", r"속임수", r"속인주소", r"속인메일", r"속인전화"
+    ],
+    "identity_theft": [
+        r"identity_theft", r"신원도용", r"신원탈취", r"신원사칭", r"신원조작", r"신원변조"
+    ],
+    "fraud": [
+        r"fraud", r"사기", r"scam", r"속임수", r"속인주소", r"속인메일", r"속인전화"
+    ],
+    "other": [
+        r"other", r"기타", r"기타사기", r"기타사칭", r"기타속임수", r"기타속인주소", r"기타속인메일", r"기타속인전화"
+    ]
+}
+DEFAULT_METHOD_CATEGORIES = {
+    "email": "이메일",
+    "sms": "SMS",
+    "phone": "전화",
+    "website": "웹사이트",
+    "app": "앱",
+    "other": "기타"
+}
+DEFAULT_METHOD_PATTERNS = {
+    "email": [
+        r"email", r"이메일", r"메일", r"메일주소", r"메일주소입력", r"메일주소입력필드", r"메일주소입력필드입력"
+    ],
+    "sms": [
+        r"sms", r"sms메시지", r"sms메시지입력", r"sms메시지입력필드", r"sms메시지입력필드입력"
+    ],
+    "phone": [
+        r"phone", r"전화", r"전화번호", r"전화번호입력", r"전화번호입력필드", r"전화번호입력필드입력"
+    ],
+    "website": [
+        r"website", r"웹사이트", r"웹사이트주소", r"웹사이트주소입력", r"웹사이트주소입력필드", r"웹사이트주소입력필드입력"
+    ],
+    "app": [
+        r"app", r"앱", r"앱설치", r"앱다운로드", r"앱다운로드필드", r"앱다운로드필드입력"
+    ],
+    "other": [
+        r"other", r"기타", r"기타방법", r"기타방식", r"기타수단", r"기타수단사용"
+    ]
+}
+
 
 class TextClassifier:
     def __init__(self, api_token: Optional[str] = None, config: Optional[dict] = None):
@@ -18,18 +109,35 @@ class TextClassifier:
         """
         # self.api_token, self.api_url, self.headers 등 API 관련 코드 제거
         # config에서 categories/patterns 불러오는 부분은 유지
-        self.local_classifier = pipeline(
-            "zero-shot-classification",
-            model="joeddav/xlm-roberta-large-xnli",
-            device=0  # GPU 사용시 0, CPU만 있으면 -1
-        )
+        # Transformer 모델은 키워드 매칭에 실패한 게시글을 처음 분류할 때 불러옴 (load_local_classifier)
+        self.local_classifier = None
         
         # confidence threshold 설정 (키워드 매칭률이 이 값보다 낮으면 Transformer 사용)
         self.confidence_threshold = 0.3  # 기본값
+        # 긴 게시글은 문장 단위로 chunk_tokens 이하로 나누고, (chunk, 후보 라벨) 쌍을 batch_size개씩 모델에 넣음
+        self.chunk_tokens = 400
+        self.batch_size = 8
+        # 추론 백엔드 (torch, torch-int8, onnx, onnx-int8), device는 auto면 GPU가 있을 때만 GPU 사용
+        self.backend = "torch"
+        self.device = "auto"
+        self.intra_op_threads = 0
+        self.inter_op_threads = 0
         if config and 'text_classification' in config:
             tc = config['text_classification']
             if 'confidence_threshold' in tc:
                 self.confidence_threshold = tc['confidence_threshold']
+            if 'chunk_tokens' in tc:
+                self.chunk_tokens = tc['chunk_tokens']
+            if 'batch_size' in tc:
+                self.batch_size = tc['batch_size']
+            if 'backend' in tc:
+                self.backend = tc['backend']
+            if 'device' in tc:
+                self.device = tc['device']
+            if 'intra_op_threads' in tc:
+                self.intra_op_threads = tc['intra_op_threads']
+            if 'inter_op_threads' in tc:
+                self.inter_op_threads = tc['inter_op_threads']
 
         # config에서 분류 설정 읽기
         self.type_categories = {}
@@ -51,110 +159,26 @@ class TextClassifier:
                 self.method_patterns = tc['scam_method']['patterns']
         else:
             # 기본값 설정
-            self.type_categories = {
-                "question": "질문, 확인 요청",
-                "warning": "경고, 주의 환기", 
-                "experience": "경험 공유 (피해담/사례 등)",
-                "advice": "해결 방법, 조언",
-                "discussion": "일반적 논의, 잡담"
-            }
-            
-            # 각 카테고리에 대한 키워드 패턴
-            self.type_patterns = {
-                "question": [
-                    r"\?$", r"질문", r"궁금", r"어떻게", r"무엇", r"어디", r"언제", r"왜", r"어떤",
-                    r"help", r"question", r"how", r"what", r"where", r"when", r"why", r"which",
-                    r"도와주세요", r"알려주세요", r"확인", r"요청"
-                ],
-                "warning": [
-                    r"주의", r"경고", r"조심", r"위험", r"피해", r"사기", r"scam", r"fraud",
-                    r"warning", r"caution", r"danger", r"risk", r"주의사항", r"알림"
-                ],
-                "experience": [
-                    r"경험", r"사례", r"피해", r"당했다", r"받았다", r"겪었다", r"발생", r"발견",
-                    r"experience", r"case", r"story", r"happened", r"received", r"found",
-                    r"당했어", r"받았어", r"겪었어", r"생겼어", r"발견했어"
-                ],
-                "advice": [
-                    r"조언", r"해결", r"방법", r"팁", r"도움", r"가이드", r"해결책",
-                    r"advice", r"solution", r"method", r"tip", r"help", r"guide",
-                    r"이렇게 하세요", r"다음과 같이", r"권장", r"추천"
-                ],
-                "discussion": [
-                    r"토론", r"논의", r"잡담", r"이야기", r"얘기", r"대화", r"소통",
-                    r"discussion", r"talk", r"chat", r"conversation", r"story",
-                    r"생각", r"의견", r"느낌", r"느껴", r"생각해"
-                ]
-            }
-            self.topic_categories = {
-                "phishing": "피싱",
-                "identity_theft": "신원 도용",
-                "fraud": "사기",
-                "other": "기타"
-            }
-            self.topic_patterns = {
-                "phishing": [
-                    r"phishing", r"피싱", r"사기", r"scam", r"fraud", r"속임수", r"속인주소", r"속인메일", r"속인전화"
-                ],
-                "identity_theft": [
-                    r"identity_theft", r"신원도용", r"신원탈취", r"신원사칭", r"신원조작", r"신원변조"
-                ],
-                "fraud": [
-                    r"fraud", r"사기", r"scam", r"속임수", r"속인주소", r"속인메일", r"속인전화"
-                ],
-                "other": [
-                    r"other", r"기타", r"기타사기", r"기타사칭", r"기타속임수", r"기타속인주소", r"기타속인메일", r"기타속인전화"
-                ]
-            }
-            self.method_categories = {
-                "email": "이메일",
-                "sms": "SMS",
-                "phone": "전화",
-                "website": "웹사이트",
-                "app": "앱",
-                "other": "기타"
-            }
-            self.method_patterns = {
-                "email": [
-                    r"email", r"이메일", r"메일", r"메일주소", r"메일주소입력", r"메일주소입력필드", r"메일주소입력필드입력"
-                ],
-                "sms": [
-                    r"sms", r"sms메시지", r"sms메시지입력", r"sms메시지입력필드", r"sms메시지입력필드입력"
-                ],
-                "phone": [
-                    r"phone", r"전화", r"전화번호", r"전화번호입력", r"전화번호입력필드", r"전화번호입력필드입력"
-                ],
-                "website": [
-                    r"website", r"웹사이트", r"웹사이트주소", r"웹사이트주소입력", r"웹사이트주소입력필드", r"웹사이트주소입력필드입력"
-                ],
-                "app": [
-                    r"app", r"앱", r"앱설치", r"앱다운로드", r"앱다운로드필드", r"앱다운로드필드입력"
-                ],
-                "other": [
-                    r"other", r"기타", r"기타방법", r"기타방식", r"기타수단", r"기타수단사용"
-                ]
-            }
+            self.type_categories = DEFAULT_TYPE_CATEGORIES
+            self.type_patterns = DEFAULT_TYPE_PATTERNS
+            self.topic_categories = DEFAULT_TOPIC_CATEGORIES
+            self.topic_patterns = DEFAULT_TOPIC_PATTERNS
+            self.method_categories = DEFAULT_METHOD_CATEGORIES
+            self.method_patterns = DEFAULT_METHOD_PATTERNS
+
+        # type/topic/method 키워드를 한 번에 찾는 자동자 (텍스트마다 한 번만 훑음)
+        self.keyword_matcher = KeywordMatcher({
+            "type": (self.type_patterns, "discussion", False),
+            "scam_topic": (self.topic_patterns, "other", False),
+            "scam_method": (self.method_patterns, "", True),
+        })
 
     def classify_with_keywords(self, text: str, patterns_dict: dict, default: str = "other", multi: bool = False) -> tuple:
         """
         키워드가 한번이라도 포함되면 해당 카테고리로 분류 (multi=True면 모든 매칭 카테고리 +로 연결)
         Returns: (classification, 매칭여부, 매칭된 키워드)
         """
-        if not text or pd.isna(text):
-            return default, 0, ""
-        text = str(text).lower()
-        matched = []
-        matched_keywords = []
-        for category, patterns in patterns_dict.items():
-            for pattern in patterns:
-                if pattern.lower() in text:
-                    matched.append(category)
-                    matched_keywords.append(pattern)
-                    if not multi:
-                        return category, 1, pattern  # 최초 매칭 카테고리, 키워드 반환
-        if multi and matched:
-            return "+".join(sorted(set(matched))), 1, "+".join(sorted(set(matched_keywords)))
-        return default, 0, ""
+        return match_keywords(text, patterns_dict, default, multi)
 
     def classify_type(self, text: str) -> tuple:
         """
@@ -174,74 +198,158 @@ class TextClassifier:
         """
         return self.classify_with_keywords(text, self.method_patterns, default="", multi=True)
 
+    def load_local_classifier(self):
+        if self.local_classifier is None:
+            self.local_classifier = ZeroShotEngine(
+                "joeddav/xlm-roberta-large-xnli",
+                batch_size=self.batch_size,
+                chunk_tokens=self.chunk_tokens,
+                device=self.device,
+                backend=self.backend,
+                intra_op_threads=self.intra_op_threads,
+                inter_op_threads=self.inter_op_threads
+            )
+
     def classify_texts(self, text: str, use_api: bool = False) -> dict:
-        # 1단계: 키워드 기반 분류 시도
-        type_result, type_matched, type_kw = self.classify_type(text)
-        topic_result, topic_matched, topic_kw = self.classify_topic(text)
-        method_result, method_matched, method_kw = self.classify_method(text)
-        # 2단계: 하나라도 매칭 실패하면 해당 matched_*_keyword만 'API'로 기록, 값은 fallback 결과 사용
-        api_result = None
-        if (type_matched == 0 or topic_matched == 0 or method_matched == 0) and use_api:
-            print(f"일부 카테고리 키워드 매칭 실패. 부족한 부분은 Transformer 분류기를 사용합니다.")
-            api_result = self.classify_with_api(text)
-        return {
-            "type": api_result["type"] if type_matched == 0 and api_result else type_result,
-            "scam_topic": api_result["scam_topic"] if topic_matched == 0 and api_result else topic_result,
-            "scam_method": api_result["scam_method"] if method_matched == 0 and api_result else method_result,
-            "matched_type_keyword": "API" if type_matched == 0 else type_kw,
-            "matched_topic_keyword": "API" if topic_matched == 0 else topic_kw,
-            "matched_method_keyword": "API" if method_matched == 0 else method_kw
-        }
+        return self.classify_batch([text], use_api).iloc[0].to_dict()
+
+    def classify_batch(self, texts, use_api: bool = False) -> pd.DataFrame:
+        """
+        텍스트 목록을 한 번에 분류
+        Returns: type, scam_topic, scam_method, matched_*_keyword, forward_passes 컬럼의 DataFrame (texts 순서)
+        forward_passes: Transformer 분류에 쓴 (chunk, 가설) 쌍 수 (키워드로 모두 분류되면 0)
+        """
+        # 1단계: 키워드 기반 분류 (텍스트마다 type/topic/method를 한 번에)
+        keywords = [self.keyword_matcher.classify(text) for text in texts]
+        result = pd.DataFrame(index=range(len(keywords)))
+        unmatched = {}
+        for column, keyword_column in (("type", "matched_type_keyword"),
+                                       ("scam_topic", "matched_topic_keyword"),
+                                       ("scam_method", "matched_method_keyword")):
+            values, matched, matched_keywords = zip(*(k[column] for k in keywords)) if keywords else ((), (), ())
+            unmatched[column] = pd.Series(matched, index=result.index, dtype=int) == 0
+            result[column] = list(values)
+            # 매칭 실패한 기준은 matched_*_keyword를 'API'로 기록
+            result[keyword_column] = list(matched_keywords)
+            result.loc[unmatched[column], keyword_column] = "API"
+
+        # 2단계: 매칭 실패한 기준만 Transformer로 분류 (기준마다 그 기준의 후보 라벨만 사용)
+        result["forward_passes"] = 0
+        if use_api:
+            todo = unmatched["type"] | unmatched["scam_topic"] | unmatched["scam_method"]
+            if todo.any():
+                print(f"키워드 매칭에 일부 실패한 {int(todo.sum())}개는 Transformer 분류기를 사용합니다.")
+                indexes = result.index[todo]
+                missing = [[column for column in DIMENSIONS if unmatched[column][i]] for i in indexes]
+                api_results = self.classify_many_with_api([texts[i] for i in indexes], missing)
+                for i, api_result in zip(indexes, api_results):
+                    if not api_result:
+                        continue
+                    for column in DIMENSIONS:
+                        if unmatched[column][i] and column in api_result:
+                            result.at[i, column] = api_result[column]
+                    result.at[i, "forward_passes"] = api_result["forward_passes"]
+        return result
 
     def classify_with_api(self, text: str) -> Optional[dict]:
         """
         로컬 zero-shot classification을 사용한 텍스트 분류
         """
-        if not text or pd.isna(text):
-            return None
+        return self.classify_many_with_api([text])[0]
+
+    def classify_many_with_api(self, texts: list, dimensions: Optional[list] = None) -> list:
+        """
+        로컬 zero-shot classification으로 여러 텍스트를 한꺼번에 분류 (ZeroShotEngine이 길이순 batch로 처리)
+        기준(type/scam_topic/scam_method)마다 그 기준의 후보 라벨만으로 따로 점수를 매김
+        dimensions: 텍스트마다 분류할 기준 목록 (None이면 세 기준 모두)
+        Returns: 텍스트마다 {기준: 분류, ..., forward_passes: 모델에 넣은 (chunk, 가설) 쌍 수}, 빈 텍스트는 None
+        """
+        results = [None] * len(texts)
+        todo = [i for i, text in enumerate(texts) if text and not pd.isna(text)]
+        if not todo:
+            return results
+        self.load_local_classifier()
 
-        type_label_map = {v: k for k, v in self.type_categories.items()}
-        topic_label_map = {v: k for k, v in self.topic_categories.items()}
-        method_label_map = {v: k for k, v in self.method_categories.items()}
-        candidate_labels = list(self.type_categories.values()) + list(self.topic_categories.values()) + list(self.method_categories.values())
+        label_sets = {
+            "type": (self.type_categories, "other"),
+            "scam_topic": (self.topic_categories, "other"),
+            "scam_method": (self.method_categories, ""),
+        }
+        requests = []
+        for i in todo:
+            for column in (dimensions[i] if dimensions else DIMENSIONS):
+                requests.append((i, column))
 
+        started = time.perf_counter()
         try:
-            result = self.local_classifier(text, candidate_labels, multi_label=False)
-            labels = result.get("labels", [])
-            type_label = next((type_label_map[lbl] for lbl in labels if lbl in type_label_map), "other")
-            topic_label = next((topic_label_map[lbl] for lbl in labels if lbl in topic_label_map), "other")
-            method_label = next((method_label_map[lbl] for lbl in labels if lbl in method_label_map), "")
-            return {
-                "type": type_label,
-                "scam_topic": topic_label,
-                "scam_method": method_label
-            }
+            scores = self.local_classifier.score(
+                [(str(texts[i]), list(label_sets[column][0].values())) for i, column in requests])
         except Exception as e:
             print(f"로컬 모델 분류 오류: {e}")
-            return {
-                "type": "API_TIMEOUT",
-                "scam_topic": "API_TIMEOUT",
-                "scam_method": "API_TIMEOUT"
-            }
+            for i in todo:
+                results[i] = {
+                    "type": "API_TIMEOUT",
+                    "scam_topic": "API_TIMEOUT",
+                    "scam_method": "API_TIMEOUT",
+                    "forward_passes": 0
+                }
+            return results
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        passes = sum(self.local_classifier.last_passes)
+        print(f"Transformer 분류 속도: {len(todo)}개 / {elapsed:.1f}s = {len(todo) / elapsed:.2f} posts/sec "
+              f"({self.backend}, batch {self.batch_size}, forward pass {passes}개 = 게시글당 {passes / len(todo):.1f}개)")
+
+        for i in todo:
+            results[i] = {"forward_passes": 0}
+        for (i, column), label_scores, count in zip(requests, scores, self.local_classifier.last_passes):
+            categories, default = label_sets[column]
+            label_map = {v: k for k, v in categories.items()}
+            best = max(label_scores, key=label_scores.get) if label_scores else None
+            results[i][column] = label_map.get(best, default)
+            results[i]["forward_passes"] += count
+        return results
 
 def classify_with_keywords_simple(text, patterns_dict, default="other", multi=False):
-    if not text or pd.isna(text):
-        return default
-    text = str(text).lower()
-    matched = []
-    for category, patterns in patterns_dict.items():
-        for pattern in patterns:
-            if pattern.lower() in text:
-                matched.append(category)
-                if not multi:
-                    return category  # 첫 매칭 카테고리 반환
-    if multi and matched:
-        return "+".join(sorted(set(matched)))
-    return default
+    return match_keywords(text, patterns_dict, default, multi)[0]
+
+CLASSIFICATION_COLUMNS = ["type", "scam_topic", "scam_method",
+                          "matched_type_keyword", "matched_topic_keyword", "matched_method_keyword",
+                          "forward_passes"]
+
+
+def texts_to_classify(df: pd.DataFrame) -> pd.Series:
+    """한국어 제목 + 본문, 둘 다 없으면 영어 제목 + 본문"""
+    def column(name):
+        return df[name].fillna("").astype(str) if name in df.columns else pd.Series("", index=df.index)
+
+    korean = (column("title") + " " + column("content")).str.strip()
+    english = (column("Eng_title") + " " + column("Eng_Contents")).str.strip()
+    return korean.where(korean != "", english)
+
+
+def load_previous_classifications(output_file: str) -> Optional[pd.DataFrame]:
+    """이전 분류 결과 (id 인덱스, 분류 컬럼만), 없거나 읽을 수 없으면 None"""
+    if not os.path.exists(output_file):
+        return None
+    try:
+        existing_df = pd.read_csv(output_file, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    except Exception as e:
+        print(f"기존 파일 읽기 실패: {e}")
+        return None
+    print(f"기존 분류 파일을 찾았습니다. {len(existing_df)}개의 행이 있습니다.")
+    if 'id' not in existing_df.columns or not {'type', 'scam_topic', 'scam_method'} <= set(existing_df.columns):
+        return None
+    for column in CLASSIFICATION_COLUMNS:
+        if column not in existing_df.columns:
+            existing_df[column] = ""
+    return existing_df.drop_duplicates('id', keep='last').set_index('id')[CLASSIFICATION_COLUMNS]
+
 
 def process_csv_file(input_file: str, output_file: str, api_token: Optional[str] = None, use_api: bool = False, config: Optional[dict] = None):
     """
     CSV 파일을 읽어서 분류 결과를 추가하여 저장
+    - 이전 분류 파일에 있는 id는 id로 한 번에 조인해서 그대로 사용하고, 새 게시글만 한꺼번에 분류
+    - 결과는 임시 파일에 한 번 쓴 뒤 output_file로 교체
     """
     # 여러 인코딩을 시도하여 CSV 파일 읽기
     encodings = ['euc-kr', 'utf-8-sig', 'utf-8', 'cp949', 'latin1']
@@ -249,7 +357,7 @@ def process_csv_file(input_file: str, output_file: str, api_token: Optional[str]
     
     for encoding in encodings:
         try:
-            df = pd.read_csv(input_file, encoding=encoding)
+            df = pd.read_csv(input_file, encoding=encoding, dtype=str, keep_default_na=False)
             print(f"파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
             break
         except UnicodeDecodeError:
@@ -263,108 +371,34 @@ def process_csv_file(input_file: str, output_file: str, api_token: Optional[str]
         raise Exception("모든 인코딩으로 파일 읽기 실패")
     
     print(f"총 {len(df)}개의 행을 처리합니다...")
+    df = df.drop(columns=[column for column in CLASSIFICATION_COLUMNS if column in df.columns])
     
-    # 기존 분류된 파일이 있는지 확인
-    existing_df = None
-    if os.path.exists(output_file):
-        try:
-            existing_df = pd.read_csv(output_file, encoding='utf-8-sig')
-            print(f"기존 분류 파일을 찾았습니다. {len(existing_df)}개의 행이 있습니다.")
-        except Exception as e:
-            print(f"기존 파일 읽기 실패: {e}")
-    
-    # 분류기 초기화
-    classifier = TextClassifier(api_token, config)
-    
-    # 분류 결과를 저장할 리스트
-    classifications_type = []
-    classifications_topic = []
-    classifications_method = []
-    matched_type_keywords = []
-    matched_topic_keywords = []
-    matched_method_keywords = []
+    # 기존 분류된 파일이 있으면 id로 조인하여 기존 분류 결과 사용
+    previous = load_previous_classifications(output_file)
+    if previous is not None:
+        classified = previous.reindex(df['id'])
+        classified.index = df.index
+        todo = ~df['id'].isin(previous.index)
+    else:
+        classified = pd.DataFrame("", index=df.index, columns=CLASSIFICATION_COLUMNS)
+        todo = pd.Series(True, index=df.index)
+    print(f"기존 분류 재사용 {int((~todo).sum())}개, 새로 분류 {int(todo.sum())}개")
     
-    output_exists = os.path.exists(output_file)
-    for idx, row in df.iterrows():
-        # 기존 파일이 있고, 현재 행이 이미 분류되어 있는지 확인
-        if existing_df is not None:
-            existing_row = existing_df[existing_df['id'] == row['id']]
-            if not existing_row.empty and 'type' in existing_row.columns and 'scam_topic' in existing_row.columns and 'scam_method' in existing_row.columns:
-                # 기존 분류 결과 사용
-                classifications_type.append(existing_row.iloc[0]['type'])
-                classifications_topic.append(existing_row.iloc[0]['scam_topic'])
-                classifications_method.append(existing_row.iloc[0]['scam_method'])
-                matched_type_keywords.append(existing_row.iloc[0].get('matched_type_keyword', ''))
-                matched_topic_keywords.append(existing_row.iloc[0].get('matched_topic_keyword', ''))
-                matched_method_keywords.append(existing_row.iloc[0].get('matched_method_keyword', ''))
-                continue
-        
-        # 제목과 내용을 결합하여 분류
-        title = str(row.get('title', ''))
-        content = str(row.get('content', ''))
-        eng_title = str(row.get('Eng_title', ''))
-        eng_content = str(row.get('Eng_Contents', ''))
-        
-        # 한국어 텍스트 우선, 없으면 영어 텍스트 사용
-        text_to_classify = ""
-        if title and title != 'nan':
-            text_to_classify += title + " "
-        if content and content != 'nan':
-            text_to_classify += content + " "
-        
-        # 한국어 텍스트가 없으면 영어 텍스트 사용
-        if not text_to_classify.strip():
-            if eng_title and eng_title != 'nan':
-                text_to_classify += eng_title + " "
-            if eng_content and eng_content != 'nan':
-                text_to_classify += eng_content + " "
-        
-        # 분류 수행
-        result = classifier.classify_texts(text_to_classify.strip(), use_api)
-        classifications_type.append(result['type'])
-        classifications_topic.append(result['scam_topic'])
-        classifications_method.append(result['scam_method'])
-        matched_type_keywords.append(result.get('matched_type_keyword', ''))
-        matched_topic_keywords.append(result.get('matched_topic_keyword', ''))
-        matched_method_keywords.append(result.get('matched_method_keyword', ''))
-        
-        # 진행상황 출력
-        if (idx + 1) % 10 == 0:
-            print(f"진행률: {idx + 1}/{len(df)} ({((idx + 1)/len(df)*100):.1f}%)")
-        
-        # API 사용 시 요청 간격 조절
-        if use_api:
-            time.sleep(0.5)  # 0.5초 대기
-        
-        result_row = dict(row)  # 원본 row의 모든 컬럼 포함
-        result_row.update({
-            "type": result['type'],
-            "scam_topic": result['scam_topic'],
-            "scam_method": result['scam_method'],
-            "matched_type_keyword": result.get('matched_type_keyword', ''),
-            "matched_topic_keyword": result.get('matched_topic_keyword', ''),
-            "matched_method_keyword": result.get('matched_method_keyword', '')
-        })
-        result_df = pd.DataFrame([result_row])
-        result_df.to_csv(
-            output_file,
-            mode='a',
-            header=not output_exists and idx == 0,  # 첫 행만 헤더
-            index=False,
-            encoding='utf-8-sig'
-        )
-        output_exists = True
+    if todo.any():
+        # 분류기 초기화
+        classifier = TextClassifier(api_token, config)
+        texts = texts_to_classify(df[todo]).tolist()
+        result = classifier.classify_batch(texts, use_api)
+        result.index = df.index[todo]
+        # classified는 문자열 컬럼(dtype=str로 읽은 이전 결과 또는 빈 문자열)이므로 forward_passes(int)도 문자열로 맞춤
+        classified.loc[todo, CLASSIFICATION_COLUMNS] = result[CLASSIFICATION_COLUMNS].astype(str)
     
-    # 분류 결과를 데이터프레임에 추가
-    df['type'] = classifications_type
-    df['scam_topic'] = classifications_topic
-    df['scam_method'] = classifications_method
-    df['matched_type_keyword'] = matched_type_keywords
-    df['matched_topic_keyword'] = matched_topic_keywords
-    df['matched_method_keyword'] = matched_method_keywords
+    df = pd.concat([df, classified[CLASSIFICATION_COLUMNS]], axis=1)
     
-    # 결과 저장 (utf-8-sig 인코딩 사용)
-    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    # 결과 저장 (utf-8-sig 인코딩 사용, 임시 파일에 쓴 뒤 교체)
+    tmp_file = output_file + ".tmp"
+    df.to_csv(tmp_file, index=False, encoding='utf-8-sig')
+    os.replace(tmp_file, output_file)
     
     # 분류 결과 통계 출력
     print("\n=== 분류 결과 통계 ===")
@@ -0,0 +1,113 @@
+import re
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick가 없으면 키워드마다 부분 문자열 검사
+    ahocorasick = None
+
+# 이 접두어로 시작하는 패턴만 정규식으로 취급 (r"re:\?$" 등), 나머지는 "www.", "e.g." 같은 점이 있어도 일반 키워드
+REGEX_PREFIX = 're:'
+
+
+def is_regex(pattern: str) -> bool:
+    return pattern.startswith(REGEX_PREFIX)
+
+
+def _as_text(text) -> str:
+    if isinstance(text, str):
+        return text
+    # None, NaN은 빈 텍스트
+    return '' if text is None or text != text else str(text)
+
+
+class KeywordMatcher:
+    """
+    여러 분류 기준(type/scam_topic/scam_method 등)의 키워드 패턴을 한 번만 컴파일해 두고,
+    텍스트를 한 번 훑어서 모든 기준의 분류 결과를 구함 (대소문자 구분 없음)
+    - 일반 키워드: Aho-Corasick 자동자 (pyahocorasick가 없으면 중복을 뺀 키워드마다 부분 문자열 검사)
+    - 정규식 패턴("re:"로 시작): 패턴마다 따로 검색 (매칭 위치가 겹치는 정규식도 모두 찾음)
+      ^, $는 텍스트 전체의 처음/끝 (줄 단위로 찾으려면 패턴에 (?m)을 붙임)
+
+    dimensions: {기준 이름: (patterns_dict, default, multi)}
+    분류 규칙은 이전 반복문과 같음
+    - multi=False: patterns_dict 순서상 처음 매칭된 카테고리와 그 카테고리에서 처음 매칭된 패턴
+    - multi=True: 매칭된 모든 카테고리/패턴을 정렬해 +로 연결
+    """
+    def __init__(self, dimensions: dict):
+        self.dimensions = dimensions
+        literals = set()
+        regexes = []
+        # 기준별 {찾은 키워드/정규식: [(패턴 순서, category, pattern), ...]}
+        self.entries = {}
+        for name, (patterns_dict, _, _) in dimensions.items():
+            entries = self.entries[name] = {}
+            rank = 0
+            for category, patterns in patterns_dict.items():
+                for pattern in patterns:
+                    if not pattern:
+                        continue
+                    if is_regex(pattern):
+                        key = pattern
+                        if pattern not in regexes:
+                            regexes.append(pattern)
+                    else:
+                        key = pattern.lower()
+                        literals.add(key)
+                    entries.setdefault(key, []).append((rank, category, pattern))
+                    rank += 1
+
+        self.literals = literals
+        self.automaton = None
+        if literals and ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for literal in literals:
+                self.automaton.add_word(literal, literal)
+            self.automaton.make_automaton()
+
+        self.regexes = [(pattern, re.compile(pattern[len(REGEX_PREFIX):], re.IGNORECASE))
+                        for pattern in regexes]
+
+    def scan(self, text) -> set:
+        """Returns: 텍스트에서 찾은 키워드(소문자)와 정규식 패턴"""
+        text = _as_text(text).lower()
+        found = set()
+        if not text:
+            return found
+        if self.automaton is not None:
+            found.update(value for _, value in self.automaton.iter(text))
+        else:
+            found.update(literal for literal in self.literals if literal in text)
+        found.update(pattern for pattern, regex in self.regexes if regex.search(text))
+        return found
+
+    def classify(self, text) -> dict:
+        """Returns: {기준 이름: (classification, 매칭여부, 매칭된 키워드)}"""
+        found = self.scan(text)
+        return {name: self._decide(found, name) for name in self.dimensions}
+
+    def _decide(self, found: set, name: str) -> tuple:
+        _, default, multi = self.dimensions[name]
+        hits = [entry for key in found for entry in self.entries[name].get(key, ())]
+        if not hits:
+            return default, 0, ""
+        if not multi:
+            _, category, pattern = min(hits)
+            return category, 1, pattern  # 최초 매칭 카테고리, 키워드 반환
+        return ("+".join(sorted({category for _, category, _ in hits})), 1,
+                "+".join(sorted({pattern for _, _, pattern in hits})))
+
+
+@lru_cache(maxsize=32)
+def _compiled(frozen_patterns: tuple, default: str, multi: bool) -> KeywordMatcher:
+    patterns_dict = {category: list(patterns) for category, patterns in frozen_patterns}
+    return KeywordMatcher({'_': (patterns_dict, default, multi)})
+
+
+def match_keywords(text, patterns_dict: dict, default: str = "other", multi: bool = False) -> tuple:
+    """
+    patterns_dict 하나로 분류 (컴파일한 자동자는 같은 patterns_dict끼리 재사용)
+    Returns: (classification, 매칭여부, 매칭된 키워드)
+    """
+    frozen = tuple((category, tuple(patterns)) for category, patterns in patterns_dict.items())
+    return _compiled(frozen, default, multi).classify(text)['_']
@@ -0,0 +1,26 @@
+import re
+
+# 한글 음절/자모, 라틴 문자
+HANGUL = re.compile(r'[가-힣ᄀ-ᇿ㄰-㆏]')
+LATIN = re.compile(r'[A-Za-z]')
+
+
+def count_hangul(text) -> int:
+    return len(HANGUL.findall(text)) if isinstance(text, str) else 0
+
+
+def detect_language(text, min_hangul: int = 1) -> str:
+    """
+    한글 글자 수로 빠르게 언어 판별
+    영어 메일을 붙여 넣고 한두 줄 질문을 단 게시글도 있어서 비율이 아니라 한글이 있는지로 판단함
+    Returns: 'ko' (번역 필요), 'en' (한글 없이 라틴 문자), '' (빈 텍스트, 숫자/기호뿐인 텍스트)
+    """
+    if not isinstance(text, str) or not text.strip():
+        return ''
+    if count_hangul(text) >= min_hangul:
+        return 'ko'
+    return 'en' if LATIN.search(text) else ''
+
+
+def needs_translation(text) -> bool:
+    return detect_language(text) == 'ko'
@@ -0,0 +1,68 @@
+import re
+
+# 문장 경계: 문장부호(. ! ? 。 … ~) 뒤의 공백, 또는 줄바꿈
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。…~])\s+|\s*\n+\s*')
+# 문장부호 없이 끝나는 한국어 종결어미 뒤의 공백 ("~했습니다 그래서", "~인가요 혹시")
+KOREAN_ENDING = re.compile(r'(?:(?<=니다|어요|아요|해요|에요|예요|세요|네요|군요|까요|나요|가요|지요)|(?<=죠))\s+')
+
+
+def approx_tokens(text: str) -> int:
+    """토크나이저가 없을 때의 토큰 수 추정 (한국어 subword는 대략 2글자에 1토큰)"""
+    return len(text) // 2 + 1
+
+
+def split_sentences(text: str) -> list:
+    if not isinstance(text, str):
+        return []
+    sentences = []
+    for part in SENTENCE_BOUNDARY.split(text):
+        sentences.extend(s for s in KOREAN_ENDING.split(part) if s.strip())
+    return [s.strip() for s in sentences]
+
+
+def _split_long(sentence: str, max_tokens: int, count_tokens) -> list:
+    """예산보다 긴 문장은 어절 단위로, 어절도 길면 글자 단위로 나눔"""
+    pieces = []
+    current = ''
+    for word in sentence.split():
+        candidate = f"{current} {word}" if current else word
+        if count_tokens(candidate) <= max_tokens:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        while count_tokens(word) > max_tokens and len(word) > 1:
+            # 토큰 수에 비례해 자르기 (최소 한 글자)
+            cut = max(1, len(word) * max_tokens // count_tokens(word))
+            pieces.append(word[:cut])
+            word = word[cut:]
+        current = word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int, count_tokens=approx_tokens, joiner: str = ' ') -> list:
+    """
+    문장 경계를 지키면서 max_tokens 이하의 chunk로 나눔 (문장을 앞에서부터 채워 넣음)
+    count_tokens: 텍스트 -> 토큰 수 (모델 토크나이저를 넘기면 정확한 예산)
+    Returns: [chunk, ...], 빈 텍스트면 []
+    """
+    chunks = []
+    current = ''
+    for sentence in split_sentences(text):
+        for piece in (_split_long(sentence, max_tokens, count_tokens)
+                      if count_tokens(sentence) > max_tokens else [sentence]):
+            candidate = f"{current}{joiner}{piece}" if current else piece
+            if current and count_tokens(candidate) > max_tokens:
+                chunks.append(current)
+                candidate = piece
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def tokenizer_counter(tokenizer):
+    """Hugging Face 토크나이저로 토큰 수 세기 (특수 토큰 제외)"""
+    return lambda text: len(tokenizer.tokenize(text))
@@ -1,71 +1,252 @@
-import pandas as pd
-from googletrans import Translator
+import argparse
+import json
+import os
+import sqlite3
 import time
-from transformers import pipeline
-
-translator = Translator()
-
-# 모델명: xlm-roberta-large-xnli (한국어 zero-shot 분류 지원)
-classifier = pipeline(
-    "zero-shot-classification",
-    model="joeddav/xlm-roberta-large-xnli",
-    device=0  # GPU 사용시, 없으면 -1
-)
-
-text = "이게 스캠인지 궁금합니다. 조언 부탁드려요."
-candidate_labels = [
-    "사기 여부가 불확실하여 묻는 질문",
-    "사기임을 확신한 후 대응법을 묻는 질문",
-    "직접 피해 경험 후 경고 목적",
-    "영상/뉴스 등 외부 자료 공유 경고",
-    "판단이 불가능한 경우 (정보 부족, 맥락 모호 등)"
-]
-
-result = classifier(text, candidate_labels, multi_label=False)
-print(result)
-
-def safe_translate(text, src='ko', dest='en'):
-    if not isinstance(text, str) or not text.strip():
-        return ""
+
+import pandas as pd
+
+from translation import create_translator, translate_posts
+from translation_cache import CachedTranslator, TranslationCache
+
+# 게시판별 입력/출력 파일
+SITES = {
+    "mu": ("data/mu_posts.csv", "data/mu_posts_translated.csv", "euc-kr"),
+    "gu": ("data/gu_posts.csv", "data/gu_posts_translated.csv", "utf-8-sig"),
+}
+ENG_COLUMNS = ["Eng_title", "Eng_Contents"]
+
+
+def run_classifier_demo():
+    from transformers import pipeline
+
+    from zero_shot import detect_device
+
+    # 모델명: xlm-roberta-large-xnli (한국어 zero-shot 분류 지원)
+    classifier = pipeline(
+        "zero-shot-classification",
+        model="joeddav/xlm-roberta-large-xnli",
+        device=detect_device()  # GPU가 있으면 cuda:0, 없으면 cpu
+    )
+
+    text = "이게 스캠인지 궁금합니다. 조언 부탁드려요."
+    candidate_labels = [
+        "사기 여부가 불확실하여 묻는 질문",
+        "사기임을 확신한 후 대응법을 묻는 질문",
+        "직접 피해 경험 후 경고 목적",
+        "영상/뉴스 등 외부 자료 공유 경고",
+        "판단이 불가능한 경우 (정보 부족, 맥락 모호 등)"
+    ]
+
+    result = classifier(text, candidate_labels, multi_label=False)
+    print(result)
+
+
+class PreviousTranslations:
+    """
+    이전 번역 결과(output_file)를 SQLite 파일로 옮겨 두고 id로 조회
+    (큰 파일도 메모리에 전부 올리지 않도록 chunk 단위로 읽음)
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS previous "
+                          "(id TEXT PRIMARY KEY, title TEXT, content TEXT, eng_title TEXT, eng_content TEXT)")
+
+    def load(self, output_file, chunk_size):
+        with self.conn:
+            self.conn.execute("DELETE FROM previous")
+            if not os.path.exists(output_file):
+                return
+            for chunk in pd.read_csv(output_file, encoding="utf-8-sig", dtype=str, chunksize=chunk_size):
+                chunk = chunk.fillna("")
+                if not set(["id", "title", "content"] + ENG_COLUMNS) <= set(chunk.columns):
+                    return
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO previous VALUES (?, ?, ?, ?, ?)",
+                    chunk[["id", "title", "content"] + ENG_COLUMNS].itertuples(index=False, name=None),
+                )
+
+    def reuse(self, df):
+        """
+        제목/본문이 그대로인 게시글의 이전 번역을 df에 채움
+        Returns: 새로 번역해야 하는 행 (bool Series)
+        """
+        df["Eng_title"] = ""
+        df["Eng_Contents"] = ""
+        ids = df["id"].tolist()
+        rows = self.conn.execute(
+            f"SELECT id, title, content, eng_title, eng_content FROM previous WHERE id IN ({', '.join('?' * len(ids))})", ids
+        ).fetchall()
+        previous = pd.DataFrame(rows, columns=["id", "title", "content"] + ENG_COLUMNS).set_index("id")
+        old = previous.reindex(df["id"])
+        old.index = df.index
+        # 원문이 비어 있지 않은데 번역이 비어 있으면 (이전 번역 실패) 다시 번역
+        unchanged = (
+            (old["title"] == df["title"]) & (old["content"] == df["content"])
+            & ((old["Eng_title"].fillna("") != "") | (df["title"].str.strip() == ""))
+            & ((old["Eng_Contents"].fillna("") != "") | (df["content"].str.strip() == ""))
+        )
+        df.loc[unchanged, ENG_COLUMNS] = old.loc[unchanged, ENG_COLUMNS]
+        return ~unchanged
+
+    def close(self, remove=False):
+        self.conn.close()
+        if remove and os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+
+def input_fingerprint(input_file) -> dict:
+    stat = os.stat(input_file)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def load_checkpoint(checkpoint_path, input_file, partial_path, encoding):
+    """
+    이어서 진행할 수 있는 checkpoint면 반환 (같은 입력 파일, 작성 중이던 파일이 있을 때)
+    checkpoint는 행 위치로 이어서 진행하므로, 그 사이 입력 파일이 바뀌었거나
+    (최신 글이 앞에 오는 export라 새 글이 생기면 행이 밀림) rows_done번째 행의 id가 last_id가 아니면 처음부터 다시 진행
+    """
+    if not os.path.exists(checkpoint_path) or not os.path.exists(partial_path):
+        return None
+    with open(checkpoint_path, "r", encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("input_file") != os.path.abspath(input_file):
+        return None
+    if checkpoint.get("input") != input_fingerprint(input_file):
+        print("checkpoint 이후 입력 파일이 바뀌어 처음부터 다시 진행 (번역 캐시는 그대로 재사용)")
+        return None
+    if checkpoint["rows_done"]:
+        ids = pd.read_csv(input_file, encoding=encoding, dtype=str, usecols=["id"])["id"]
+        if len(ids) < checkpoint["rows_done"] or ids.iloc[checkpoint["rows_done"] - 1] != checkpoint["last_id"]:
+            print(f"{checkpoint['rows_done']}번째 행이 마지막 id {checkpoint['last_id']}와 달라 처음부터 다시 진행")
+            return None
+    return checkpoint
+
+
+def save_checkpoint(checkpoint_path, checkpoint):
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def translate_file(input_file, output_file, encoding, translator, chunk_size=64, restart=False):
+    """
+    input_file을 chunk_size행씩 읽어 번역하고, chunk마다 output_file.partial에 이어 쓴 뒤 checkpoint 기록
+    - 중간에 멈추면 다음 실행에서 마지막으로 완료된 게시글 다음부터 이어서 진행
+    - 모든 행이 끝나면 output_file을 한 번에 교체
+    원문이 있는데 번역이 빈 행(--on-demand로 미뤘거나 번역에 실패한 행)은 번역한 행 수에 넣지 않고 따로 셈
+    """
+    partial_path = output_file + ".partial"
+    checkpoint_path = output_file + ".checkpoint.json"
+    previous = PreviousTranslations(output_file + ".previous.db")
+
+    checkpoint = None if restart else load_checkpoint(checkpoint_path, input_file, partial_path, encoding)
+    if checkpoint:
+        print(f"checkpoint에서 이어서 진행: {checkpoint['rows_done']}개 완료 (마지막 id {checkpoint['last_id']})")
+        # 마지막 checkpoint 이후에 쓰다 만 부분은 버림
+        with open(partial_path, "r+b") as f:
+            f.truncate(checkpoint["bytes"])
+    else:
+        previous.load(output_file, chunk_size)
+        columns = list(pd.read_csv(input_file, encoding=encoding, nrows=0).columns)
+        columns += [column for column in ENG_COLUMNS if column not in columns]
+        with open(partial_path, "w", encoding="utf-8-sig", newline="") as f:
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+        checkpoint = {
+            "input_file": os.path.abspath(input_file),
+            "input": input_fingerprint(input_file),
+            "rows_done": 0,
+            "last_id": None,
+            "bytes": os.path.getsize(partial_path),
+        }
+        save_checkpoint(checkpoint_path, checkpoint)
+
+    started = time.perf_counter()
+    translated_rows = 0
+    untranslated_rows = 0
+    rows_seen = 0
+    for df in pd.read_csv(input_file, encoding=encoding, dtype=str, chunksize=chunk_size):
+        rows_seen += len(df)
+        if rows_seen <= checkpoint["rows_done"]:
+            continue
+        # chunk 중간에서 끝난 checkpoint면 완료된 행은 건너뜀
+        df = df.iloc[max(0, checkpoint["rows_done"] - (rows_seen - len(df))):].fillna("")
+
+        todo = previous.reuse(df)
+        if todo.any():
+            eng_titles, eng_contents = translate_posts(
+                translator, df.loc[todo, "title"].tolist(), df.loc[todo, "content"].tolist())
+            df.loc[todo, "Eng_title"] = eng_titles
+            df.loc[todo, "Eng_Contents"] = eng_contents
+            untranslated = todo & (
+                ((df["title"].str.strip() != "") & (df["Eng_title"] == ""))
+                | ((df["content"].str.strip() != "") & (df["Eng_Contents"] == ""))
+            )
+            translated_rows += int((todo & ~untranslated).sum())
+            untranslated_rows += int(untranslated.sum())
+
+        with open(partial_path, "a", encoding="utf-8", newline="") as f:
+            df.to_csv(f, index=False, header=False)
+            f.flush()
+            os.fsync(f.fileno())
+        checkpoint.update(
+            rows_done=rows_seen,
+            last_id=df["id"].iloc[-1],
+            bytes=os.path.getsize(partial_path),
+        )
+        save_checkpoint(checkpoint_path, checkpoint)
+        print(f"{rows_seen}행 완료 (마지막 id {checkpoint['last_id']}, 이번 실행에서 번역 {translated_rows}개)")
+
+    os.replace(partial_path, output_file)
+    os.remove(checkpoint_path)
+    previous.close(remove=True)
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    print(f"번역 {translated_rows}개 / {elapsed:.1f}s = {translated_rows / elapsed:.2f} posts/sec")
+    if untranslated_rows:
+        print(f"번역이 비어 있는 행 {untranslated_rows}개 (미뤘거나 실패한 행, 다음 일반 실행에서 해당 행만 번역)")
+    return translated_rows, untranslated_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시글 제목/본문 한국어 -> 영어 번역")
+    parser.add_argument("site", choices=sorted(SITES), help="mu: missyusa, gu: gototheusa")
+    parser.add_argument("--input", help="입력 CSV (기본값: 게시판별 파일)")
+    parser.add_argument("--output", help="출력 CSV (기본값: 게시판별 파일)")
+    parser.add_argument("--encoding", help="입력 CSV 인코딩 (기본값: 게시판별 인코딩)")
+    # 번역 백엔드: marian (로컬 MarianMT, CPU) 또는 google (googletrans 원격 API)
+    parser.add_argument("--backend", choices=["marian", "google"], default="marian")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--chunk-size", type=int, default=64, help="한 번에 읽고 저장하는 행 수")
+    parser.add_argument("--restart", action="store_true", help="checkpoint를 무시하고 처음부터 다시 번역")
+    # 분류기(xlm-roberta-large-xnli)는 한국어를 그대로 분류하므로 영어 열은 export 등에서만 필요함
+    parser.add_argument("--on-demand", action="store_true",
+                        help="영어 원문과 캐시에 있는 번역만 채우고 나머지 번역은 미룸 (다음 일반 실행에서 그 행만 번역)")
+    parser.add_argument("--classifier-demo", action="store_true", help="zero-shot 분류기 예시 실행")
+    args = parser.parse_args()
+
+    if args.classifier_demo:
+        run_classifier_demo()
+
+    default_input, default_output, default_encoding = SITES[args.site]
+    input_file = args.input or default_input
+    output_file = args.output or default_output
+    encoding = args.encoding or default_encoding
+
+    print(f"{input_file} -> {output_file} (백엔드: {args.backend})")
+    cache = TranslationCache()
+    translator = CachedTranslator(create_translator(args.backend, batch_size=args.batch_size), cache,
+                                  cached_only=args.on_demand)
     try:
-        return translator.translate(text, src=src, dest=dest).text
-    except Exception as e:
-        print(f"Exception: {e}")
-        return ""
-
-# 메뉴 출력 및 입력
-print("==== 번역할 게시판 선택 ====")
-print("1. missyusa")
-print("2. gototheusa")
-choice = input("번호를 입력하세요 (1 또는 2): ").strip()
-
-if choice == "1":
-    input_file = "data/mu_posts.csv"
-    output_file = "data/mu_posts_translated.csv"
-    encoding = "euc-kr"
-elif choice == "2":
-    input_file = "data/gu_posts.csv"
-    output_file = "data/gu_posts_translated.csv"
-    encoding = "utf-8"
-else:
-    print("잘못된 입력입니다.")
-    exit(1)
-
-df = pd.read_csv(input_file, encoding=encoding)
-
-# 진행상황 표시하며 번역
-eng_titles = []
-eng_contents = []
-total = len(df)
-for i, row in df.iterrows():
-    print(f"{i+1}/{total} 번역중...")  # 진행상황 출력
-    eng_titles.append(safe_translate(row["title"]))
-    eng_contents.append(safe_translate(row["content"]))
-
-# 번역 결과 저장할 컬럼 추가
-df["Eng_title"] = eng_titles
-df["Eng_Contents"] = eng_contents
-
-# 결과 저장 (utf-8-sig 인코딩 사용 - 한국어/Excel 호환성)
-df.to_csv(output_file, index=False, encoding="utf-8-sig")
-print(f"{output_file} 파일을 확인하세요.") 
\ No newline at end of file
+        translate_file(input_file, output_file, encoding, translator, args.chunk_size, args.restart)
+    finally:
+        cache.close()
+    print(f"번역 캐시: {translator.hits}개 재사용, {translator.misses}개 새로 번역")
+    if translator.deferred:
+        print(f"번역을 미룬 텍스트 {translator.deferred}개 (--on-demand 없이 실행하면 해당 행만 번역)")
+    print(f"{output_file} 파일을 확인하세요.")
+
+
+if __name__ == "__main__":
+    main()
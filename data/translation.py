@@ -0,0 +1,156 @@
+import time
+
+from language_id import needs_translation
+from text_chunker import approx_tokens, chunk_text, tokenizer_counter
+
+# 한국어 -> 영어 MarianMT 모델 (sentencepiece 토크나이저)
+DEFAULT_MODEL = "Helsinki-NLP/opus-mt-ko-en"
+
+
+def is_blank(text) -> bool:
+    return not isinstance(text, str) or not text.strip()
+
+
+class MarianTranslator:
+    """
+    로컬 MarianMT 번역기 (CPU)
+    - 긴 본문은 문장 단위로 chunk_tokens 토큰 이하의 chunk로 나눠 번역한 뒤 다시 이어 붙임
+      (모델 최대 길이에서 잘리지 않고, 한 번의 호출 시간이 가장 긴 게시글에 좌우되지 않음)
+    - 모든 chunk를 토큰 길이순으로 정렬해 비슷한 길이끼리 batch_size개씩 묶고,
+      batch마다 그 안의 가장 긴 chunk 길이까지만 padding (dynamic padding)
+    - 결과는 입력 순서대로 반환, 빈 텍스트는 ""
+    - 모델은 처음 번역할 때 불러옴 (캐시만 쓰는 실행에서는 불러오지 않음)
+    """
+    name = 'marian'
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, batch_size: int = 16, max_length: int = 512,
+                 num_beams: int = 1, device: str = 'cpu', chunk_tokens: int = 200):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.num_beams = num_beams
+        self.device = device
+        self.chunk_tokens = chunk_tokens
+        self.model = None
+
+    @property
+    def cache_id(self) -> str:
+        """번역 결과를 바꾸는 설정 (번역 캐시 키에 포함)"""
+        return (f"{self.name}:{self.model_name}:beams={self.num_beams}:max_length={self.max_length}"
+                f":chunk_tokens={self.chunk_tokens}")
+
+    def load(self):
+        if self.model is not None:
+            return
+        import torch
+        from transformers import MarianMTModel, MarianTokenizer
+
+        self.torch = torch
+        self.tokenizer = MarianTokenizer.from_pretrained(self.model_name)
+        self.model = MarianMTModel.from_pretrained(self.model_name).to(self.device).eval()
+        self.count_tokens = tokenizer_counter(self.tokenizer)
+
+    def translate(self, texts: list) -> list:
+        if all(is_blank(text) for text in texts):
+            return [""] * len(texts)
+        self.load()
+        # 텍스트를 chunk로 펼침 (owners[k]: chunk k가 속한 텍스트 번호)
+        chunks = []
+        owners = []
+        for i, text in enumerate(texts):
+            if is_blank(text):
+                continue
+            for chunk in chunk_text(text, self.chunk_tokens, self.count_tokens):
+                chunks.append(chunk)
+                owners.append(i)
+        if not chunks:
+            return [""] * len(texts)
+
+        encoded = self.tokenizer(chunks, truncation=True, max_length=self.max_length)['input_ids']
+        translated = [""] * len(chunks)
+        # 길이순 정렬 후 batch로 나눔 (같은 batch 안의 padding이 최소가 되도록)
+        order = sorted(range(len(chunks)), key=lambda k: len(encoded[k]))
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            inputs = self.tokenizer.pad({'input_ids': [encoded[k] for k in batch]}, padding='longest', return_tensors='pt')
+            inputs = {key: value.to(self.device) for key, value in inputs.items()}
+            with self.torch.inference_mode():
+                outputs = self.model.generate(**inputs, num_beams=self.num_beams, max_new_tokens=self.max_length)
+            for k, text in zip(batch, self.tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+                translated[k] = text
+
+        pieces = [[] for _ in texts]
+        for owner, text in zip(owners, translated):
+            pieces[owner].append(text)
+        return [' '.join(parts) for parts in pieces]
+
+
+class GoogleTranslator:
+    """
+    googletrans 원격 번역 (선택 사항)
+    긴 본문은 문장 단위로 chunk_tokens 이하로 나눠 요청하여 요청 크기 제한/지연을 피함
+    """
+    name = 'google'
+
+    def __init__(self, src: str = 'ko', dest: str = 'en', chunk_tokens: int = 2000):
+        self.translator = None
+        self.model_name = 'googletrans'
+        self.src = src
+        self.dest = dest
+        self.chunk_tokens = chunk_tokens
+
+    @property
+    def cache_id(self) -> str:
+        """번역 결과를 바꾸는 설정 (번역 캐시 키에 포함)"""
+        return f"{self.name}:{self.model_name}:chunk_tokens={self.chunk_tokens}"
+
+    def load(self):
+        if self.translator is None:
+            from googletrans import Translator
+
+            self.translator = Translator()
+
+    def safe_translate(self, text) -> str:
+        if is_blank(text):
+            return ""
+        self.load()
+        try:
+            return self.translator.translate(text, src=self.src, dest=self.dest).text
+        except Exception as e:
+            print(f"Exception: {e}")
+            return ""
+
+    def translate(self, texts: list) -> list:
+        results = []
+        for text in texts:
+            chunks = chunk_text(text, self.chunk_tokens, approx_tokens) if not is_blank(text) else []
+            results.append(' '.join(self.safe_translate(chunk) for chunk in chunks))
+        return results
+
+
+def create_translator(backend: str = 'marian', **kwargs):
+    """backend: marian (로컬 모델, 기본값) 또는 google (googletrans)"""
+    if backend == 'marian':
+        return MarianTranslator(**kwargs)
+    if backend == 'google':
+        return GoogleTranslator(**{key: value for key, value in kwargs.items() if key == 'chunk_tokens'})
+    raise ValueError(f"알 수 없는 번역 백엔드: {backend}")
+
+
+def translate_posts(translator, titles: list, contents: list) -> tuple:
+    """
+    제목과 본문을 한 번에 번역 (제목/본문을 한 목록으로 합쳐 batch를 채움)
+    Returns: (eng_titles, eng_contents)
+    """
+    started = time.perf_counter()
+    texts = list(titles) + list(contents)
+    # 한글이 없는 텍스트(이미 영어, 숫자/기호뿐)는 번역하지 않고 그대로 씀
+    todo = [i for i, text in enumerate(texts) if needs_translation(text)]
+    translated = ["" if is_blank(text) else text for text in texts]
+    for i, text in zip(todo, translator.translate([texts[i] for i in todo]) if todo else []):
+        translated[i] = text
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    skipped = sum(1 for text in texts if not is_blank(text)) - len(todo)
+    print(f"번역 속도: {len(titles)}개 게시글 / {elapsed:.1f}s = {len(titles) / elapsed:.2f} posts/sec "
+          f"({translator.name}, 영어 등 번역 생략 {skipped}개)")
+    return translated[:len(titles)], translated[len(titles):]
@@ -0,0 +1,75 @@
+import hashlib
+import os
+import sqlite3
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translation_cache.db")
+
+
+def cache_key(text: str, src: str, dest: str, model_id: str) -> str:
+    """원문 + 언어쌍 + 번역 백엔드/모델이 모두 같을 때만 같은 키"""
+    return hashlib.sha256(f"{src}>{dest}|{model_id}|{text}".encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """번역 결과 캐시 (SQLite, 키: cache_key)"""
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, translation TEXT)')
+
+    def get_many(self, keys: list) -> dict:
+        found = {}
+        keys = list(set(keys))
+        # SQLite 변수 개수 제한 때문에 나눠서 조회
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, translation FROM translations WHERE key IN ({', '.join('?' * len(chunk))})", chunk)
+            found.update(rows)
+        return found
+
+    def put_many(self, items: dict):
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO translations (key, translation) VALUES (?, ?)', items.items())
+
+    def close(self):
+        self.conn.close()
+
+
+class CachedTranslator:
+    """
+    번역기 앞에 캐시를 둠: 캐시에 없는 텍스트만 (중복 없이) 번역하고 결과를 캐시에 저장
+    실패해서 빈 문자열이 된 번역은 저장하지 않아 다음 실행에서 다시 시도함
+    cached_only=True면 캐시에 있는 번역만 쓰고 나머지는 빈 문자열로 남김 (번역 모델을 불러오지 않음)
+    """
+    def __init__(self, translator, cache: TranslationCache, src: str = 'ko', dest: str = 'en',
+                 cached_only: bool = False):
+        self.translator = translator
+        self.cache = cache
+        self.name = translator.name
+        # 모델 이름과 num_beams, max_length, chunk_tokens 등 결과를 바꾸는 설정이 모두 같을 때만 캐시를 재사용
+        self.model_id = translator.cache_id
+        self.src = src
+        self.dest = dest
+        self.cached_only = cached_only
+        self.hits = 0
+        self.misses = 0
+        self.deferred = 0
+
+    def translate(self, texts: list) -> list:
+        keys = [cache_key(text, self.src, self.dest, self.model_id) if isinstance(text, str) and text.strip() else None
+                for text in texts]
+        cached = self.cache.get_many([key for key in keys if key])
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key and key not in cached:
+                missing.setdefault(key, text)
+        self.hits += sum(1 for key in keys if key in cached)
+        if self.cached_only:
+            self.deferred += len(missing)
+        elif missing:
+            self.misses += len(missing)
+            translated = dict(zip(missing, self.translator.translate(list(missing.values()))))
+            self.cache.put_many({key: value for key, value in translated.items() if value})
+            cached.update(translated)
+        return [cached.get(key, "") if key else "" for key in keys]
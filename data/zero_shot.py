@@ -0,0 +1,213 @@
+import argparse
+import math
+import os
+
+from text_chunker import chunk_text, tokenizer_counter
+
+DEFAULT_NLI_MODEL = "joeddav/xlm-roberta-large-xnli"
+# transformers zero-shot-classification pipeline의 기본 가설 문장
+DEFAULT_HYPOTHESIS = "This example is {}."
+# torch: fp32 (기존 pipeline과 같은 모델), torch-int8: Linear 층 동적 int8 양자화 (CPU 전용)
+# onnx: ONNX Runtime fp32, onnx-int8: ONNX Runtime + 동적 int8 양자화 모델
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+DEFAULT_ONNX_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "onnx")
+
+
+def detect_device() -> str:
+    """GPU가 있으면 cuda:0, 없으면 (torch가 없어도) cpu"""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda:0" if torch.cuda.is_available() else "cpu"
+
+
+def resolve_device(device) -> str:
+    """auto / pipeline식 번호(0 이상이면 GPU 번호, -1이면 CPU) / cpu, cuda:0 같은 문자열"""
+    if device is None or device == "auto":
+        return detect_device()
+    if isinstance(device, int):
+        return f"cuda:{device}" if device >= 0 else "cpu"
+    return device
+
+
+def export_onnx(model_name: str = DEFAULT_NLI_MODEL, onnx_dir: str = DEFAULT_ONNX_DIR, quantize: bool = False) -> str:
+    """
+    NLI 모델을 ONNX로 내보내고 (quantize면 int8 동적 양자화 모델도 만듦) 파일 경로 반환
+    이미 만들어 둔 파일이 있으면 그대로 사용
+    """
+    out_dir = os.path.join(onnx_dir, model_name.replace("/", "--"))
+    fp32_path = os.path.join(out_dir, "model.onnx")
+    int8_path = os.path.join(out_dir, "model.int8.onnx")
+    if not os.path.exists(fp32_path):
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        os.makedirs(out_dir, exist_ok=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+        dummy = tokenizer("전제 문장입니다.", DEFAULT_HYPOTHESIS.format("가설"), return_tensors="pt")
+        print(f"[INFO] {model_name} -> {fp32_path} ONNX 내보내기")
+        # 2GB가 넘는 가중치(large 모델)는 torch가 같은 디렉토리의 외부 데이터 파일로 나눠 저장함
+        # export(tracing)는 inference_mode 안에서 실패할 수 있으므로 no_grad 사용
+        with torch.no_grad():
+            torch.onnx.export(
+                model, (dummy["input_ids"], dummy["attention_mask"]), fp32_path,
+                input_names=["input_ids", "attention_mask"], output_names=["logits"],
+                dynamic_axes={"input_ids": {0: "batch", 1: "sequence"},
+                              "attention_mask": {0: "batch", 1: "sequence"},
+                              "logits": {0: "batch"}},
+                opset_version=14,
+            )
+    if not quantize:
+        return fp32_path
+    if not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        print(f"[INFO] {fp32_path} -> {int8_path} int8 동적 양자화")
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+class ZeroShotEngine:
+    """
+    NLI 모델로 여러 게시글을 한꺼번에 zero-shot 분류
+    - 게시글은 문장 단위 chunk(chunk_tokens 이하)로 나누고, chunk x 후보 라벨마다 (전제, 가설) 쌍을 만듦
+    - 모든 쌍을 토큰 길이순으로 정렬해 batch_size개씩 묶고 batch 안의 가장 긴 쌍 길이까지만 padding
+    - chunk마다 후보 라벨의 entailment logit을 softmax (pipeline의 multi_label=False와 같음),
+      게시글 점수는 chunk 토큰 수로 가중 평균
+    - backend: BACKENDS 중 하나, device: auto면 GPU가 있을 때만 GPU 사용
+    - intra_op_threads / inter_op_threads: 연산 하나 / 연산 사이 병렬 스레드 수 (0이면 라이브러리 기본값)
+    forward_passes: 지금까지 모델에 넣은 (전제, 가설) 쌍 수, last_passes: 마지막 score 호출의 요청별 쌍 수
+    """
+    def __init__(self, model_name: str = DEFAULT_NLI_MODEL, batch_size: int = 8, max_length: int = 512,
+                 chunk_tokens: int = 400, device="auto", hypothesis_template: str = DEFAULT_HYPOTHESIS,
+                 backend: str = "torch", intra_op_threads: int = 0, inter_op_threads: int = 0,
+                 onnx_dir: str = DEFAULT_ONNX_DIR):
+        from transformers import AutoConfig, AutoTokenizer
+
+        if backend not in BACKENDS:
+            raise ValueError(f"알 수 없는 추론 백엔드: {backend} ({', '.join(BACKENDS)})")
+        self.backend = backend
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.chunk_tokens = chunk_tokens
+        self.device = resolve_device(device)
+        self.hypothesis_template = hypothesis_template
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.count_tokens = tokenizer_counter(self.tokenizer)
+        label2id = AutoConfig.from_pretrained(model_name).label2id
+        self.entailment_id = next((i for label, i in label2id.items() if label.lower().startswith("entail")), -1)
+        self.forward_passes = 0
+        self.last_passes = []
+
+        self.session = None
+        self.model = None
+        if backend.startswith("onnx"):
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            if intra_op_threads:
+                options.intra_op_num_threads = intra_op_threads
+            # 실행 모드는 기본값(ORT_SEQUENTIAL)을 유지 (inter-op 스레드 수는 병렬 실행 모드에서만 쓰임)
+            if inter_op_threads:
+                options.inter_op_num_threads = inter_op_threads
+            providers = ["CPUExecutionProvider"]
+            if self.device.startswith("cuda") and "CUDAExecutionProvider" in ort.get_available_providers():
+                providers.insert(0, "CUDAExecutionProvider")
+            path = export_onnx(model_name, onnx_dir, quantize=backend == "onnx-int8")
+            self.session = ort.InferenceSession(path, options, providers=providers)
+            self.input_names = [node.name for node in self.session.get_inputs()]
+        else:
+            import torch
+            from transformers import AutoModelForSequenceClassification
+
+            self.torch = torch
+            if intra_op_threads:
+                torch.set_num_threads(intra_op_threads)
+            if inter_op_threads:
+                try:
+                    torch.set_num_interop_threads(inter_op_threads)
+                except RuntimeError:
+                    # 이미 병렬 작업을 시작한 프로세스에서는 바꿀 수 없음
+                    print("[WARNING] inter-op 스레드 수는 프로세스 시작 직후에만 바꿀 수 있습니다.")
+            model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+            if backend == "torch-int8":
+                # 동적 양자화 모델은 CPU에서만 실행됨
+                self.device = "cpu"
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.model = model.to(self.device)
+        print(f"[INFO] zero-shot 추론 백엔드: {backend} ({self.device})")
+
+    def entailment_logits(self, features: list) -> list:
+        """토큰화된 (전제, 가설) 쌍 batch -> 쌍마다 entailment logit"""
+        if self.session is not None:
+            inputs = self.tokenizer.pad(features, padding="longest", return_tensors="np")
+            logits = self.session.run(None, {name: inputs[name].astype("int64") for name in self.input_names})[0]
+            return logits[:, self.entailment_id].tolist()
+        inputs = self.tokenizer.pad(features, padding="longest", return_tensors="pt")
+        inputs = {key: value.to(self.device) for key, value in inputs.items()}
+        with self.torch.inference_mode():
+            return self.model(**inputs).logits[:, self.entailment_id].tolist()
+
+    def score(self, requests: list) -> list:
+        """
+        requests: [(text, [후보 라벨, ...]), ...]
+        Returns: 요청마다 {라벨: 점수} (점수 합 1), 빈 텍스트나 후보 라벨이 없으면 {}
+        """
+        # (요청 번호, chunk 번호) -> chunk 토큰 수, 쌍 목록: (요청 번호, chunk 번호, 라벨)
+        weights = {}
+        self.last_passes = [0] * len(requests)
+        pairs = []
+        premises = []
+        hypotheses = []
+        for r, (text, labels) in enumerate(requests):
+            if not isinstance(text, str) or not text.strip() or not labels:
+                continue
+            for c, chunk in enumerate(chunk_text(text, self.chunk_tokens, self.count_tokens)):
+                weights[r, c] = self.count_tokens(chunk) or 1
+                for label in labels:
+                    pairs.append((r, c, label))
+                    self.last_passes[r] += 1
+                    premises.append(chunk)
+                    hypotheses.append(self.hypothesis_template.format(label))
+
+        logits = [0.0] * len(pairs)
+        if pairs:
+            encoded = self.tokenizer(premises, hypotheses, truncation="only_first", max_length=self.max_length)
+            features = [{key: encoded[key][k] for key in encoded} for k in range(len(pairs))]
+            order = sorted(range(len(pairs)), key=lambda k: len(features[k]["input_ids"]))
+            for start in range(0, len(order), self.batch_size):
+                batch = order[start:start + self.batch_size]
+                for k, value in zip(batch, self.entailment_logits([features[k] for k in batch])):
+                    logits[k] = value
+            self.forward_passes += len(pairs)
+
+        # chunk마다 라벨 softmax 후 chunk 토큰 수로 가중 평균
+        chunk_logits = {}
+        for (r, c, label), value in zip(pairs, logits):
+            chunk_logits.setdefault((r, c), {})[label] = value
+        totals = {}
+        for r, c in weights:
+            totals[r] = totals.get(r, 0) + weights[r, c]
+        results = [{} for _ in requests]
+        for (r, c), values in chunk_logits.items():
+            top = max(values.values())
+            exp = {label: math.exp(value - top) for label, value in values.items()}
+            norm = sum(exp.values())
+            for label, value in exp.items():
+                results[r][label] = results[r].get(label, 0.0) + value / norm * weights[r, c] / totals[r]
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="zero-shot NLI 모델 ONNX 내보내기 / int8 양자화")
+    parser.add_argument("--model", default=DEFAULT_NLI_MODEL)
+    parser.add_argument("--onnx-dir", default=DEFAULT_ONNX_DIR)
+    parser.add_argument("--quantize", action="store_true", help="int8 동적 양자화 모델도 만듦")
+    args = parser.parse_args()
+    print(f"[INFO] {export_onnx(args.model, args.onnx_dir, args.quantize)}")
+
+
+if __name__ == "__main__":
+    main()
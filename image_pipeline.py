@@ -0,0 +1,175 @@
+"""
+게시글 이미지 수집 + 중복 이미지 탐지
+
+    python image_pipeline.py --image-dir data/images --workers 8 --max-distance 6
+
+1. 게시글 CSV의 image_urls에서 아직 받지 않은 URL만 FetchEngine(제한된 커넥션 풀/워커)으로 동시에 받음
+2. 이미지는 sha256 기준으로 한 번만 저장 (common.image_store.ImageStore)
+3. perceptual hash(common.phash)로 사이트/게시글에 걸쳐 비슷한 이미지를 찾아
+   여러 게시글에 쓰인 이미지 묶음을 data/image_duplicates.csv로 저장
+perceptual hash에는 Pillow가 필요하다 (없으면 이미지 저장과 완전히 같은 이미지 탐지만 함).
+"""
+import argparse
+import csv
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from common.fetch_engine import FetchEngine
+from common.image_store import ImageStore
+from common.phash import Image, PhashIndex, phash
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0',
+    # 네이버 이미지 서버는 카페 Referer가 없으면 막는 경우가 있음
+    'Referer': 'https://cafe.naver.com/',
+}
+
+
+def load_post_images(site, csv_path, encoding):
+    """Returns: [(site, post_id, url), ...]"""
+    if not os.path.exists(csv_path):
+        print(f"[WARNING] {csv_path} 파일이 없습니다.")
+        return []
+    df = pd.read_csv(csv_path, encoding=encoding, dtype=str).fillna('')
+    if 'image_urls' not in df.columns:
+        print(f"[INFO] {csv_path}에는 image_urls 컬럼이 없습니다.")
+        return []
+    rows = []
+    for post_id, image_urls in zip(df['id'], df['image_urls']):
+        for url in image_urls.split(','):
+            url = url.strip()
+            if url:
+                rows.append((site, post_id, url))
+    return rows
+
+
+def fetch_image(engine, store, url):
+    """Returns: (url, status, error, sha256, path, size, content_type, phash)"""
+    try:
+        resp = engine.get(url)
+    except Exception as e:
+        return url, None, str(e), None, None, None, None, None
+    content_type = resp.headers.get('Content-Type', '')
+    if resp.status_code != 200:
+        return url, resp.status_code, f"HTTP {resp.status_code}", None, None, None, None, None
+    if not content_type.startswith('image/'):
+        # 이미지가 아닌 응답(안내 페이지 등)은 다시 요청하지 않도록 415로 기록
+        return url, 415, f"not an image ({content_type})", None, None, None, None, None
+    sha256, path = store.write_blob(resp.content, content_type)
+    return url, 200, None, sha256, path, len(resp.content), content_type, phash(resp.content)
+
+
+def fetch_new_images(store, urls, workers, requests_per_second):
+    seen = store.fetched_urls()
+    new_urls = [url for url in dict.fromkeys(urls) if url not in seen]
+    print(f"[INFO] 이미지 URL {len(set(urls))}개 중 새 URL {len(new_urls)}개")
+    if not new_urls:
+        return
+    engine = FetchEngine(max_workers=workers, requests_per_second=requests_per_second, burst=workers, headers=HEADERS)
+    try:
+        futures = [engine.submit(fetch_image, engine, store, url) for url in new_urls]
+        results = []
+        for future in futures:
+            results.append(future.result())
+            # 중간에 멈춰도 받은 만큼은 남도록 나눠서 기록
+            if len(results) >= 100:
+                store.record(results)
+                results = []
+        store.record(results)
+    finally:
+        engine.close()
+    print(f"[INFO] 이미지 수집: {engine.throughput(len(new_urls))}")
+
+
+def fill_missing_phashes(store):
+    """Pillow 없이 받아 둔 이미지의 perceptual hash 계산"""
+    if Image is None:
+        print("[WARNING] Pillow가 없어 perceptual hash를 계산하지 않습니다 (같은 파일만 중복으로 탐지).")
+        return
+    rows = []
+    for sha256, path in store.missing_phash():
+        with open(path, 'rb') as f:
+            value = phash(f.read())
+        if value is not None:
+            rows.append((sha256, value))
+    if rows:
+        store.set_phashes(rows)
+        print(f"[INFO] perceptual hash {len(rows)}개 추가 계산")
+
+
+def find_duplicate_groups(store, max_distance):
+    """
+    여러 게시글에 쓰인 같은/비슷한 이미지 묶음
+    Returns: [[(sha256, site, post_id, url), ...], ...]
+    """
+    # 밴드 수(최대 64)는 max_distance보다 커야 후보를 놓치지 않음
+    if not 0 <= max_distance < 64:
+        raise ValueError(f"max_distance는 0 이상 63 이하여야 합니다: {max_distance}")
+    posts_by_image = store.posts_by_image()
+    hashes = store.phashes()
+
+    # 비슷한 이미지끼리 union-find로 묶음
+    parent = {sha256: sha256 for sha256 in posts_by_image}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    bands = next(b for b in (1, 2, 4, 8, 16, 32, 64) if b > max_distance)
+    index = PhashIndex(bands=bands)
+    for sha256, value in hashes.items():
+        if sha256 not in parent:
+            continue
+        for other, _ in index.query(value, max_distance):
+            parent[find(sha256)] = find(other)
+        index.add(sha256, value)
+
+    groups = {}
+    for sha256, posts in posts_by_image.items():
+        for site, post_id, url in posts:
+            groups.setdefault(find(sha256), []).append((sha256, site, post_id, url))
+    return [group for group in groups.values() if len({(site, post_id) for _, site, post_id, _ in group}) > 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='게시글 이미지 수집 및 중복 이미지 탐지')
+    parser.add_argument('--gu-csv', default=os.path.join('data', 'gu_posts.csv'))
+    parser.add_argument('--mu-csv', default=os.path.join('data', 'mu_posts.csv'))
+    parser.add_argument('--image-dir', default=os.path.join('data', 'images'))
+    parser.add_argument('--report', default=os.path.join('data', 'image_duplicates.csv'))
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--rps', type=float, default=10.0)
+    parser.add_argument('--max-distance', type=int, default=6, help='비슷한 이미지로 볼 최대 hamming 거리 (64비트 중)')
+    args = parser.parse_args()
+    if not 0 <= args.max_distance < 64:
+        parser.error('--max-distance는 0 이상 63 이하여야 합니다.')
+
+    rows = load_post_images('gotousa', args.gu_csv, 'utf-8-sig') + load_post_images('missyusa', args.mu_csv, 'euc-kr')
+    store = ImageStore(args.image_dir)
+    try:
+        store.add_post_images(rows)
+        fetch_new_images(store, [url for _, _, url in rows], args.workers, args.rps)
+        fill_missing_phashes(store)
+        groups = find_duplicate_groups(store, args.max_distance)
+    finally:
+        store.close()
+
+    with open(args.report, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['group', 'sha256', 'site', 'post_id', 'url'])
+        for number, group in enumerate(groups, start=1):
+            for sha256, site, post_id, url in group:
+                writer.writerow([number, sha256, site, post_id, url])
+    print(f"[INFO] 여러 게시글에 쓰인 이미지 묶음 {len(groups)}개 -> {args.report}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,126 +1,254 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import yaml
 import os
 import time
 from datetime import datetime
 import urllib.parse
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.fetch_engine import FetchEngine
+from common.fetch_queue import FetchQueue, split_keywords
+from common.fixtures import open_recorder
+from common.html_parser import HtmlParser, parser_from_config
+from common.keyword_scheduler import ExportTimer
+from common.post_store import PostStore, default_store_path
+from common.rate_control import rate_controller_from_config
+from common.watermark import load_watermarks
 
 CONFIG_PATH = 'config.yaml'
 
+CSV_COLUMNS = ['id', 'url', 'title', 'content', 'keyword', 'crawled_at']
+
+# 서버가 과부하일 때 200으로 돌려주는 오류 페이지 문구
+SERVER_ERROR_MARKER = "An error occurred on the server"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0',
+    'Referer': 'https://www.missyusa.com/',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+}
+
 # config 읽기
 def load_config():
     with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f)
 
-def get_post_ids(data_path):
-    if not os.path.exists(data_path):
-        return set()
-    df = pd.read_csv(data_path, encoding='euc-kr')
-    return set(df['id'].astype(str))
-
-def save_posts(posts):
-    df = pd.DataFrame(posts)
-    if os.path.exists(DATA_PATH):
-        df_old = pd.read_csv(DATA_PATH, encoding='euc-kr')
-        df = pd.concat([df_old, df], ignore_index=True)
-        df = df.drop_duplicates(subset=['id'])
-    os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
-    df.to_csv(DATA_PATH, index=False, encoding='euc-kr', errors='ignore')
-
-def get_post_content(post_url):
+def open_post_store(config):
+    """게시글 저장소를 열고, 비어 있으면 기존 CSV를 가져옴"""
+    data_path = config['missyusa']['data_path']
+    store = PostStore(config['missyusa'].get('store_path', default_store_path(data_path)))
+    store.import_csv(data_path, encoding='euc-kr')
+    return store
+
+def export_posts(store, config):
+    """번역/분류 단계가 읽는 CSV로 내보내기"""
+    if config['missyusa'].get('export_csv', True):
+        store.export_csv(config['missyusa']['data_path'], CSV_COLUMNS, encoding='euc-kr', errors='ignore')
+
+def save_posts(store, posts, config, export=True):
+    changed = store.upsert(posts)
+    print(f"[INFO] {changed} posts saved.")
+    # 번역/분류 단계는 CSV를 읽으므로 변경이 있을 때만 내보냄 (스케줄러는 사이클마다 한 번 내보냄)
+    if changed and export:
+        export_posts(store, config)
+    return changed
+
+def parse_listing_links(html, parser):
+    """검색 결과 페이지에서 게시글 링크 추출 (중복 없이, 실제 구조에 맞게). Returns: [(href, title), ...]"""
+    doc = parser.parse(html)
+    links = []
+    seen = set()
+    for td in parser.select(doc, 'td[align="left"]'):
+        a = parser.select_one(td, 'a[href]')
+        if a is None:
+            continue
+        href = parser.attr(a, 'href')
+        if 'board_read.asp' in href and href not in seen:
+            seen.add(href)
+            links.append((href, parser.text(a, strip=True)))
+    return links
+
+def parse_post_content(html, parser):
+    """게시글 페이지에서 본문 추출 (페이지가 작아 부분 파싱(only)이 빨라지지 않으므로 전체를 파싱)"""
+    doc = parser.parse(html)
+    content_div = parser.select_one(doc, 'div.detail_content')
+    return parser.text(content_div, "\n", strip=True) if content_div is not None else ''
+
+def get_post_content(post_url, engine=None, parser=None):
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0',
-            'Referer': 'https://www.missyusa.com/',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
-        }
-        resp = requests.get(post_url, headers=headers)
-        resp.encoding = 'euc-kr'
-        soup = BeautifulSoup(resp.text, 'html.parser')
-        content_div = soup.select_one('div.detail_content')
-        if content_div:
-            return content_div.get_text("\n", strip=True)
+        if engine is not None:
+            resp = engine.get(post_url, encoding='euc-kr')
         else:
-            return ''
+            resp = requests.get(post_url, headers=HEADERS)
+            resp.encoding = 'euc-kr'
+        return parse_post_content(resp.text, parser or HtmlParser())
     except Exception as e:
         print(f"[ERROR] Failed to fetch content from {post_url}: {e}")
         return ''
 
-def crawl_posts(config):
-    data_path = config['missyusa']['data_path']
-    existing_ids = get_post_ids(data_path)
-    all_new_posts = []
-    for keyword in config['missyusa']['keywords']:
-        page = 1
-        while True:
-            encoded_keyword = urllib.parse.quote(keyword, encoding='euc-kr')
-            url = config['missyusa']['search_url'].format(keyword=encoded_keyword, page=page)
-            headers = {
-                'User-Agent': 'Mozilla/5.0',
-                'Referer': 'https://www.missyusa.com/',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
-            }
-            try:
-                resp = requests.get(url, headers=headers)
-                resp.encoding = 'euc-kr'
-                # 에러 페이지 감지
-                if "An error occurred on the server" in resp.text:
-                    print(f"[WARNING] Server error on page {page}, skipping...")
-                    page += 1
-                    time.sleep(2)
-                    continue
-                soup = BeautifulSoup(resp.text, 'html.parser')
-            except Exception as e:
-                print(f"[ERROR] Exception on page {page}: {e}, skipping...")
-                page += 1
-                time.sleep(2)
-                continue
+def create_fetch_engine(config):
+    mu_config = config['missyusa']
+    return FetchEngine(
+        max_workers=mu_config.get('max_workers', 4),
+        headers=HEADERS,
+        recorder=open_recorder(config),
+        rate_controller_factory=lambda: rate_controller_from_config(mu_config),
+        throttle_markers=(SERVER_ERROR_MARKER,),
+    )
 
-            # 게시글 링크 추출 (중복 없이, 실제 구조에 맞게)
-            post_links = []
-            seen = set()
-            for td in soup.find_all('td', attrs={'align': 'left'}):
-                a = td.find('a', href=True)
-                if a and 'board_read.asp' in a['href']:
-                    href = a['href']
-                    if href not in seen:
-                        seen.add(href)
-                        post_links.append(a)
-            print(f"[DEBUG] Found {len(post_links)} post links on page {page}")
-
-            if not post_links:
-                break
+def crawl_posts(config, engine=None):
+    store = open_post_store(config)
+    engine = engine or create_fetch_engine(config)
+    try:
+        crawl_keywords(config, config['missyusa']['keywords'], store, engine, load_watermarks(config))
+    finally:
+        engine.close()
+        store.close()
 
-            new_posts = []
-            for a in post_links:
-                href = a['href']
-                post_id = href.split('idx=')[-1].split('&')[0]
-                if post_id in existing_ids:
-                    continue
-                post_url = 'https://www.missyusa.com' + href if href.startswith('/') else href
-                title = a.get_text(strip=True)
-                content = get_post_content(post_url)
-                new_posts.append({
-                    'id': post_id,
-                    'url': post_url,
-                    'title': title,
-                    'content': content,
-                    'keyword': keyword,
-                    'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-            if new_posts:
-                print(f"[INFO] {len(new_posts)} new posts saved.")
-                all_new_posts.extend(new_posts)
-            else:
-                print("[INFO] No new posts found on this page.")
-            page += 1
-            time.sleep(1)  # 페이지당 딜레이
+def crawl_keywords(config, keywords, store, engine, watermarks, existing_ids=None, queue=None, export=True):
+    """
+    키워드들의 새 게시글을 수집해 저장
+    existing_ids / queue: 스케줄러에서 동시에 실행되는 키워드 작업끼리 공유 (없으면 이번 호출에서만 사용)
+    Returns: {keyword: 새로 수집한 게시글 수}
+    """
+    since = engine.mark()
+    if existing_ids is None:
+        existing_ids = store.ids()
+    # 본문 요청은 워커 스레드에서 진행되고, 그동안 다음 목록 페이지를 파싱
+    pending = []
+    # 여러 키워드에 걸쳐 같은 게시글은 한 번만 요청
+    if queue is None:
+        queue = FetchQueue()
+    for keyword in keywords:
+        crawl_keyword(config, keyword, engine, existing_ids, pending, watermarks, queue)
+    all_new_posts = []
+    for post, future in pending:
+        post['content'] = future.result()
+        all_new_posts.append(post)
+    print(f"[INFO] Throughput: {engine.throughput(len(pending), since)}")
+    print(f"[INFO] Avoided {queue.avoided} duplicate fetches across keywords.")
     if all_new_posts:
-        save_posts(all_new_posts)
+        save_posts(store, all_new_posts, config, export)
+        # 저장한 게시글은 이후 existing_ids로 건너뛰므로 큐에서 뺌
+        existing_ids.update(post['id'] for post in all_new_posts)
+        queue.discard([post['id'] for post in all_new_posts])
     else:
         print("[INFO] No new posts found.")
+    counts = {keyword: 0 for keyword in keywords}
+    for post in all_new_posts:
+        counts[split_keywords(post['keyword'])[0]] += 1
+    return counts
+
+class SiteRunner:
+    """
+    스케줄러(scheduler.py)용 missyusa 작업 실행기
+    저장소와 fetch 엔진을 계속 열어 두고 키워드 하나씩 수집
+    - 동시에 실행되는 키워드 작업들은 existing_ids와 FetchQueue를 공유 (같은 게시글은 한 번만 요청)
+    - CSV는 새 게시글을 저장한 작업이 끝날 때 export_interval_minutes마다 한 번 내보냄 (common.keyword_scheduler.ExportTimer)
+    """
+    name = 'missyusa'
+
+    def __init__(self, config, watermarks):
+        self.config = config
+        self.keywords = config['missyusa']['keywords']
+        self.store = open_post_store(config)
+        self.engine = create_fetch_engine(config)
+        self.watermarks = watermarks
+        self.existing_ids = self.store.ids()
+        self.queue = FetchQueue()
+        self.lock = threading.Lock()
+        self.export_timer = ExportTimer(config['missyusa'].get('scheduler', {}))
+        self.unexported = 0
+
+    def run(self, keyword) -> int:
+        """Returns: 새로 수집한 게시글 수"""
+        new_count = 0
+        try:
+            new_count = crawl_keywords(self.config, [keyword], self.store, self.engine, self.watermarks,
+                                       self.existing_ids, self.queue, export=False)[keyword]
+            return new_count
+        finally:
+            self.end_job(keyword, new_count)
+
+    def end_job(self, keyword, new_count):
+        with self.lock:
+            self.unexported += new_count
+            if not self.unexported or not self.export_timer.due():
+                return
+            self.unexported = 0
+        export_posts(self.store, self.config)
+
+    def close(self):
+        if self.unexported:
+            export_posts(self.store, self.config)
+        self.engine.close()
+        self.store.close()
+
+def crawl_keyword(config, keyword, engine, existing_ids, pending, watermarks, queue):
+    """키워드 하나의 검색 결과 페이지를 순회하며 새 게시글의 본문 요청을 pending에 추가"""
+    parser = parser_from_config(config['missyusa'])
+    page = 1
+    newest_id = 0
+    while True:
+        encoded_keyword = urllib.parse.quote(keyword, encoding='euc-kr')
+        url = config['missyusa']['search_url'].format(keyword=encoded_keyword, page=page)
+        try:
+            resp = engine.get(url, encoding='euc-kr')
+            # 에러 페이지 감지 (대기/속도 조절은 FetchEngine의 rate controller가 함)
+            if SERVER_ERROR_MARKER in resp.text:
+                print(f"[WARNING] Server error on page {page}, skipping...")
+                page += 1
+                continue
+            post_links = parse_listing_links(resp.text, parser)
+        except Exception as e:
+            print(f"[ERROR] Exception on page {page}: {e}, skipping...")
+            page += 1
+            continue
+
+        print(f"[DEBUG] Found {len(post_links)} post links on page {page}")
+
+        if not post_links:
+            break
+
+        new_posts = []
+        page_ids = []
+        for href, title in post_links:
+            post_id = href.split('idx=')[-1].split('&')[0]
+            # 공지/광고 등 숫자 id가 아닌 링크는 건너뜀 (watermark는 숫자 id로 비교)
+            if not post_id.isdigit():
+                print(f"[WARNING] Skipping link without numeric id: {href}")
+                continue
+            page_ids.append(post_id)
+            if post_id in existing_ids:
+                continue
+            base_url = config['missyusa'].get('base_url', 'https://www.missyusa.com')
+            post_url = base_url + href if href.startswith('/') else href
+            post = {
+                'id': post_id,
+                'url': post_url,
+                'title': title,
+                'content': '',
+                'keyword': keyword,
+                'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            if not queue.add(post_id, keyword, post):
+                continue
+            new_posts.append((post, engine.submit(get_post_content, post_url, engine, parser)))
+        newest_id = max([newest_id] + [int(post_id) for post_id in page_ids])
+        if new_posts:
+            print(f"[INFO] {len(new_posts)} new posts queued.")
+            pending.extend(new_posts)
+        else:
+            print("[INFO] No new posts found on this page.")
+            # 이전 크롤링 이후 새 글이 없으면 이후 페이지는 모두 이미 수집된 글
+            if watermarks.is_caught_up('missyusa', keyword, page_ids):
+                print(f"[INFO] Reached watermark for '{keyword}' on page {page}, stopping.")
+                break
+        # 페이지당 딜레이는 FetchEngine의 호스트별 rate controller가 대신함
+        page += 1
+    watermarks.update('missyusa', keyword, newest_id)
 
 def main():
     config = load_config()
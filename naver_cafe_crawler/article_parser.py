@@ -0,0 +1,63 @@
+from common.html_parser import HtmlParser
+
+# 읽기 권한이 없는 게시글에 표시되는 안내문
+PERMISSION_NOTICE = "등급이 되시면 읽기가 가능한 게시판 입니다."
+PERMISSION_DENIED = "권한부족"
+
+# 본문 영역 셀렉터 (앞에서부터 처음 찾은 것을 사용)
+CONTENT_SELECTORS = [
+    'div.se-main-container',
+    'div.ContentRenderer',
+    'div.article_viewer',
+    'div.ArticleContentBox__content',
+    'div#app div.ArticleContentBox__content',
+    'div#app .se-main-container',
+    'div#app .article_viewer',
+]
+IMAGE_SELECTORS = [selector + ' img' for selector in CONTENT_SELECTORS]
+NOTICE_SELECTORS = 'div.guide_box, p.tit_level'
+
+
+def normalize_content(text) -> str:
+    """
+    본문 공백 정리 (HTTP 경로의 get_text와 브라우저 경로의 innerText를 같은 형태로 맞춤)
+    줄마다 연속 공백(nbsp 포함)을 하나로 줄이고, 앞뒤 공백, 폭 없는 공백, 빈 줄을 없앰
+    """
+    lines = (' '.join(line.split()) for line in str(text or '').replace('\u200b', '').splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def parse_article_html(html: str, parser: HtmlParser = None) -> tuple:
+    """
+    게시글 HTML에서 본문과 이미지 URL 추출 (브라우저 경로와 같은 셀렉터 사용)
+    Returns: (content, image_urls), 읽기 권한이 없으면 ("권한부족", [])
+    """
+    parser = parser or HtmlParser()
+    doc = parser.parse(html)
+
+    # 1. 안내문 확인 (안내문 영역, 없으면 전체 텍스트)
+    # 대부분의 페이지에는 안내문이 없으므로 원문에 문구가 있을 때만 확인
+    if PERMISSION_NOTICE in html:
+        for box in parser.select(doc, NOTICE_SELECTORS):
+            if PERMISSION_NOTICE in parser.text(box):
+                return PERMISSION_DENIED, []
+        if PERMISSION_NOTICE in parser.text(doc):
+            return PERMISSION_DENIED, []
+
+    # 2. 본문 추출
+    content = ""
+    for selector in CONTENT_SELECTORS:
+        element = parser.select_one(doc, selector)
+        if element is not None:
+            content = normalize_content(parser.text(element, "\n", strip=True))
+            break
+
+    # 3. 이미지 추출
+    image_urls = []
+    for selector in IMAGE_SELECTORS:
+        for img in parser.select(doc, selector):
+            src = parser.attr(img, 'src')
+            if src and src not in image_urls:
+                image_urls.append(src)
+
+    return content, image_urls
@@ -0,0 +1,141 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from dom_scripts import extract_article
+
+# 브라우저 탭 하나(페이지 로드 + 추출)의 느림 판단 기준 (초). HTTP 요청의 rate_control.latency_target보다 훨씬 김
+DEFAULT_BROWSER_LATENCY_TARGET = 15.0
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
+
+# 리소스 타입별로 차단할 URL 패턴 (CDP Network.setBlockedURLs는 URL 패턴만 지원)
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.svg*', '*.ico*', '*phinf.pstatic.net*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'stylesheet': ['*.css*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*'],
+}
+# 광고/통계 스크립트
+DEFAULT_BLOCKED_URLS = [
+    '*siape.veta.naver.com*',
+    '*veta.naver.com*',
+    '*ad.naver.com*',
+    '*adcr.naver.com*',
+    '*nlog.naver.com*',
+    '*wcs.naver.net*',
+    '*lcs.naver.com*',
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+]
+
+# 페이지(최상위 + cafe_main iframe)의 전송 바이트 수와 로드 시간
+PAGE_STATS_JS = """
+function collect(win) {
+    var nav = win.performance.getEntriesByType('navigation')[0];
+    var resources = win.performance.getEntriesByType('resource');
+    var bytes = nav ? nav.transferSize : 0;
+    for (var i = 0; i < resources.length; i++) bytes += resources[i].transferSize || 0;
+    return {bytes: bytes, resources: resources.length, load_ms: nav ? nav.domContentLoadedEventEnd : 0};
+}
+var stats = collect(window);
+var frame = document.getElementById('cafe_main');
+if (frame) {
+    try {
+        var inner = collect(frame.contentWindow);
+        stats.bytes += inner.bytes;
+        stats.resources += inner.resources;
+        stats.load_ms = Math.max(stats.load_ms, inner.load_ms);
+    } catch (e) {}
+}
+return stats;
+"""
+
+
+def browser_latency_target(config) -> float:
+    return config['naver'].get('browser_latency_target', DEFAULT_BROWSER_LATENCY_TARGET)
+
+
+def blocked_url_patterns(config) -> list:
+    block_config = config['naver'].get('block_resources', {})
+    patterns = list(block_config.get('url_patterns', DEFAULT_BLOCKED_URLS))
+    for resource_type in block_config.get('resource_types', ['image', 'font', 'media']):
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    return patterns
+
+
+def apply_resource_blocking(driver, config):
+    """
+    필요 없는 리소스(이미지, 폰트, 광고/통계 스크립트 등) 요청을 CDP로 차단
+    img[src] 속성은 그대로 남으므로 이미지 URL 수집에는 영향 없음
+    차단 설정은 탭마다 적용되므로 새 탭으로 전환한 뒤에도 호출해야 함
+    """
+    if not config['naver'].get('block_resources', {}).get('enabled', False):
+        return
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(config)})
+
+
+def report_page_stats(driver, post_url):
+    """게시글 페이지의 전송량과 로드 시간 출력 (차단 설정 전후 비교용)"""
+    try:
+        driver.switch_to.default_content()
+        stats = driver.execute_script(PAGE_STATS_JS)
+        print(f"[DEBUG] 페이지 로드 {stats['load_ms']:.0f}ms, 전송 {stats['bytes'] / 1024:.1f}KB "
+              f"(리소스 {stats['resources']}개): {post_url}")
+        return stats
+    except Exception as e:
+        print(f"[DEBUG] 페이지 통계 수집 실패: {e}")
+        return None
+
+
+def create_driver(config, headless: bool = False, use_profile: bool = True):
+    """config['naver'] 설정으로 Chrome 드라이버 생성"""
+    naver_config = config['naver']
+    chrome_options = Options()
+    chrome_options.binary_location = naver_config['chrome_path']
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    block_config = naver_config.get('block_resources', {})
+    if block_config.get('enabled', False) and 'image' in block_config.get('resource_types', ['image', 'font', 'media']):
+        # 확장자가 없는 이미지 URL도 막기 위해 이미지 로딩 자체를 끔
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    # 프로필 디렉토리를 지정하면 브라우저 쪽 로그인 상태도 사이클 간에 유지됨
+    # (같은 프로필은 여러 Chrome이 동시에 쓸 수 없으므로 워커 풀에서는 사용하지 않음)
+    if use_profile and naver_config.get('chrome_profile_dir'):
+        chrome_options.add_argument(f"--user-data-dir={naver_config['chrome_profile_dir']}")
+
+    # Set page load strategy via options (Selenium 4+)
+    chrome_options.set_capability("pageLoadStrategy", "eager")
+
+    service = Service(naver_config['chromedriver_path'])
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(30)  # 30초 페이지 로드 타임아웃
+    apply_resource_blocking(driver, config)
+    return driver
+
+
+def get_post_content_and_images(driver, post_url):
+    driver.get(post_url)
+
+    # eager 로딩이므로 iframe이 준비될 때까지만 기다림
+    try:
+        WebDriverWait(driver, 3).until(
+            EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
+        )
+    except Exception:
+        pass
+
+    # 안내문 확인, 본문, 이미지를 스크립트 한 번으로 추출
+    content, image_urls = extract_article(driver)
+    report_page_stats(driver, post_url)
+    return content, image_urls
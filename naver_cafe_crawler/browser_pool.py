@@ -0,0 +1,191 @@
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 페이지 수 기준으로만 워커 교체
+    psutil = None
+
+from browser import browser_latency_target
+
+# 워커가 교체를 요청할 때 결과 큐에 넣는 표시
+RECYCLE = '__recycle__'
+# 워커가 Chrome을 띄우고 쿠키를 적용한 뒤 결과 큐에 넣는 표시
+READY = '__ready__'
+
+
+def _driver_rss_mb(driver) -> float:
+    """chromedriver와 Chrome 하위 프로세스 전체의 RSS (MB)"""
+    if psutil is None:
+        return 0.0
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except (psutil.Error, AttributeError):
+        return 0.0
+
+
+def _worker_main(worker_id, config, cookies, tasks, results, max_pages, max_rss_mb):
+    """
+    워커 프로세스: headless Chrome 하나로 게시글 URL을 받아 본문/이미지를 추출
+    max_pages 또는 max_rss_mb를 넘으면 종료하고 코디네이터가 새 워커를 띄움
+    """
+    from browser import create_driver, get_post_content_and_images
+    from naver_session import NaverSession
+
+    driver = create_driver(config, headless=True, use_profile=False)
+    pages = 0
+    try:
+        NaverSession(config).apply_to_driver(driver, cookies)
+        results.put((READY, worker_id, None, None, 0))
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            post_id, post_url = task
+            started = time.perf_counter()
+            try:
+                content, image_urls = get_post_content_and_images(driver, post_url)
+                results.put((post_id, content, image_urls, None, time.perf_counter() - started))
+            except Exception as e:
+                results.put((post_id, None, None, str(e), time.perf_counter() - started))
+            pages += 1
+            rss_mb = _driver_rss_mb(driver)
+            if pages >= max_pages or (max_rss_mb and rss_mb > max_rss_mb):
+                print(f"[INFO] 워커 {worker_id} 교체 (페이지 {pages}개, RSS {rss_mb:.0f}MB)")
+                results.put((RECYCLE, worker_id, None, None, 0))
+                break
+    finally:
+        driver.quit()
+
+
+class BrowserPool:
+    """
+    headless Chrome 워커 프로세스 풀
+    - 모든 워커는 같은 로그인 쿠키를 사용
+    - 코디네이터(crawl_posts)가 목록 페이지에서 모은 게시글 URL을 나눠 줌
+    - 워커는 max_pages_per_worker 페이지 또는 max_rss_mb를 넘으면 새 프로세스로 교체
+    - rate(AdaptiveRateController)가 허락할 때만 게시글을 작업 큐에 넣어 전체 요청 속도를 조절
+    - 준비(READY)되기 전에 죽은 워커가 max_startup_failures(기본값 3)번 연달아 나오면
+      (chromedriver가 없거나 Chrome이 뜨지 않는 경우) 더 띄우지 않고 fetch에서 RuntimeError
+    """
+    def __init__(self, config, cookies: list, rate):
+        pool_config = config['naver'].get('browser_pool', {})
+        self.size = pool_config.get('size') or max(1, (os.cpu_count() or 2) // 2)
+        self.max_pages = pool_config.get('max_pages_per_worker', 200)
+        self.max_rss_mb = pool_config.get('max_rss_mb', 1500)
+        self.task_timeout = pool_config.get('task_timeout', 60)
+        self.max_startup_failures = pool_config.get('max_startup_failures', 3)
+        self.startup_failures = 0
+        self.config = config
+        self.cookies = cookies
+        self.rate = rate
+        self.latency_target = browser_latency_target(config)
+        self.ctx = mp.get_context('spawn')
+        self.tasks = self.ctx.Queue()
+        self.results = self.ctx.Queue()
+        self.workers = {}
+        self.ready = set()
+        self.next_worker_id = 0
+        self.lock = threading.Lock()
+        for _ in range(self.size):
+            self._start_worker()
+
+    def _start_worker(self):
+        worker_id = self.next_worker_id
+        self.next_worker_id += 1
+        process = self.ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.config, self.cookies, self.tasks, self.results, self.max_pages, self.max_rss_mb),
+            daemon=True,
+        )
+        process.start()
+        self.workers[worker_id] = process
+
+    def _replace_dead_workers(self):
+        """죽은 워커를 새로 띄움. 준비 전에 죽은 워커가 연달아 max_startup_failures번 나오면 RuntimeError"""
+        for worker_id, process in list(self.workers.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self.workers[worker_id]
+            if worker_id not in self.ready:
+                self.startup_failures += 1
+                print(f"[WARNING] 브라우저 워커 {worker_id} 시작 실패 (연속 {self.startup_failures}번, exit code {process.exitcode})")
+            self.ready.discard(worker_id)
+            if self.startup_failures >= self.max_startup_failures:
+                raise RuntimeError(f"브라우저 워커가 {self.startup_failures}번 연속 시작에 실패하여 더 띄우지 않음")
+            self._start_worker()
+
+    def fetch(self, post_links) -> list:
+        """
+        post_links: [(post_id, post_url, title), ...]
+        Returns: [(post_id, post_url, title, content, image_urls), ...] (실패한 게시글은 제외)
+        결과 큐와 워커 목록을 공유하므로 여러 스레드에서 부르면 한 호출씩 차례로 처리
+        """
+        with self.lock:
+            return self._fetch(post_links)
+
+    def _fetch(self, post_links) -> list:
+        links = {post_id: (post_url, title) for post_id, post_url, title in post_links}
+        unsent = list(links)
+
+        results = []
+        remaining = set(links)
+        deadline = time.monotonic() + self.task_timeout * max(1, len(links) / self.size)
+        while remaining and time.monotonic() < deadline:
+            # 속도 제어기가 허락하는 만큼 작업을 넣고, 다음 허가까지는 결과를 기다림
+            wait = 1.0
+            while unsent:
+                wait = self.rate.try_acquire()
+                if wait > 0:
+                    break
+                post_id = unsent.pop(0)
+                self.tasks.put((post_id, links[post_id][0]))
+                # 아직 넣지 않은 게시글은 시간 제한에서 제외
+                deadline = max(deadline, time.monotonic() + self.task_timeout)
+            try:
+                post_id, content, image_urls, error, elapsed = self.results.get(timeout=min(max(wait, 0.05), 1.0))
+            except queue.Empty:
+                self._replace_dead_workers()
+                continue
+            if post_id == READY:
+                self.ready.add(content)
+                self.startup_failures = 0
+                continue
+            if post_id == RECYCLE:
+                # 교체 요청한 워커는 종료되므로 새 워커를 띄움 (이미 교체된 경우 제외)
+                process = self.workers.pop(content, None)
+                self.ready.discard(content)
+                if process is not None:
+                    process.join()
+                    self._start_worker()
+                continue
+            if post_id not in remaining:
+                # 이전 호출에서 시간 초과된 게시글의 늦은 결과
+                continue
+            remaining.discard(post_id)
+            if error:
+                self.rate.on_error(error[:80])
+                print(f"[WARNING] 게시글 처리 중 오류 ({post_id}): {error}")
+                continue
+            self.rate.on_success(elapsed, self.latency_target)
+            post_url, title = links[post_id]
+            results.append((post_id, post_url, title, content, image_urls))
+        if remaining:
+            print(f"[WARNING] 시간 안에 처리되지 않은 게시글 {len(remaining)}개: {sorted(remaining)}")
+        return results
+
+    def close(self):
+        for _ in self.workers:
+            self.tasks.put(None)
+        for process in self.workers.values():
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        self.workers.clear()
+        self.ready.clear()
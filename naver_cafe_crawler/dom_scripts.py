@@ -0,0 +1,51 @@
+"""
+WebDriver 왕복 횟수를 줄이기 위해 한 번의 execute_script로 필요한 값을 모두 모아 오는 스크립트
+(find_elements는 매칭 실패 시 implicitly_wait만큼 기다리고, 요소마다 get_attribute/.text 왕복이 생김)
+"""
+from article_parser import (CONTENT_SELECTORS, IMAGE_SELECTORS, NOTICE_SELECTORS, PERMISSION_DENIED, PERMISSION_NOTICE,
+                            normalize_content)
+
+# 검색 결과 목록의 게시글 링크: [{href, title}, ...]
+COLLECT_LINKS_JS = """
+return Array.from(document.querySelectorAll('div.board-list a.article')).map(function (a) {
+    return {href: a.href || a.getAttribute('href') || '', title: (a.innerText || a.textContent || '').trim()};
+});
+"""
+
+# 권한 안내문 확인 + 본문 + 이미지: {denied, content, images}
+EXTRACT_ARTICLE_JS = """
+var notice = arguments[0], noticeSelectors = arguments[1], contentSelectors = arguments[2], imageSelectors = arguments[3];
+var boxes = document.querySelectorAll(noticeSelectors);
+for (var i = 0; i < boxes.length; i++) {
+    if ((boxes[i].innerText || '').indexOf(notice) >= 0) return {denied: true, content: '', images: []};
+}
+if (document.body && (document.body.innerText || '').indexOf(notice) >= 0) return {denied: true, content: '', images: []};
+var content = '';
+for (var j = 0; j < contentSelectors.length; j++) {
+    var el = document.querySelector(contentSelectors[j]);
+    if (el) { content = el.innerText || el.textContent || ''; break; }
+}
+if (content.indexOf(notice) >= 0) return {denied: true, content: '', images: []};
+var images = [];
+for (var k = 0; k < imageSelectors.length; k++) {
+    var imgs = document.querySelectorAll(imageSelectors[k]);
+    for (var m = 0; m < imgs.length; m++) {
+        var src = imgs[m].src || imgs[m].getAttribute('src');
+        if (src && images.indexOf(src) < 0) images.push(src);
+    }
+}
+return {denied: false, content: content, images: images};
+"""
+
+def collect_links(driver) -> list:
+    return driver.execute_script(COLLECT_LINKS_JS) or []
+
+
+def extract_article(driver) -> tuple:
+    """Returns: (content, image_urls), 읽기 권한이 없으면 ("권한부족", [])"""
+    result = driver.execute_script(
+        EXTRACT_ARTICLE_JS, PERMISSION_NOTICE, NOTICE_SELECTORS, CONTENT_SELECTORS, IMAGE_SELECTORS
+    )
+    if result['denied']:
+        return PERMISSION_DENIED, []
+    return normalize_content(result['content']), result['images']
@@ -1,116 +1,99 @@
 import os
 import time
 import yaml
-import pandas as pd
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import urllib.parse
 import re
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.fetch_queue import FetchQueue
+from common.fixtures import open_recorder
+from common.html_parser import parser_from_config
+from common.keyword_scheduler import ExportTimer
+from common.post_store import PostStore, default_store_path
+from common.rate_control import rate_controller_from_config
+from common.watermark import load_watermarks
+from naver_session import NaverSession
+from http_fetcher import article_url, create_http_engine, create_listing_engine, fetch_article
+from listing import ListingPager
+from browser import USER_AGENT, apply_resource_blocking, browser_latency_target, create_driver, get_post_content_and_images
+from browser_pool import BrowserPool
 
 # config 읽기
 def load_config():
     with open('config.yaml', 'r', encoding='utf-8-sig') as f:
         return yaml.safe_load(f)
 
-def get_post_ids(data_path):
-    if not os.path.exists(data_path):
-        return set()
-    df = pd.read_csv(data_path, encoding='utf-8-sig')
-    return set(df['id'].astype(str))
+CSV_COLUMNS = ['id', 'title', 'content', 'image_urls', 'url', 'keyword', 'crawled_at']
+
+def open_post_store(config):
+    """게시글 저장소(SQLite)를 열고, 비어 있으면 기존 CSV를 가져옴"""
+    data_path = config['naver']['data_path']
+    store = PostStore(config['naver'].get('store_path', default_store_path(data_path)))
+    store.import_csv(data_path, encoding='utf-8-sig')
+    return store
+
+def save_posts(store, posts):
+    """
+    게시글을 저장소에 upsert (본문 병합 규칙은 common.post_store.merge_post)
+    Returns: 추가되거나 변경된 게시글 수
+    """
+    return store.upsert(posts)
+
+def export_posts(store, config):
+    """번역/분류 단계가 읽는 CSV로 내보내기"""
+    if config['naver'].get('export_csv', True):
+        store.export_csv(config['naver']['data_path'], CSV_COLUMNS, encoding='utf-8-sig')
 
-def get_post_ids_and_contents(data_path):
+def ensure_naver_login(driver, config, session):
     """
-    nv_posts.csv에서 id와 content를 모두 딕셔너리로 반환
+    저장된 쿠키가 유효하면 브라우저에 주입하고 로그인을 건너뜀
+    만료되었거나 없으면 다시 로그인하고 쿠키를 저장
     """
-    if not os.path.exists(data_path):
-        return dict()
-    df = pd.read_csv(data_path, encoding='utf-8-sig')
-    return dict(zip(df['id'].astype(str), df['content'].fillna('')))
-
-def save_posts(posts, data_path):
-    df_new = pd.DataFrame(posts)
-    if os.path.exists(data_path):
-        df_old = pd.read_csv(data_path, encoding='utf-8-sig')
-        df_old.set_index('id', inplace=True)
-        df_new.set_index('id', inplace=True)
-        for idx, row in df_new.iterrows():
-            if idx in df_old.index:
-                old_content = str(df_old.at[idx, 'content']).strip()
-                new_content = str(row['content']).strip()
-                # 기존 본문이 빈칸이고, 새 본문이 있으면 업데이트
-                if (not old_content) and new_content:
-                    for col in df_new.columns:
-                        df_old.at[idx, col] = row[col]
-                # 기존 본문이 있고, 새 본문이 더 길면 업데이트
-                elif old_content and new_content and len(new_content) > len(old_content):
-                    for col in df_new.columns:
-                        df_old.at[idx, col] = row[col]
-                # 기존 본문과 새 본문이 다르고, 새 본문이 더 짧으면 합치기
-                elif old_content and new_content and old_content != new_content and len(new_content) <= len(old_content):
-                    merged_content = old_content
-                    if new_content not in old_content:
-                        merged_content += "\n" + new_content
-                    df_old.at[idx, 'content'] = merged_content
-            else:
-                # 기존에 없는 id는 추가
-                df_old.loc[idx] = row
-        df = df_old.reset_index()
-    else:
-        df = df_new.reset_index()
-    os.makedirs(os.path.dirname(data_path), exist_ok=True)
-    df.to_csv(data_path, index=False, encoding='utf-8-sig')
-
-def login_to_naver(driver, config):
-    # 수동 로그인 옵션
-    manual_login = input("자동 로그인을 시도하시겠습니까? (y/n, 기본값: y): ").strip().lower()
-    if manual_login == 'n':
+    cookies = session.load_cookies()
+    if cookies and session.is_valid(cookies):
+        print("[INFO] 저장된 네이버 세션 재사용")
+        session.apply_to_driver(driver, cookies)
+        return True
+    print("[INFO] 저장된 세션이 없거나 만료됨. 네이버 로그인 시도 중...")
+    return login_to_naver(driver, config, session)
+
+def verify_login(driver, session):
+    """브라우저 쿠키로 로그인 상태를 확인하고, 성공하면 쿠키 저장"""
+    cookies = driver.get_cookies()
+    if not session.is_valid(cookies):
+        return False
+    session.save_cookies(cookies)
+    return True
+
+def login_to_naver(driver, config, session):
+    # 로그인 방식: auto (기본값) 또는 manual (브라우저에서 직접 로그인, 터미널에서 실행할 때만 가능)
+    login_mode = config['naver'].get('login_mode', 'auto')
+    if login_mode == 'manual':
+        if not sys.stdin.isatty():
+            print("[ERROR] 수동 로그인은 터미널에서 실행할 때만 가능합니다.")
+            return False
         print("[INFO] 수동 로그인 모드로 전환합니다.")
         print("[INFO] 브라우저가 열리면 직접 로그인해주세요.")
-        print("[INFO] 로그인 완료 후 Enter 키를 눌러주세요.")
         
         driver.get("https://nid.naver.com/nidlogin.login")
         input("로그인 완료 후 Enter 키를 눌러주세요...")
         
-        # 로그인 상태 확인
-        driver.get("https://www.naver.com")
-        time.sleep(3)
-        
-        try:
-            # 로그인된 상태에서 보이는 요소들 확인
-            login_indicators = [
-                'a[href*="nid.naver.com/user2"]',
-                '.gnb_login_area .user',
-                '.gnb_my_area',
-                '.sc_login'
-            ]
-            
-            for indicator in login_indicators:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, indicator)
-                    if element:
-                        print("[INFO] 수동 로그인 성공 확인")
-                        return True
-                except:
-                    continue
-            
-            print("[ERROR] 수동 로그인 상태를 확인할 수 없습니다.")
-            return False
-            
-        except Exception as e:
-            print(f"[ERROR] 수동 로그인 확인 중 오류: {e}")
-            return False
+        if verify_login(driver, session):
+            print("[INFO] 수동 로그인 성공 확인")
+            return True
+        print("[ERROR] 수동 로그인 상태를 확인할 수 없습니다.")
+        return False
 
     try:
         print("[INFO] 네이버 로그인 시도 중...")
         driver.get("https://nid.naver.com/nidlogin.login")
-        time.sleep(3)
         
         # ID 입력 필드 찾기 (여러 가능한 셀렉터 시도)
         id_selectors = [
@@ -206,347 +189,427 @@ def login_to_naver(driver, config):
             # Enter 키로 로그인 시도
             pw_field.send_keys(Keys.RETURN)
         
-        time.sleep(10)  # 로그인 처리 시간 증가
-
-        # 로그인 성공 확인 (강화)
+        # 로그인 페이지를 벗어날 때까지만 대기
         try:
-            # 네이버 메인 페이지로 이동해서 로그인 상태 확인
-            driver.get("https://www.naver.com")
-            time.sleep(3)
-            login_success = False
-            login_indicators = [
-                'a[href*="nid.naver.com/user2"]',  # 마이페이지 링크
-                '.gnb_login_area .user',            # 사용자 영역
-                '.gnb_my_area',                     # 내 정보 영역
-                '.sc_login',                        # 로그인 상태 표시
-                'a#gnb_logout_button',              # 로그아웃 버튼
-                'a.gnb_my',                         # 마이페이지
-                'div.gnb_my_name',                  # 내 이름
-                'a.link_login',                     # 로그인 링크 (있으면 로그인 안 된 것)
-            ]
-            for indicator in login_indicators:
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, indicator)
-                    # 로그인 링크가 있으면 로그인 안 된 것
-                    if indicator == 'a.link_login':
-                        print("[ERROR] 로그인 링크가 보임: 로그인 실패")
-                        login_success = False
-                        break
-                    if element and element.is_displayed():
-                        print(f"[INFO] 로그인 성공 확인: {indicator}")
-                        login_success = True
-                        break
-                except Exception as e:
-                    continue
-            if not login_success:
-                print("[ERROR] 네이버 로그인 실패: 로그인된 사용자 정보가 보이지 않음")
-                return False
-        except Exception as e:
-            print(f"[ERROR] 로그인 성공 여부 확인 중 예외 발생: {e}")
+            WebDriverWait(driver, 15).until(lambda d: 'nidlogin' not in d.current_url)
+        except TimeoutException:
+            print("[WARNING] 로그인 후 페이지 이동이 확인되지 않음")
+
+        # 로그인 성공 확인 (인증 쿠키 검증 요청 한 번)
+        if not verify_login(driver, session):
+            print("[ERROR] 네이버 로그인 실패: 인증 쿠키가 유효하지 않음")
             return False
+        print("[INFO] 로그인 성공 확인")
+        return True
             
     except Exception as e:
         print(f"[ERROR] 로그인 중 오류: {e}")
         return False
 
-def search_in_cafe(driver, keyword):
-    """카페에서 검색 수행"""
-    # 1. 카페 메인으로 이동
-    driver.get("https://cafe.naver.com/gotousa")
-    time.sleep(3)
-    
-    # 2. iframe 찾기 및 전환
-    iframes = driver.find_elements(By.TAG_NAME, "iframe")
-    print(f"[DEBUG] Found {len(iframes)} iframes on the cafe page.")
-    for idx, iframe in enumerate(iframes):
-        print(f"[DEBUG] Iframe {idx}: id={iframe.get_attribute('id')}, name={iframe.get_attribute('name')}")
-    
-    # 3. 검색을 위해 검색 페이지로 직접 이동
-    keyword_encoded = urllib.parse.quote(keyword, encoding='euc-kr')
-    search_url = f"https://cafe.naver.com/ArticleSearchList.nhn?search.clubid=10854519&search.searchBy=0&search.query={keyword_encoded}&search.page=1&userDisplay=50"
-    driver.get(search_url)
-    time.sleep(3)
-    
-    # 4. 검색 결과 페이지의 iframe 찾기
-    iframes = driver.find_elements(By.TAG_NAME, "iframe")
-    print(f"[DEBUG] Found {len(iframes)} iframes on search page.")
-    for idx, iframe in enumerate(iframes):
-        print(f"[DEBUG] Iframe {idx}: id={iframe.get_attribute('id')}, name={iframe.get_attribute('name')}")
-    
-    # 5. cafe_main iframe으로 전환
-    try:
-        WebDriverWait(driver, 10).until(
-            EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
-        )
-        print("[INFO] cafe_main iframe으로 전환 성공")
-        # Save HTML source for debugging
-        with open("cafe_main_iframe_debug.html", "w", encoding="utf-8", errors="replace") as f:
-            f.write(driver.page_source)
-        print("[DEBUG] Saved cafe_main_iframe_debug.html for selector inspection.")
-    except TimeoutException:
-        print("[ERROR] cafe_main iframe을 찾을 수 없습니다.")
-        return False
-    
-    return True
+def fetch_posts_browser(driver, config, post_links, rate):
+    """
+    게시글을 브라우저 새 탭에서 하나씩 열어 본문/이미지 수집
+    rate(AdaptiveRateController)가 게시글 사이 간격을 정함 (처리 시간이 browser_latency_target보다 길어지거나 오류가 나면 느려짐)
+    """
+    latency_target = browser_latency_target(config)
+    results = []
+    for post_id, post_url, title in post_links:
+        rate.acquire()
+        started = time.perf_counter()
+        try:
+            # 빈 탭에 차단 설정을 먼저 적용한 뒤 게시글은 한 번만 불러옴
+            driver.execute_script("window.open('about:blank');")
+            driver.switch_to.window(driver.window_handles[-1])
+            apply_resource_blocking(driver, config)
+            content, image_urls = get_post_content_and_images(driver, post_url)
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.switch_to.default_content()
+            WebDriverWait(driver, 10).until(
+                EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
+            )
+            results.append((post_id, post_url, title, content, image_urls))
+            elapsed = time.perf_counter() - started
+            rate.on_success(elapsed, latency_target)
+            print(f"[DEBUG] 게시글 {post_id} 처리 시간: {elapsed:.2f}s")
+        except Exception as e:
+            rate.on_error(type(e).__name__)
+            print(f"[WARNING] 게시글 처리 중 오류: {e}")
+            continue
+    return results
 
-def get_post_content_and_images(driver, post_url):
-    driver.get(post_url)
-    time.sleep(1)
+def fetch_posts_http(engine, config, post_links):
+    """게시글을 HTTP로 동시에 요청하여 본문/이미지 수집 (브라우저는 로그인에만 사용)"""
+    parser = parser_from_config(config['naver'])
+    futures = [
+        (post_id, post_url, title, engine.submit(fetch_article, engine, article_url(config, post_url), parser))
+        for post_id, post_url, title in post_links
+    ]
+    results = []
+    for post_id, post_url, title, future in futures:
+        try:
+            content, image_urls = future.result()
+            results.append((post_id, post_url, title, content, image_urls))
+        except Exception as e:
+            print(f"[WARNING] 게시글 처리 중 오류 ({post_id}): {e}")
+    return results
 
-    try:
-        WebDriverWait(driver, 3).until(
-            EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
-        )
-    except Exception:
-        pass
+class CrawlCycle:
+    """
+    한 사이클 동안 키워드들이 공유하는 상태
+    - store / id_content_map: 저장된 게시글
+    - fetch_queue: 여러 키워드에 걸쳐 같은 게시글은 한 번만 수집
+    - pager: 검색 결과 페이지 요청 (listing.ListingPager)
+    - fetch_posts: [(post_id, post_url, title), ...] -> [(post_id, post_url, title, content, image_urls), ...]
+    스케줄러에서는 SiteRunner가 사이클 하나를 계속 열어 두고 동시에 실행되는 키워드 작업들이 공유함
+    """
+    def __init__(self, config, store, pager, fetch_posts, watermarks=None):
+        self.config = config
+        self.store = store
+        self.pager = pager
+        self.fetch_posts = fetch_posts
+        self.id_content_map = store.id_content_map()
+        self.watermarks = watermarks or load_watermarks(config)
+        self.fetch_queue = FetchQueue()
+        self.keyword_updated_ids = set()
+        self.changed = 0
+        self.lock = threading.Lock()
 
-    # 1. 안내문 div 직접 탐색 (guide_box, tit_level)
-    try:
-        guide_boxes = driver.find_elements(By.CSS_SELECTOR, "div.guide_box, p.tit_level")
-        for box in guide_boxes:
-            if "등급이 되시면 읽기가 가능한 게시판 입니다." in box.text:
-                return "권한부족", []
-    except Exception:
-        pass
-
-    # 2. body 전체 텍스트에서 안내문 체크 (백업)
-    try:
-        iframe_text = driver.find_element(By.TAG_NAME, "body").text
-        if "등급이 되시면 읽기가 가능한 게시판 입니다." in iframe_text:
-            return "권한부족", []
-    except Exception:
-        pass
-
-    # 3. 본문 추출 (안내문이 없을 때만)
-    content = ""
-    for selector in [
-        'div.se-main-container',
-        'div.ContentRenderer',
-        'div.article_viewer',
-        'div.ArticleContentBox__content',
-        'div#app div.ArticleContentBox__content',
-        'div#app .se-main-container',
-        'div#app .article_viewer',
-    ]:
-        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-        if elements:
-            content = elements[0].get_attribute('innerText') or elements[0].text
-            break
+    def add_changed(self, count: int):
+        with self.lock:
+            self.changed += count
 
-    # 4. 혹시 본문에 안내문이 있으면 한 번 더 체크
-    if "등급이 되시면 읽기가 가능한 게시판 입니다." in content:
-        return "권한부족", []
-
-    # 5. 이미지 추출 등 이하 생략
-    image_urls = []
-    for selector in [
-        'div.se-main-container img',
-        'div.ContentRenderer img',
-        'div.article_viewer img',
-        'div.ArticleContentBox__content img',
-        'div#app div.ArticleContentBox__content img',
-        'div#app .se-main-container img',
-        'div#app .article_viewer img',
-    ]:
-        img_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-        for img in img_elements:
-            src = img.get_attribute('src')
-            if src and src not in image_urls:
-                image_urls.append(src)
-
-    return content, image_urls
+    def flush(self):
+        """다른 키워드로 다시 검색된 게시글의 키워드를 저장하고, 변경이 있으면 CSV로 내보냄"""
+        with self.lock:
+            updated_ids, self.keyword_updated_ids = self.keyword_updated_ids, set()
+            # 아직 수집 중인 게시글(crawled_at 없음)은 수집한 작업이 합쳐진 키워드와 함께 저장함
+            posts = [self.fetch_queue.get(post_id) for post_id in updated_ids
+                     if post_id in self.fetch_queue and self.fetch_queue.get(post_id)['crawled_at']]
+            if posts:
+                self.changed += save_posts(self.store, posts)
+            if self.changed:
+                export_posts(self.store, self.config)
+            self.changed = 0
 
-def crawl_posts(config):
-    """게시글 크롤링 메인 함수"""
-    data_path = config['naver']['data_path']
-    id_content_map = get_post_ids_and_contents(data_path)
-    
-    # Chrome 옵션 설정
-    chrome_options = Options()
-    chrome_options.binary_location = config['naver']['chrome_path']
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36')
+    def finish(self):
+        """
+        flush 후 다음 사이클을 시작
+        저장한 게시글은 이후 id_content_map으로 건너뛰므로 큐에서 빼고, 다른 작업이 수집 중인 게시글만 남김
+        """
+        self.flush()
+        print(f"[INFO] 키워드 간 중복으로 생략한 게시글 요청: {self.fetch_queue.avoided}개")
+        self.fetch_queue.clear(keep=lambda post: not post['crawled_at'])
+
+def crawl_keyword(cycle, keyword):
+    """
+    키워드 하나의 검색 결과를 페이지 순으로 처리
+    Returns: 새로 수집한 게시글 수
+    """
+    print(f"[INFO] 키워드 '{keyword}' 검색 시작")
+    pager = cycle.pager
+    fetch_queue = cycle.fetch_queue
+    id_content_map = cycle.id_content_map
+    page = 1
+    newest_id = 0
+    collected = 0
     
-    # Set page load strategy via options (Selenium 4+)
-    chrome_options.set_capability("pageLoadStrategy", "eager")
+    while True:
+        print(f"[INFO] 페이지 {page} 처리 중...")
+        
+        # 게시글 링크 수집 (미리 받아 둔 페이지가 있으면 바로 사용)
+        post_links = []
+        page_ids = []
+        # 이 페이지에서 큐에 등록하고 본문을 요청할 게시글 {post_id: post_data}
+        queued = {}
+        page_started = time.perf_counter()
+        links = pager.get(keyword, page)
+        if links is None:
+            break
+        print(f"[DEBUG] Found {len(links)} post links on page {page}")
+        for link in links:
+            post_url = link['href']
+            if not post_url or 'ArticleRead' not in post_url:
+                continue
+            article_id_match = re.search(r'articleid=(\d+)', post_url)
+            if not article_id_match:
+                continue
+            post_id = article_id_match.group(1)
+            page_ids.append(post_id)
+            # 이번 사이클에 다른 키워드로 이미 수집했거나 수집 중인 게시글은 키워드만 추가
+            if post_id in fetch_queue:
+                fetch_queue.add(post_id, keyword)
+                cycle.keyword_updated_ids.add(post_id)
+                print(f"[DEBUG] 이번 사이클에 이미 수집된 게시글 건너뜀: {post_id}")
+                continue
+            # 이미 수집된 게시글이라도 content가 비어있으면 다시 크롤링
+            if post_id in id_content_map and str(id_content_map[post_id]).strip() != '':
+                print(f"[DEBUG] 이미 수집된 게시글(본문 있음) 건너뜀: {post_id}")
+                continue
+            elif post_id in id_content_map:
+                print(f"[DEBUG] 이미 수집된 게시글(본문 비어있음) 재수집: {post_id}")
+            title = link['title']
+            if not title:
+                continue
+            # 네이버는 상대경로로 주므로 절대경로로 변환
+            if post_url.startswith('/'):
+                post_url = 'https://cafe.naver.com' + post_url
+            # 본문을 요청하기 전에 큐에 등록 (동시에 실행되는 다른 키워드 작업이 같은 게시글을 다시 요청하지 않도록)
+            post_data = {
+                'id': post_id,
+                'title': title,
+                'content': '',
+                'image_urls': '',
+                'url': post_url,
+                'keyword': keyword,
+                'crawled_at': '',
+            }
+            if not fetch_queue.add(post_id, keyword, post_data):
+                cycle.keyword_updated_ids.add(post_id)
+                print(f"[DEBUG] 다른 키워드 작업이 수집 중인 게시글 건너뜀: {post_id}")
+                continue
+            queued[post_id] = post_data
+            post_links.append((post_id, post_url, title))
+
+        if not page_ids:
+            print("[INFO] 검색 결과가 없습니다.")
+            break
+        newest_id = max([newest_id] + [int(post_id) for post_id in page_ids])
+        if not post_links and cycle.watermarks.is_caught_up('gotousa', keyword, page_ids):
+            # 이전 크롤링 이후 새 글이 없으면 이후 페이지는 모두 이미 수집된 글
+            print(f"[INFO] 키워드 '{keyword}' watermark 도달 (페이지 {page}), 페이지 순회 중단")
+            break
+        # 이 페이지의 게시글을 처리하는 동안 다음 페이지를 미리 요청
+        if not pager.is_last_page(links):
+            pager.prefetch(keyword, page + 1)
+
+        results = cycle.fetch_posts(post_links)
+        page_posts = []
+        for post_id, post_url, title, content, image_urls in results:
+            print(f"[DEBUG] post_id: {post_id}")
+            print(f"[DEBUG] title: {title}")
+            print(f"[DEBUG] content: {content[:100]}...")
+            # 큐에 등록해 둔 dict를 채움 (그동안 다른 키워드 작업이 추가한 키워드는 유지)
+            post_data = queued.pop(post_id)
+            post_data.update(
+                content=content,
+                image_urls=','.join(image_urls),
+                crawled_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            )
+            page_posts.append(post_data)
+            id_content_map[post_id] = content
+        # 가져오지 못한 게시글은 큐에서 빼서 다른 작업이나 다음 사이클에서 다시 요청
+        fetch_queue.discard(list(queued))
+        
+        # 페이지 단위로 한 번에 저장
+        cycle.add_changed(save_posts(cycle.store, page_posts))
+        collected += len(page_posts)
+        page_elapsed = time.perf_counter() - page_started
+        per_post = page_elapsed / len(post_links) if post_links else 0
+        print(f"[INFO] 페이지 {page}에서 {len(post_links)}개 게시글 수집 완료 "
+              f"({page_elapsed:.1f}s, 게시글당 {per_post:.2f}s)")
+        
+        # userDisplay보다 적게 나오면 마지막 페이지
+        if pager.is_last_page(links):
+            print("[INFO] 더 이상 다음 페이지가 없습니다.")
+            break
+        page += 1
     
-    # Chrome 드라이버 시작
-    service = Service(config['naver']['chromedriver_path'])
-    driver = None
-    try:
-        print("[INFO] Chrome 드라이버 시작 중...")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.set_page_load_timeout(30)  # 30초 페이지 로드 타임아웃
+    cycle.watermarks.update('gotousa', keyword, newest_id)
+    print(f"[INFO] 키워드 '{keyword}' 크롤링 완료")
+    return collected
+
+class SiteRunner:
+    """
+    브라우저 로그인과 게시글/목록 fetch 경로를 열어 두고 키워드를 수집
+    - crawl_posts는 사이클마다 열고 닫음
+    - 스케줄러(scheduler.py)는 계속 열어 두고 키워드 작업마다 run(keyword)를 호출
+      작업들은 CrawlCycle 하나를 공유하고, 모든 키워드가 한 번씩 실행될 때마다 cycle.finish()로 큐를 비움
+      CSV는 게시글을 저장한 작업이 끝날 때 export_interval_minutes마다 한 번 내보냄 (common.keyword_scheduler.ExportTimer)
+    """
+    name = 'gotousa'
+
+    def __init__(self, config, store=None, watermarks=None):
+        self.config = config
+        self.keywords = config['keywords']
+        self.store = store or open_post_store(config)
+        self.watermarks = watermarks or load_watermarks(config)
+        self.session = NaverSession(config, user_agent=USER_AGENT)
+        self.recorder = open_recorder(config)
+        naver_config = config['naver']
+        # 목록/게시글/브라우저 요청이 모두 같은 카페로 가므로 속도 제어기 하나를 공유
+        self.rate = rate_controller_from_config(naver_config)
+        self.fetch_mode = naver_config.get('fetch_mode', 'browser')
+        # http 모드는 브라우저를 로그인에만 쓰므로 검색 결과 페이지도 항상 HTTP로 요청
+        self.listing_fetch = 'http' if self.fetch_mode == 'http' else naver_config.get('listing_fetch', 'browser')
+        # 브라우저 경로는 드라이버 하나(browser) 또는 결과 큐 하나(pool)를 공유하므로 한 번에 한 키워드만 처리
+        self.max_concurrency = None if self.fetch_mode == 'http' else 1
+        self.driver = None
+        self.http_engine = None
+        self.listing_engine = None
+        self.browser_pool = None
+        self.pager = None
+        self.fetch_posts = None
+        self.cycle = None
+        self.cycle_keywords = set()
+        self.export_timer = ExportTimer(config['naver'].get('scheduler', {}))
+        self.lock = threading.Lock()
+        # 진행 중인 키워드 작업 수, 실패한 작업이 있으면 진행 중인 작업이 모두 끝난 뒤 fetch 경로를 닫음
+        self.active_jobs = 0
+        self.failed = False
+
+    def login_http(self) -> bool:
+        """
+        http 모드 로그인: 저장된 쿠키가 유효하면 Chrome을 띄우지 않고,
+        만료되었으면 Chrome으로 로그인해 쿠키만 저장한 뒤 바로 닫음
+        """
+        cookies = self.session.load_cookies()
+        if cookies and self.session.is_valid(cookies):
+            print("[INFO] 저장된 네이버 세션 재사용 (브라우저 없이 HTTP로 수집)")
+            return True
+        print("[INFO] 저장된 세션이 없거나 만료됨. Chrome으로 네이버 로그인 시도 중...")
+        driver = create_driver(self.config)
         driver.implicitly_wait(10)
+        try:
+            return login_to_naver(driver, self.config, self.session)
+        finally:
+            print("[INFO] 로그인용 Chrome 드라이버 종료")
+            driver.quit()
+
+    def open(self) -> bool:
+        """Chrome 시작, 로그인, fetch 경로 준비. 로그인에 실패하면 False"""
+        config = self.config
+        if self.fetch_mode == 'http':
+            if not self.login_http():
+                print("[ERROR] 네이버 로그인 실패")
+                return False
+        else:
+            print("[INFO] Chrome 드라이버 시작 중...")
+            self.driver = create_driver(config)
+            self.driver.implicitly_wait(10)
+            if not ensure_naver_login(self.driver, config, self.session):
+                print("[ERROR] 네이버 로그인 실패")
+                return False
         
-        print("[INFO] 네이버 로그인 시도 중...")
-        if not login_to_naver(driver, config):
-            print("[ERROR] 네이버 로그인 실패")
-            return
+        # fetch_mode
+        # - browser: 게시글을 같은 브라우저의 새 탭에서 하나씩 처리 (기본값)
+        # - http: 게시글 본문과 검색 결과 페이지를 로그인 쿠키로 HTTP 요청 (브라우저는 로그인에만 사용)
+        # - pool: 로그인 쿠키를 공유하는 headless Chrome 워커 프로세스들이 게시글을 나눠 처리
+        if self.fetch_mode == 'http':
+            self.http_engine = create_http_engine(config, self.session.requests_session(), self.recorder, self.rate)
+            self.fetch_posts = lambda post_links: fetch_posts_http(self.http_engine, config, post_links)
+        elif self.fetch_mode == 'pool':
+            self.browser_pool = BrowserPool(config, self.session.load_cookies(), self.rate)
+            print(f"[INFO] 브라우저 워커 {self.browser_pool.size}개 시작")
+            self.fetch_posts = self.browser_pool.fetch
+        else:
+            self.fetch_posts = lambda post_links: fetch_posts_browser(self.driver, config, post_links, self.rate)
         
-        for keyword in config['keywords']:
-            print(f"[INFO] 키워드 '{keyword}' 검색 시작")
-            
-            # 검색 페이지로 이동
-            if not search_in_cafe(driver, keyword):
-                continue
-            
-            new_posts = []
-            page = 1
-            
-            while True:
-                print(f"[INFO] 페이지 {page} 처리 중...")
-                
-                # 게시글 링크 수집
-                post_links = []
-                elements = driver.find_elements(By.CSS_SELECTOR, 'div.board-list a.article')
-                print(f"[DEBUG] Found {len(elements)} post links on page {page}")
-                for element in elements:
-                    post_url = element.get_attribute('href')
-                    if not post_url or 'ArticleRead' not in post_url:
-                        continue
-                    article_id_match = re.search(r'articleid=(\d+)', post_url)
-                    if not article_id_match:
-                        continue
-                    post_id = article_id_match.group(1)
-                    # 이미 수집된 게시글이라도 content가 비어있으면 다시 크롤링
-                    if post_id in id_content_map and str(id_content_map[post_id]).strip() != '':
-                        print(f"[DEBUG] 이미 수집된 게시글(본문 있음) 건너뜀: {post_id}")
-                        continue
-                    elif post_id in id_content_map:
-                        print(f"[DEBUG] 이미 수집된 게시글(본문 비어있음) 재수집: {post_id}")
-                    title = element.text.strip()
-                    if not title:
-                        continue
-                    # 네이버는 상대경로로 주므로 절대경로로 변환
-                    if post_url.startswith('/'):
-                        post_url = 'https://cafe.naver.com' + post_url
-                    post_links.append((post_id, post_url, title))
-
-                if not post_links:
-                    print("[INFO] 검색 결과가 없습니다.")
-                    break
-
-                for post_id, post_url, title in post_links:
-                    try:
-                        driver.execute_script("window.open(arguments[0]);", post_url)
-                        driver.switch_to.window(driver.window_handles[-1])
-                        content, image_urls = get_post_content_and_images(driver, post_url)
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[0])
-                        driver.switch_to.default_content()
-                        WebDriverWait(driver, 10).until(
-                            EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
-                        )
-                        print(f"[DEBUG] post_id: {post_id}")
-                        print(f"[DEBUG] title: {title}")
-                        print(f"[DEBUG] content: {content[:100]}...")
-                        post_data = {
-                            'id': post_id,
-                            'title': title,
-                            'content': content,
-                            'image_urls': ','.join(image_urls),
-                            'url': post_url,
-                            'keyword': keyword,
-                            'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        save_posts([post_data], data_path)
-                        id_content_map[post_id] = content
-                        time.sleep(0.2)
-                    except Exception as e:
-                        print(f"[WARNING] 게시글 처리 중 오류: {e}")
-                        continue
-                
-                print(f"[INFO] 페이지 {page}에서 {len(post_links)}개 게시글 수집 완료")
-                
-                # 다음 페이지 이동
+        # listing_fetch: http 이면 (fetch_mode가 http면 항상) 검색 결과 페이지도 로그인 쿠키로 HTTP 요청하고
+        # 다음 페이지를 미리 받아 둠. browser(기본값)는 드라이버로 한 페이지씩 열며 미리 받지 않음
+        if self.listing_fetch == 'http':
+            self.listing_engine = create_listing_engine(config, self.session.requests_session(), self.recorder, self.rate)
+        else:
+            print("[INFO] 검색 결과 페이지는 브라우저로 불러옴 (다음 페이지 미리 받기는 listing_fetch: http 에서만 동작)")
+        self.pager = ListingPager(config, self.driver, self.listing_engine)
+        return True
+
+    def crawl(self, keywords) -> dict:
+        """Returns: {keyword: 새로 수집한 게시글 수}"""
+        cycle = CrawlCycle(self.config, self.store, self.pager, self.fetch_posts, self.watermarks)
+        counts = {}
+        try:
+            for keyword in keywords:
+                counts[keyword] = crawl_keyword(cycle, keyword)
+        finally:
+            cycle.finish()
+        return counts
+
+    def run(self, keyword) -> int:
+        """
+        스케줄러 작업 하나. 실패하면 진행 중인 다른 작업이 모두 끝난 뒤 브라우저/엔진을 닫아
+        다음 작업에서 다시 로그인 (fetch 경로가 닫혀 있으면 진행 중인 작업도 없음)
+        """
+        with self.lock:
+            if self.pager is None:
                 try:
-                    # 여러 방법으로 다음 페이지 버튼 찾기
-                    next_page_elem = None
-                    
-                    # 방법 1: prev-next 영역에서 다음 페이지 번호 찾기
-                    pagination = driver.find_elements(By.CSS_SELECTOR, 'div.prev-next a')
-                    current_page = page
-                    
-                    print(f"[DEBUG] 페이지네이션 요소 {len(pagination)}개 발견")
-                    for a in pagination:
-                        try:
-                            page_text = a.text.strip()
-                            print(f"[DEBUG] 페이지 버튼: '{page_text}'")
-                            page_num = int(page_text)
-                            if page_num > current_page:
-                                next_page_elem = a
-                                print(f"[DEBUG] 다음 페이지 {page_num} 발견")
-                                break
-                        except Exception as e:
-                            print(f"[DEBUG] 페이지 번호 파싱 실패: {e}")
-                            continue
-                    
-                    # 방법 2: 다음 페이지 버튼 직접 찾기
-                    if not next_page_elem:
-                        try:
-                            next_selectors = [
-                                'a.pgR',  # 다음 페이지 버튼
-                                'a[href*="page=' + str(page + 1) + '"]',  # 다음 페이지 링크
-                                '.prev-next a:not(.on)',  # 현재 페이지가 아닌 버튼
-                                'a[onclick*="page=' + str(page + 1) + '"]'  # onclick으로 다음 페이지
-                            ]
-                            
-                            for selector in next_selectors:
-                                try:
-                                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                                    for elem in elements:
-                                        if elem.text.strip() and elem.text.strip().isdigit():
-                                            next_page_num = int(elem.text.strip())
-                                            if next_page_num > current_page:
-                                                next_page_elem = elem
-                                                print(f"[DEBUG] 다음 페이지 버튼 발견: {selector} -> {next_page_num}")
-                                                break
-                                    if next_page_elem:
-                                        break
-                                except:
-                                    continue
-                        except Exception as e:
-                            print(f"[DEBUG] 다음 페이지 버튼 찾기 실패: {e}")
-                    
-                    # 방법 3: 현재 페이지가 마지막 페이지인지 확인
-                    if not next_page_elem:
-                        try:
-                            # 현재 페이지가 마지막 페이지인지 확인
-                            current_page_elem = driver.find_element(By.CSS_SELECTOR, 'div.prev-next a.on')
-                            if current_page_elem:
-                                print("[DEBUG] 현재 페이지가 마지막 페이지로 확인됨")
-                        except:
-                            pass
-                    
-                    if next_page_elem:
-                        print(f"[INFO] 페이지 {page + 1}로 이동 중...")
-                        next_page_elem.click()
-                        time.sleep(3)  # 페이지 로딩 대기 시간 증가
-                        # 다음 페이지에서 iframe 재전환
-                        driver.switch_to.default_content()
-                        WebDriverWait(driver, 10).until(
-                            EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
-                        )
-                        page += 1
-                    else:
-                        print("[INFO] 더 이상 다음 페이지가 없습니다.")
-                        break
-                except Exception as e:
-                    print(f"[INFO] 다음 페이지 이동 중 오류: {e}")
-                    break
-            
-            print(f"[INFO] 키워드 '{keyword}' 크롤링 완료")
-        
+                    opened = self.open()
+                except Exception:
+                    self.close_fetchers()
+                    raise
+                if not opened:
+                    self.close_fetchers()
+                    raise RuntimeError("네이버 로그인 실패")
+            if self.cycle is None:
+                self.cycle = CrawlCycle(self.config, self.store, self.pager, self.fetch_posts, self.watermarks)
+            cycle = self.cycle
+            self.active_jobs += 1
+        try:
+            return crawl_keyword(cycle, keyword)
+        except Exception:
+            with self.lock:
+                self.failed = True
+            raise
+        finally:
+            self.end_job(keyword)
+
+    def end_job(self, keyword):
+        """
+        모든 키워드가 한 번씩 실행되었으면 (한 사이클) 사이클을 끝내고,
+        아니면 export 간격이 지났을 때 저장한 변경을 CSV로 내보냄 (cycle.changed가 없으면 내보내지 않음)
+        """
+        with self.lock:
+            self.active_jobs -= 1
+            if self.failed and self.active_jobs == 0:
+                self.failed = False
+                self.close_fetchers()
+                return
+            self.cycle_keywords.add(keyword)
+            cycle_done = self.cycle_keywords.issuperset(self.keywords)
+            if cycle_done:
+                self.cycle_keywords = set()
+            cycle = self.cycle
+            export_due = cycle is not None and cycle.changed > 0 and self.export_timer.due()
+        if cycle is None:
+            return
+        if cycle_done:
+            cycle.finish()
+        elif export_due:
+            cycle.flush()
+
+    def close_fetchers(self):
+        # fetch 경로를 닫으면 사이클도 끝냄 (다음 작업은 새 fetch 경로로 새 사이클 시작)
+        # 스케줄러에서는 self.lock을 잡고 진행 중인 작업이 없을 때만 호출
+        cycle, self.cycle = self.cycle, None
+        if cycle is not None:
+            cycle.finish()
+        if self.driver:
+            print("[INFO] Chrome 드라이버 종료")
+            self.driver.quit()
+        if self.http_engine is not None:
+            self.http_engine.close()
+        if self.listing_engine is not None:
+            self.listing_engine.close()
+        if self.browser_pool is not None:
+            self.browser_pool.close()
+        self.driver = self.http_engine = self.listing_engine = self.browser_pool = None
+        self.pager = self.fetch_posts = None
+
+    def close(self):
+        with self.lock:
+            self.close_fetchers()
+        self.store.close()
+
+def crawl_posts(config):
+    """게시글 크롤링 메인 함수"""
+    runner = SiteRunner(config)
+    try:
+        if runner.open():
+            runner.crawl(config['keywords'])
     except Exception as e:
         print(f"[ERROR] 크롤링 중 오류 발생: {e}")
     finally:
-        if driver:
-            print("[INFO] Chrome 드라이버 종료")
-            driver.quit()
+        runner.close()
 
 def main():
     """메인 함수"""
@@ -0,0 +1,67 @@
+import re
+
+from common.fetch_engine import FetchEngine
+from common.rate_control import rate_controller_from_config
+from article_parser import PERMISSION_DENIED, PERMISSION_NOTICE, parse_article_html
+
+# 게시글 본문 API (contentHtml에 브라우저에서 보이는 본문 HTML이 그대로 들어 있음)
+DEFAULT_ARTICLE_URL = 'https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{clubid}/articles/{articleid}?useCafeId=true'
+
+
+def _rate_factory(naver_config, rate):
+    """rate가 주어지면 모든 호스트가 그 속도 제어기를 공유 (사이트 전체 요청 속도를 하나로 제한)"""
+    if rate is not None:
+        return lambda: rate
+    return lambda: rate_controller_from_config(naver_config)
+
+
+def create_http_engine(config, session, recorder=None, rate=None):
+    """브라우저 로그인으로 얻은 쿠키를 담은 세션으로 FetchEngine 생성"""
+    naver_config = config['naver']
+    return FetchEngine(
+        max_workers=naver_config.get('max_workers', 4),
+        session=session,
+        headers={'Referer': 'https://cafe.naver.com/'},
+        recorder=recorder,
+        rate_controller_factory=_rate_factory(naver_config, rate),
+    )
+
+
+def create_listing_engine(config, session, recorder=None, rate=None):
+    """검색 결과 페이지용 FetchEngine (다음 페이지 미리 요청용 워커 하나)"""
+    naver_config = config['naver']
+    return FetchEngine(
+        max_workers=1,
+        session=session,
+        headers={'Referer': 'https://cafe.naver.com/'},
+        recorder=recorder,
+        rate_controller_factory=_rate_factory(naver_config, rate),
+    )
+
+
+def article_url(config, post_url: str) -> str:
+    clubid = re.search(r'clubid=(\d+)', post_url)
+    articleid = re.search(r'articleid=(\d+)', post_url)
+    template = config['naver'].get('article_url', DEFAULT_ARTICLE_URL)
+    return template.format(clubid=clubid.group(1) if clubid else '', articleid=articleid.group(1) if articleid else '')
+
+
+def fetch_article(engine, url: str, parser=None) -> tuple:
+    """
+    HTTP로 게시글을 가져와 본문과 이미지 URL 추출
+    JSON(게시글 API)이면 contentHtml을, HTML이면 페이지 전체를 같은 셀렉터로 파싱
+    """
+    resp = engine.get(url)
+    if 'json' not in resp.headers.get('Content-Type', ''):
+        resp.raise_for_status()
+        return parse_article_html(resp.text, parser)
+
+    result = resp.json().get('result', {})
+    article = result.get('article')
+    if not article:
+        # 권한 없는 게시글은 오류 응답에 브라우저와 같은 안내문이 담겨 옴
+        if PERMISSION_NOTICE in resp.text:
+            return PERMISSION_DENIED, []
+        resp.raise_for_status()
+        raise ValueError(f"게시글 API 응답에 본문이 없습니다: {resp.text[:200]}")
+    return parse_article_html(article.get('contentHtml', ''), parser)
@@ -0,0 +1,89 @@
+import urllib.parse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from common.html_parser import HtmlParser, parser_from_config
+from dom_scripts import collect_links
+
+DEFAULT_SEARCH_URL = ("https://cafe.naver.com/ArticleSearchList.nhn?search.clubid=10854519&search.searchBy=0"
+                      "&search.query={keyword}&search.page={page}&userDisplay={display}")
+
+
+def parse_listing_html(html: str, parser: HtmlParser = None) -> list:
+    """검색 결과 HTML에서 게시글 링크 추출 (dom_scripts.COLLECT_LINKS_JS와 같은 결과 형식)"""
+    parser = parser or HtmlParser()
+    doc = parser.parse(html, only=('div', {'class': 'board-list'}))
+    return [
+        {'href': urllib.parse.urljoin('https://cafe.naver.com/', parser.attr(a, 'href') or ''),
+         'title': parser.text(a, strip=True)}
+        for a in parser.select(doc, 'div.board-list a.article')
+    ]
+
+
+class ListingPager:
+    """
+    검색 결과 페이지를 URL 템플릿(search.page=N&userDisplay=M)으로 직접 요청
+    - 다음 페이지 버튼 탐색/클릭/대기 없이 페이지 이동
+    - engine(FetchEngine)이 주어지면 HTTP로 요청하고, 현재 페이지의 게시글을 처리하는 동안
+      다음 페이지를 engine의 워커 스레드에서 미리 받아 둠
+    - engine 없이 브라우저로 목록을 여는 경우(listing_fetch: browser)는 미리 받지 않음
+      (드라이버 하나를 게시글 처리와 함께 쓰므로 동시에 다른 페이지를 열 수 없음, prefetch는 아무것도 하지 않음)
+    """
+    def __init__(self, config, driver, engine=None):
+        naver_config = config['naver']
+        self.search_url = naver_config.get('search_url', DEFAULT_SEARCH_URL)
+        self.display = naver_config.get('user_display', 50)
+        self.save_debug_html = naver_config.get('save_debug_html', False)
+        self.driver = driver
+        self.engine = engine
+        self.parser = parser_from_config(naver_config)
+        self.prefetched = {}
+
+    def url(self, keyword: str, page: int) -> str:
+        keyword_encoded = urllib.parse.quote(keyword, encoding='euc-kr')
+        return self.search_url.format(keyword=keyword_encoded, page=page, display=self.display)
+
+    def get(self, keyword: str, page: int):
+        """Returns: [{href, title}, ...], 페이지를 불러오지 못하면 None"""
+        future = self.prefetched.pop((keyword, page), None)
+        if future is not None:
+            return future.result()
+        if self.engine is not None:
+            return self._fetch_http(keyword, page)
+        return self._load_browser(keyword, page)
+
+    def prefetch(self, keyword: str, page: int):
+        """HTTP 목록일 때만 다음 페이지를 미리 요청 (브라우저 목록은 get에서 그때 불러옴)"""
+        if self.engine is not None and (keyword, page) not in self.prefetched:
+            self.prefetched[(keyword, page)] = self.engine.submit(self._fetch_http, keyword, page)
+
+    def is_last_page(self, links: list) -> bool:
+        """한 페이지에 userDisplay보다 적은 게시글이 있으면 마지막 페이지"""
+        return len(links) < self.display
+
+    def _fetch_http(self, keyword: str, page: int):
+        try:
+            resp = self.engine.get(self.url(keyword, page), encoding='cp949')
+            resp.raise_for_status()
+            return parse_listing_html(resp.text, self.parser)
+        except Exception as e:
+            print(f"[ERROR] 검색 결과 페이지 {page} 요청 실패: {e}")
+            return None
+
+    def _load_browser(self, keyword: str, page: int):
+        self.driver.switch_to.default_content()
+        self.driver.get(self.url(keyword, page))
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.frame_to_be_available_and_switch_to_it((By.ID, "cafe_main"))
+            )
+        except Exception:
+            print("[ERROR] cafe_main iframe을 찾을 수 없습니다.")
+            return None
+        if self.save_debug_html and page == 1:
+            with open("cafe_main_iframe_debug.html", "w", encoding="utf-8", errors="replace") as f:
+                f.write(self.driver.page_source)
+            print("[DEBUG] Saved cafe_main_iframe_debug.html for selector inspection.")
+        return collect_links(self.driver)
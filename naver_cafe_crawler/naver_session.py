@@ -0,0 +1,80 @@
+import json
+import os
+import time
+
+import requests
+
+# 네이버 로그인 상태를 나타내는 인증 쿠키
+AUTH_COOKIES = ('NID_AUT', 'NID_SES')
+
+
+class NaverSession:
+    """
+    네이버 로그인 세션 관리
+    - 로그인에 성공하면 브라우저 쿠키를 cookie_path에 저장
+    - 다음 사이클에는 저장된 쿠키를 요청 한 번으로 검증하고, 유효하면 로그인 과정을 건너뜀
+    - 만료된 경우에만 다시 로그인
+    """
+    def __init__(self, config, user_agent: str = 'Mozilla/5.0'):
+        naver_config = config['naver']
+        # 저장소에 올리지 않도록 .gitignore에서 제외됨 (파일 권한 0600)
+        self.cookie_path = naver_config.get('cookie_path', 'data/naver_cookies.json')
+        # 로그인하지 않은 상태면 nidlogin 페이지로 리다이렉트되는 페이지
+        self.check_url = naver_config.get('session_check_url', 'https://nid.naver.com/user2/help/myInfo')
+        self.user_agent = user_agent
+
+    def load_cookies(self) -> list:
+        if not os.path.exists(self.cookie_path):
+            return []
+        with open(self.cookie_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_cookies(self, cookies: list):
+        dirname = os.path.dirname(self.cookie_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        tmp_path = self.cookie_path + '.tmp'
+        # 로그인 쿠키(NID_AUT/NID_SES)는 평문이므로 소유자만 읽고 쓸 수 있게 만듦
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.cookie_path)
+
+    def requests_session(self, cookies: list = None) -> requests.Session:
+        """저장된 (또는 주어진) 쿠키를 담은 requests 세션"""
+        session = requests.Session()
+        session.headers['User-Agent'] = self.user_agent
+        for cookie in (cookies if cookies is not None else self.load_cookies()):
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain', '.naver.com'), path=cookie.get('path', '/'))
+        return session
+
+    def is_valid(self, cookies: list) -> bool:
+        """인증 쿠키가 있고 만료되지 않았으며, 확인 페이지가 로그인 페이지로 보내지 않으면 유효"""
+        names = {cookie['name']: cookie for cookie in cookies}
+        now = time.time()
+        for name in AUTH_COOKIES:
+            cookie = names.get(name)
+            if cookie is None or ('expiry' in cookie and cookie['expiry'] < now):
+                return False
+        try:
+            with self.requests_session(cookies) as session:
+                resp = session.get(self.check_url, allow_redirects=False, timeout=10)
+        except requests.RequestException as e:
+            print(f"[WARNING] 세션 확인 요청 실패: {e}")
+            return False
+        if resp.is_redirect and 'nidlogin' in resp.headers.get('Location', ''):
+            return False
+        return resp.status_code == 200
+
+    def apply_to_driver(self, driver, cookies: list):
+        """브라우저에 쿠키 주입 (쿠키 도메인의 페이지에 먼저 접속해야 함)"""
+        driver.get('https://www.naver.com/robots.txt')
+        for cookie in cookies:
+            cookie = {k: v for k, v in cookie.items() if k in ('name', 'value', 'domain', 'path', 'expiry', 'secure', 'httpOnly')}
+            try:
+                driver.add_cookie(cookie)
+            except Exception as e:
+                print(f"[DEBUG] 쿠키 설정 실패 ({cookie['name']}): {e}")
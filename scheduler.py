@@ -0,0 +1,87 @@
+"""
+missyusa / gotousa 키워드 작업을 한 프로세스에서 함께 실행하는 스케줄러
+
+    python scheduler.py --mu-config missyusa_crawler/config.yaml --gu-config naver_cafe_crawler/config.yaml
+
+각 크롤러의 main() 루프(사이클마다 전체 키워드를 순서대로 처리한 뒤 interval_minutes만큼 대기) 대신,
+키워드마다 따로 실행 시각을 두고 사이트별 동시 작업 수 안에서 동시에 실행한다.
+설정 파일의 상대 경로(data_path 등)는 이 스크립트를 실행한 디렉토리 기준이다.
+
+사이트 설정의 scheduler 항목 (missyusa: missyusa.scheduler, gotousa: naver.scheduler)
+    interval_minutes: 시작 간격 (기본값: 사이트의 interval_minutes)
+    min_interval_minutes / max_interval_minutes: 간격 하한/상한 (기본값: 시작 간격의 1/4, 4배)
+    concurrency: 동시에 실행할 키워드 작업 수 (기본값 2, gotousa는 fetch_mode가 http가 아니면 항상 1)
+    hot_factor / cold_factor / jitter
+    export_interval_minutes: 저장한 게시글이 있으면 이 간격마다 CSV로 내보냄 (기본값 10, 종료할 때도 내보냄)
+"""
+import argparse
+import os
+import sys
+
+import yaml
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for path in (ROOT, os.path.join(ROOT, 'missyusa_crawler'), os.path.join(ROOT, 'naver_cafe_crawler')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from common.keyword_scheduler import KeywordScheduler, SiteSchedule
+from common.watermark import WatermarkStore
+
+SITES = ('missyusa', 'gotousa')
+
+
+def load_yaml(path):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return yaml.safe_load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='missyusa/gotousa 키워드 스케줄러')
+    parser.add_argument('--mu-config', default=os.path.join('missyusa_crawler', 'config.yaml'))
+    parser.add_argument('--gu-config', default=os.path.join('naver_cafe_crawler', 'config.yaml'))
+    parser.add_argument('--sites', nargs='+', choices=SITES, default=list(SITES))
+    parser.add_argument('--stats-path', default=os.path.join('data', 'scheduler_stats.json'))
+    args = parser.parse_args()
+
+    # 두 사이트가 같은 watermark 파일을 쓰면 저장소 하나를 공유해야 서로 덮어쓰지 않음
+    watermark_stores = {}
+
+    def watermarks_for(config):
+        path = config.get('watermark_path', 'data/watermarks.json')
+        if path not in watermark_stores:
+            watermark_stores[path] = WatermarkStore(path)
+        return watermark_stores[path]
+
+    scheduler = KeywordScheduler(stats_path=args.stats_path)
+    runners = []
+    try:
+        if 'missyusa' in args.sites:
+            from mu_crawler import SiteRunner as MissyusaRunner
+            config = load_yaml(args.mu_config)
+            runner = MissyusaRunner(config, watermarks_for(config))
+            runners.append(runner)
+            scheduler.add_site(runner, SiteSchedule.from_config(
+                config['missyusa'].get('scheduler', {}), config['missyusa']['interval_minutes']))
+        if 'gotousa' in args.sites:
+            from gu_crawler import SiteRunner as GotousaRunner
+            config = load_yaml(args.gu_config)
+            runner = GotousaRunner(config, watermarks=watermarks_for(config))
+            runners.append(runner)
+            scheduler.add_site(runner, SiteSchedule.from_config(
+                config['naver'].get('scheduler', {}), config['interval_minutes'], runner.max_concurrency))
+
+        for name, schedule in scheduler.schedules.items():
+            print(f"[INFO] {name}: 키워드 {len(scheduler.runners[name].keywords)}개, "
+                  f"동시 작업 {schedule.concurrency}개, 간격 {schedule.min_interval / 60:g}~{schedule.max_interval / 60:g}분")
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        print("[INFO] 스케줄러 종료 중...")
+        scheduler.stop()
+    finally:
+        for runner in runners:
+            runner.close()
+
+
+if __name__ == '__main__':
+    main()
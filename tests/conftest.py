@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# data/, naver_cafe_crawler/ 모듈은 스크립트처럼 같은 디렉토리 기준으로 import함
+for path in (ROOT, os.path.join(ROOT, 'data'), os.path.join(ROOT, 'naver_cafe_crawler')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
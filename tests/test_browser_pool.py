@@ -0,0 +1,82 @@
+import queue
+import threading
+
+import pytest
+
+from browser_pool import READY, BrowserPool
+
+
+class DeadProcess:
+    """Chrome을 띄우지 못하고 바로 종료된 워커 프로세스"""
+    started = 0
+    exitcode = 1
+
+    def __init__(self, target, args, daemon):
+        self.worker_id = args[0]
+        self.results = args[4]
+
+    def start(self):
+        DeadProcess.started += 1
+
+    def is_alive(self):
+        return False
+
+    def join(self, timeout=None):
+        pass
+
+
+class ReadyThenDeadProcess(DeadProcess):
+    """준비 표시를 보낸 뒤 종료된 워커 (시작 실패가 아님)"""
+    def start(self):
+        super().start()
+        self.results.put((READY, self.worker_id, None, None, 0))
+
+
+class FakeContext:
+    def __init__(self, process_class):
+        self.Process = process_class
+
+
+class FakeRate:
+    def try_acquire(self):
+        return 0.0
+
+
+def make_pool(process_class, size=2):
+    pool = BrowserPool.__new__(BrowserPool)
+    pool.size = size
+    pool.max_pages = 200
+    pool.max_rss_mb = 0
+    pool.task_timeout = 1
+    pool.max_startup_failures = 3
+    pool.startup_failures = 0
+    pool.config = {}
+    pool.cookies = []
+    pool.rate = FakeRate()
+    pool.latency_target = 1.0
+    pool.ctx = FakeContext(process_class)
+    pool.tasks = queue.Queue()
+    pool.results = queue.Queue()
+    pool.workers = {}
+    pool.ready = set()
+    pool.next_worker_id = 0
+    pool.lock = threading.Lock()
+    for _ in range(size):
+        pool._start_worker()
+    return pool
+
+
+def test_startup_failures_stop_respawning():
+    DeadProcess.started = 0
+    pool = make_pool(DeadProcess)
+    with pytest.raises(RuntimeError):
+        pool.fetch([('1', 'https://cafe.naver.com/a', '제목')])
+    # 처음 띄운 두 개 + 실패를 세는 동안 다시 띄운 워커만 (제한 없이 계속 띄우지 않음)
+    assert DeadProcess.started == 2 + pool.max_startup_failures - 1
+
+
+def test_ready_workers_are_not_startup_failures():
+    ReadyThenDeadProcess.started = 0
+    pool = make_pool(ReadyThenDeadProcess)
+    assert pool.fetch([('1', 'https://cafe.naver.com/a', '제목')]) == []
+    assert pool.startup_failures == 0
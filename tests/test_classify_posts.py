@@ -0,0 +1,52 @@
+import pandas as pd
+
+from classify_posts import CLASSIFICATION_COLUMNS, process_csv_file
+
+
+def write_posts(path, rows):
+    pd.DataFrame(rows, columns=['id', 'title', 'content']).to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def read_output(path):
+    return pd.read_csv(path, encoding='utf-8-sig', dtype=str, keep_default_na=False).set_index('id')
+
+
+def test_process_csv_file_without_previous_output(tmp_path):
+    input_file = tmp_path / 'posts.csv'
+    output_file = tmp_path / 'posts_classified.csv'
+    write_posts(input_file, [
+        ('1', '사기 조심하세요', '전화로 돈을 요구합니다'),
+        ('2', '질문', '이거 어떻게 하나요?'),
+    ])
+
+    process_csv_file(str(input_file), str(output_file))
+
+    out = read_output(output_file)
+    assert list(out.index) == ['1', '2']
+    assert set(CLASSIFICATION_COLUMNS) <= set(out.columns)
+    assert out.loc['2', 'type'] == 'question'
+    assert (out['forward_passes'] == '0').all()
+
+
+def test_process_csv_file_reuses_previous_output(tmp_path):
+    input_file = tmp_path / 'posts.csv'
+    output_file = tmp_path / 'posts_classified.csv'
+    write_posts(input_file, [('1', '질문', '이거 어떻게 하나요?')])
+    process_csv_file(str(input_file), str(output_file))
+
+    # 이전 결과를 바꿔 두면 같은 id는 다시 분류하지 않고 그대로 가져와야 함
+    previous = read_output(output_file)
+    previous.loc['1', 'type'] = 'advice'
+    previous.reset_index().to_csv(output_file, index=False, encoding='utf-8-sig')
+    write_posts(input_file, [
+        ('3', '경고', '사기 피해 주의'),
+        ('1', '질문', '이거 어떻게 하나요?'),
+    ])
+
+    process_csv_file(str(input_file), str(output_file))
+
+    out = read_output(output_file)
+    assert list(out.index) == ['3', '1']
+    assert out.loc['1', 'type'] == 'advice'
+    assert out.loc['3', 'type'] == 'warning'
+    assert out.loc['3', 'forward_passes'] == '0'
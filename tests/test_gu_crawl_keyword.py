@@ -0,0 +1,71 @@
+import threading
+
+import gu_crawler
+from gu_crawler import CrawlCycle, crawl_keyword
+
+
+class FakeStore:
+    def __init__(self):
+        self.rows = {}
+        self.lock = threading.Lock()
+
+    def id_content_map(self):
+        return {}
+
+    def upsert(self, posts):
+        with self.lock:
+            for post in posts:
+                self.rows[post['id']] = dict(post)
+        return len(posts)
+
+    def export_csv(self, *args, **kwargs):
+        pass
+
+
+class FakeWatermarks:
+    def is_caught_up(self, *args):
+        return False
+
+    def update(self, *args):
+        pass
+
+
+class FakePager:
+    """두 키워드 모두 같은 게시글 세 개가 나오는 한 페이지짜리 검색 결과"""
+    def get(self, keyword, page):
+        return [{'href': f'https://cafe.naver.com/ArticleRead.nhn?clubid=1&articleid={i}', 'title': f'제목 {i}'}
+                for i in (101, 102, 103)]
+
+    def is_last_page(self, links):
+        return True
+
+    def prefetch(self, keyword, page):
+        pass
+
+
+def test_concurrent_keyword_jobs_fetch_each_post_once(monkeypatch):
+    monkeypatch.setattr(gu_crawler, 'export_posts', lambda store, config: None)
+    fetched = []
+    # 두 작업이 모두 목록을 본 뒤에 본문 요청이 끝나도록 첫 요청을 잠시 붙잡아 둠
+    both_listed = threading.Barrier(2, timeout=5)
+
+    def fetch_posts(post_links):
+        fetched.extend(post_id for post_id, _, _ in post_links)
+        try:
+            both_listed.wait()
+        except threading.BrokenBarrierError:
+            pass
+        return [(post_id, post_url, title, f'본문 {post_id}', []) for post_id, post_url, title in post_links]
+
+    store = FakeStore()
+    cycle = CrawlCycle({'naver': {'data_path': 'unused.csv'}}, store, FakePager(), fetch_posts, FakeWatermarks())
+    jobs = [threading.Thread(target=crawl_keyword, args=(cycle, keyword)) for keyword in ('사기', '스캠')]
+    for job in jobs:
+        job.start()
+    for job in jobs:
+        job.join()
+    cycle.finish()
+
+    assert sorted(fetched) == ['101', '102', '103']
+    assert {row['content'] for row in store.rows.values()} == {'본문 101', '본문 102', '본문 103'}
+    assert all(set(row['keyword'].split(',')) == {'사기', '스캠'} for row in store.rows.values())
@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+
+import gu_crawler
+from common.keyword_scheduler import ExportTimer
+from gu_crawler import SiteRunner
+
+
+class FakeCycle:
+    def __init__(self):
+        self.changed = 0
+        self.flushed = 0
+        self.finished = 0
+
+    def flush(self):
+        self.flushed += 1
+        self.changed = 0
+
+    def finish(self):
+        self.finished += 1
+        self.changed = 0
+
+
+def make_runner():
+    """브라우저/로그인 없이 스케줄러 작업 상태만 가진 SiteRunner"""
+    runner = SiteRunner.__new__(SiteRunner)
+    runner.keywords = ['사기', '스캠']
+    runner.pager = object()
+    runner.cycle = FakeCycle()
+    runner.cycle_keywords = set()
+    runner.export_timer = ExportTimer({'export_interval_minutes': 10})
+    runner.lock = threading.Lock()
+    runner.active_jobs = 0
+    runner.failed = False
+    runner.closed = []
+    runner.close_fetchers = lambda: runner.closed.append(runner.active_jobs)
+    return runner
+
+
+def test_failed_job_waits_for_running_jobs_before_teardown(monkeypatch):
+    runner = make_runner()
+    slow_started = threading.Event()
+    release_slow = threading.Event()
+
+    def crawl_keyword(cycle, keyword):
+        if keyword == '사기':
+            slow_started.set()
+            release_slow.wait(5)
+            return 1
+        raise RuntimeError("세션 만료")
+
+    monkeypatch.setattr(gu_crawler, 'crawl_keyword', crawl_keyword)
+    slow = threading.Thread(target=runner.run, args=('사기',))
+    slow.start()
+    slow_started.wait(5)
+
+    with pytest.raises(RuntimeError):
+        runner.run('스캠')
+    # 다른 작업이 아직 fetch 경로를 쓰고 있으므로 닫지 않음
+    assert runner.closed == []
+
+    release_slow.set()
+    slow.join()
+    assert runner.closed == [0]
+    assert runner.active_jobs == 0 and not runner.failed
+
+
+def test_export_after_interval_without_full_keyword_cycle(monkeypatch):
+    runner = make_runner()
+    cycle = runner.cycle
+
+    def crawl_keyword(cycle, keyword):
+        cycle.changed += 1
+        return 1
+
+    monkeypatch.setattr(gu_crawler, 'crawl_keyword', crawl_keyword)
+    runner.run('사기')
+    # 간격이 지나지 않았으면 내보내지 않음
+    assert (cycle.flushed, cycle.finished) == (0, 0)
+
+    # '스캠'이 아직 실행되지 않았어도 간격이 지나면 저장한 게시글을 내보냄
+    runner.export_timer.last_export -= 10 * 60
+    runner.run('사기')
+    assert (cycle.flushed, cycle.finished) == (1, 0)
+
+    runner.run('스캠')
+    assert cycle.finished == 1
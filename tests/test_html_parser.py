@@ -0,0 +1,14 @@
+import pytest
+
+from common.html_parser import HtmlParser, available_backends
+
+# 본문 안의 <br> 사이에 공백뿐인 텍스트 노드가 있는 missyusa 게시글 형태
+ARTICLE = ('<html><body><div class="detail_content">첫 줄<br>\t\t  <br>둘째 줄<br> <br>'
+           '<p>  셋째 줄 </p></div></body></html>')
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_text_strip_skips_whitespace_only_nodes(backend):
+    parser = HtmlParser(backend)
+    node = parser.select_one(parser.parse(ARTICLE), 'div.detail_content')
+    assert parser.text(node, '\n', strip=True) == '첫 줄\n둘째 줄\n셋째 줄'
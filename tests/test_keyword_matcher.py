@@ -0,0 +1,70 @@
+import itertools
+
+import keyword_matcher
+import pytest
+from classify_posts import DEFAULT_METHOD_PATTERNS, DEFAULT_TOPIC_PATTERNS, DEFAULT_TYPE_PATTERNS
+from keyword_matcher import KeywordMatcher, is_regex
+
+
+def old_classify_with_keywords(text, patterns_dict, default='other', multi=False):
+    """KeywordMatcher 이전의 반복문 (카테고리/패턴마다 pattern.lower() in text)"""
+    if not text:
+        return default, 0, ''
+    text = str(text).lower()
+    matched = []
+    matched_keywords = []
+    for category, patterns in patterns_dict.items():
+        for pattern in patterns:
+            if pattern.lower() in text:
+                matched.append(category)
+                matched_keywords.append(pattern)
+                if not multi:
+                    return category, 1, pattern
+    if multi and matched:
+        return '+'.join(sorted(set(matched))), 1, '+'.join(sorted(set(matched_keywords)))
+    return default, 0, ''
+
+
+def literal_only(patterns_dict):
+    return {category: [pattern for pattern in patterns if not is_regex(pattern)]
+            for category, patterns in patterns_dict.items()}
+
+
+DIMENSIONS = {
+    'type': (literal_only(DEFAULT_TYPE_PATTERNS), 'discussion', False),
+    'scam_topic': (literal_only(DEFAULT_TOPIC_PATTERNS), 'other', False),
+    'scam_method': (literal_only(DEFAULT_METHOD_PATTERNS), '', True),
+}
+
+
+def sample_texts():
+    """기준마다 키워드 두 개씩 골라 순서를 바꿔 섞은 텍스트 (대소문자 섞음)"""
+    words = sorted({pattern for patterns_dict, _, _ in DIMENSIONS.values()
+                    for patterns in patterns_dict.values() for pattern in patterns})
+    texts = ['', '아무 키워드도 없는 글']
+    for i, (a, b) in enumerate(itertools.combinations(words[::3], 2)):
+        texts.append(f"제목 {a.upper() if i % 2 else a} 본문 {b}")
+    return texts
+
+
+@pytest.mark.parametrize('use_automaton', [True, False])
+def test_literal_patterns_match_old_loop(monkeypatch, use_automaton):
+    if not use_automaton:
+        monkeypatch.setattr(keyword_matcher, 'ahocorasick', None)
+    elif keyword_matcher.ahocorasick is None:
+        pytest.skip('pyahocorasick 없음')
+    matcher = KeywordMatcher(DIMENSIONS)
+    for text in sample_texts():
+        expected = {name: old_classify_with_keywords(text, patterns_dict, default, multi)
+                    for name, (patterns_dict, default, multi) in DIMENSIONS.items()}
+        assert matcher.classify(text) == expected, text
+
+
+def test_regex_anchor_matches_end_of_text():
+    matcher = KeywordMatcher({'type': ({'question': [r're:\?$']}, 'discussion', False)})
+    assert matcher.classify('이거 사기인가요?')['type'] == ('question', 1, r're:\?$')
+    # 중간 줄이 ?로 끝나도 텍스트 끝이 아니면 매칭하지 않음
+    assert matcher.classify('이거 사기인가요?\n아니었습니다')['type'] == ('discussion', 0, '')
+    # 줄 단위 매칭은 (?m)으로 켬
+    multiline = KeywordMatcher({'type': ({'question': [r're:(?m)\?$']}, 'discussion', False)})
+    assert multiline.classify('이거 사기인가요?\n아니었습니다')['type'][1] == 1
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from common.phash import PhashIndex, hamming
+
+
+def flip_bits(value, positions):
+    for position in positions:
+        value ^= 1 << position
+    return value
+
+
+@pytest.mark.parametrize('bands', [4, 8])
+def test_query_finds_every_near_duplicate_below_bands(bands):
+    rng = random.Random(0)
+    index = PhashIndex(bands=bands)
+    hashes = {f'img{i}': rng.getrandbits(64) for i in range(500)}
+    for key, value in hashes.items():
+        index.add(key, value)
+
+    max_distance = bands - 1
+    for key, value in list(hashes.items())[:100]:
+        # 바뀐 비트를 서로 다른 구간에 흩어 놓아 같은 구간이 가장 적게 남는 경우도 포함
+        distance = rng.randint(0, max_distance)
+        bands_hit = rng.sample(range(bands), distance)
+        positions = [band * index.band_bits + rng.randrange(index.band_bits) for band in bands_hit]
+        near = flip_bits(value, positions)
+
+        expected = sorted((other, hamming(near, other_value)) for other, other_value in hashes.items()
+                          if hamming(near, other_value) <= max_distance)
+        assert (key, distance) in expected
+        assert sorted(index.query(near, max_distance)) == expected
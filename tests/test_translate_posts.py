@@ -0,0 +1,105 @@
+import os
+
+import pandas as pd
+
+from translate_posts import translate_file
+from translation_cache import CachedTranslator, TranslationCache
+
+
+class FakeTranslator:
+    name = 'fake'
+    cache_id = 'fake'
+
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, texts):
+        self.calls.append(list(texts))
+        return [f"EN {text}" for text in texts]
+
+
+def write_posts(path, rows):
+    pd.DataFrame(rows, columns=['id', 'title', 'content']).to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def read_output(path):
+    return pd.read_csv(path, encoding='utf-8-sig', dtype=str).fillna('')
+
+
+def test_on_demand_counts_deferred_rows_separately(tmp_path):
+    input_file = str(tmp_path / 'posts.csv')
+    output_file = str(tmp_path / 'posts_translated.csv')
+    write_posts(input_file, [
+        ('1', '사기 문자', '링크를 눌렀어요'),
+        ('2', 'Scam text', 'I clicked the link'),
+    ])
+    cache = TranslationCache(str(tmp_path / 'cache.db'))
+    translator = CachedTranslator(FakeTranslator(), cache, cached_only=True)
+    try:
+        translated, untranslated = translate_file(input_file, output_file, 'utf-8-sig', translator)
+    finally:
+        cache.close()
+
+    # 영어 게시글만 채워지고 한국어 게시글은 번역을 미룸
+    assert (translated, untranslated) == (1, 1)
+    out = read_output(output_file)
+    assert out['Eng_title'].tolist() == ['', 'Scam text']
+
+
+class InterruptedTranslator(FakeTranslator):
+    """fail_after번째 호출에서 실패 (번역 도중 프로세스가 멈춘 경우)"""
+    def __init__(self, fail_after):
+        super().__init__()
+        self.fail_after = fail_after
+
+    def translate(self, texts):
+        if len(self.calls) >= self.fail_after:
+            raise RuntimeError('중단')
+        return super().translate(texts)
+
+
+POSTS = [(str(i), f'제목 {i}', f'본문 {i}') for i in range(1, 6)]
+
+
+def interrupted_run(input_file, output_file):
+    try:
+        translate_file(input_file, output_file, 'utf-8-sig', InterruptedTranslator(fail_after=2), chunk_size=2)
+    except RuntimeError:
+        pass
+    assert not os.path.exists(output_file)
+    assert os.path.exists(output_file + '.checkpoint.json')
+
+
+def test_resume_after_partial_run(tmp_path):
+    input_file = str(tmp_path / 'posts.csv')
+    output_file = str(tmp_path / 'posts_translated.csv')
+    write_posts(input_file, POSTS)
+    interrupted_run(input_file, output_file)
+
+    translator = FakeTranslator()
+    translated, _ = translate_file(input_file, output_file, 'utf-8-sig', translator, chunk_size=2)
+
+    # 앞의 두 chunk(4행)는 checkpoint에서 이어받고 마지막 행만 번역
+    assert translated == 1
+    assert translator.calls == [['제목 5', '본문 5']]
+    out = read_output(output_file)
+    assert out['id'].tolist() == ['1', '2', '3', '4', '5']
+    assert out['Eng_title'].tolist() == [f'EN 제목 {i}' for i in range(1, 6)]
+    assert not os.path.exists(output_file + '.checkpoint.json')
+
+
+def test_restart_when_input_changed(tmp_path):
+    input_file = str(tmp_path / 'posts.csv')
+    output_file = str(tmp_path / 'posts_translated.csv')
+    write_posts(input_file, POSTS)
+    interrupted_run(input_file, output_file)
+
+    # 최신 글이 앞에 오는 export라 새 글이 생기면 행이 밀림
+    write_posts(input_file, [('6', '제목 6', '본문 6')] + POSTS)
+    translator = FakeTranslator()
+    translated, _ = translate_file(input_file, output_file, 'utf-8-sig', translator, chunk_size=2)
+
+    assert translated == 6
+    out = read_output(output_file)
+    assert out['id'].tolist() == ['6', '1', '2', '3', '4', '5']
+    assert out['Eng_Contents'].tolist() == [f'EN 본문 {i}' for i in (6, 1, 2, 3, 4, 5)]